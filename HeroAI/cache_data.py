@@ -1,12 +1,90 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from .constants import SHARED_MEMORY_FILE_NAME, STAY_ALERT_TIME, MAX_NUM_PLAYERS, NUMBER_OF_SKILLS
 from .globals import HeroAI_varsClass, HeroAI_Window_varsClass
 from .combat import CombatClass
 from Py4GWCoreLib import GLOBAL_CACHE
 from Py4GWCoreLib import Timer, ThrottledTimer
-from Py4GWCoreLib import Range, Utils, ConsoleLog
-from Py4GWCoreLib import AgentArray, Weapon
+from Py4GWCoreLib import Range, ConsoleLog
+from Py4GWCoreLib import Weapon, Attribute
+
+# model states and weapon types behind the AgentCache predicates, read here from an already fetched agent
+MODEL_STATES_CASTING = (65, 581)
+MODEL_STATES_ATTACKING = (96, 1088, 1120)
+MODEL_STATES_MOVING = (12, 76, 204)
+MODEL_STATE_KNOCKED_DOWN = 1104
+MELEE_WEAPON_TYPES = ("Axe", "Hammer", "Daggers", "Scythe", "Sword")
+
+
+def IsLivingAgentAlive(living_agent) -> bool:
+    """Same test as GLOBAL_CACHE.Agent.IsAlive, on the living agent of a fetched PyAgent."""
+    is_dead = (living_agent.effects & 0x0010) != 0 or (living_agent.type_map & 0x000008) != 0
+    return not is_dead and living_agent.hp > 0.0
+
+
+@dataclass(slots=True)
+class AgentState:
+    """
+    Per-tick copy of the agent fields HeroAI reads, taken from a single PyAgent fetch instead of
+    one GLOBAL_CACHE.Agent call (and RawAgentArray throttle check) per field.
+    """
+    agent_id: int = 0
+    xy: tuple = (0.0, 0.0)
+    xyz: tuple = (0.0, 0.0, 0.0)
+    rotation_angle: float = 0.0
+    login_number: int = 0
+    energy: float = 0.0
+    max_energy: int = 0
+    energy_regen: float = 0.0
+    hp: float = 0.0
+    overcast: float = 0.0
+    is_alive: bool = True
+    is_casting: bool = False
+    casting_skill: int = 0
+    is_knocked_down: bool = False
+    is_attacking: bool = False
+    is_moving: bool = False
+    is_melee: bool = False
+    weapon_type: int = 0
+    attribute_levels: dict[int, int] = field(default_factory=dict)  # attribute id -> level
+
+    def CapturePosition(self, agent):
+        self.agent_id = agent.id
+        self.xy = (agent.x, agent.y)
+        self.xyz = (agent.x, agent.y, agent.z)
+        self.rotation_angle = agent.rotation_angle
+
+    def Capture(self, agent):
+        self.CapturePosition(agent)
+        living_agent = agent.living_agent
+        model_state = living_agent.model_state
+        self.login_number = living_agent.login_number
+        self.energy = living_agent.energy
+        self.max_energy = living_agent.max_energy
+        self.energy_regen = living_agent.energy_regen
+        self.hp = living_agent.hp
+        self.overcast = living_agent.overcast
+        self.is_alive = IsLivingAgentAlive(living_agent)
+        self.is_casting = model_state in MODEL_STATES_CASTING
+        self.casting_skill = living_agent.casting_skill_id
+        self.is_knocked_down = model_state == MODEL_STATE_KNOCKED_DOWN
+        self.is_attacking = model_state in MODEL_STATES_ATTACKING
+        self.is_moving = model_state in MODEL_STATES_MOVING
+        weapon_type = living_agent.weapon_type
+        self.weapon_type = weapon_type.ToInt()
+        self.is_melee = weapon_type.GetName() in MELEE_WEAPON_TYPES
+
+        levels = self.attribute_levels
+        levels.clear()
+        for attribute in agent.attributes:
+            levels[int(attribute.attribute_id)] = attribute.level
+
+    def HasAttribute(self, attribute: Attribute) -> bool:
+        return attribute.value in self.attribute_levels
+
+    def GetAttributeLevel(self, attribute: Attribute, default: int = 0) -> int:
+        return self.attribute_levels.get(attribute.value, default)
+
 
 @dataclass
 class GameData:
@@ -21,6 +99,8 @@ class GameData:
         
         self.angle_changed = False
         self.old_angle = 0.0
+        self.player = AgentState()
+        self.party_leader = AgentState()
       
         
     def reset(self):
@@ -79,6 +159,7 @@ class GameData:
         
         #combat field data
         self.in_aggro = False
+        self.aggro = None  # AggroBands of the last InAggro check: enemy counts per Range band
         self.free_slots_in_inventory = 0
         self.target_id = 0
         self.target_is_alive =  False
@@ -111,7 +192,9 @@ class GameData:
             return
         self.party_leader_id = GLOBAL_CACHE.Party.GetPartyLeaderID()
         
-        self.party_leader_rotation_angle = GLOBAL_CACHE.Agent.GetRotationAngle(self.party_leader_id)
+        leader = self.party_leader
+        leader.CapturePosition(GLOBAL_CACHE.Agent.GetAgentByID(self.party_leader_id))
+        self.party_leader_rotation_angle = leader.rotation_angle
 
         if self.old_angle != self.party_leader_rotation_angle:
             self.angle_changed = True
@@ -119,8 +202,8 @@ class GameData:
         #never reset, so if it changed once, it will be true until the move is issued
 
         
-        self.party_leader_xy = GLOBAL_CACHE.Agent.GetXY(self.party_leader_id)
-        self.party_leader_xyz = GLOBAL_CACHE.Agent.GetXYZ(self.party_leader_id)
+        self.party_leader_xy = leader.xy
+        self.party_leader_xyz = leader.xyz
         self.own_party_number = GLOBAL_CACHE.Party.GetOwnPartyNumber()
         self.heroes = GLOBAL_CACHE.Party.GetHeroes()
         self.party_size = GLOBAL_CACHE.Party.GetPartySize()
@@ -129,45 +212,38 @@ class GameData:
         self.party_henchman_count = GLOBAL_CACHE.Party.GetHenchmanCount()
         #Player data
         self.player_agent_id = GLOBAL_CACHE.Player.GetAgentID()
-        self.player_login_number = GLOBAL_CACHE.Agent.GetLoginNumber(self.player_agent_id)
-        self.player_energy_regen = GLOBAL_CACHE.Agent.GetEnergyRegen(self.player_agent_id)
-        self.player_max_energy = GLOBAL_CACHE.Agent.GetMaxEnergy(self.player_agent_id)
-        self.player_energy = GLOBAL_CACHE.Agent.GetEnergy(self.player_agent_id)
-        self.player_xy = GLOBAL_CACHE.Agent.GetXY(self.player_agent_id)
-        self.player_xyz = GLOBAL_CACHE.Agent.GetXYZ(self.player_agent_id)
-        self.player_is_casting = GLOBAL_CACHE.Agent.IsCasting(self.player_agent_id)
-        self.player_casting_skill = GLOBAL_CACHE.Agent.GetCastingSkill(self.player_agent_id)
+        player = self.player
+        player.Capture(GLOBAL_CACHE.Agent.GetAgentByID(self.player_agent_id))
+        self.player_login_number = player.login_number
+        self.player_energy_regen = player.energy_regen
+        self.player_max_energy = player.max_energy
+        self.player_energy = player.energy
+        self.player_xy = player.xy
+        self.player_xyz = player.xyz
+        self.player_is_casting = player.is_casting
+        self.player_casting_skill = player.casting_skill
         self.player_skillbar_casting = GLOBAL_CACHE.SkillBar.GetCasting()
-        self.player_hp = GLOBAL_CACHE.Agent.GetHealth(self.player_agent_id)
-        self.player_is_alive = GLOBAL_CACHE.Agent.IsAlive(self.player_agent_id)
-        self.player_overcast = GLOBAL_CACHE.Agent.GetOvercast(self.player_agent_id)
-        self.player_is_knocked_down = GLOBAL_CACHE.Agent.IsKnockedDown(self.player_agent_id)
-        self.player_is_attacking = GLOBAL_CACHE.Agent.IsAttacking(self.player_agent_id)
-        self.player_is_moving = GLOBAL_CACHE.Agent.IsMoving(self.player_agent_id)
-        self.player_is_melee = GLOBAL_CACHE.Agent.IsMelee(self.player_agent_id)
-        self.weapon_type, _ = GLOBAL_CACHE.Agent.GetWeaponType(self.player_agent_id)
+        self.player_hp = player.hp
+        self.player_is_alive = player.is_alive
+        self.player_overcast = player.overcast
+        self.player_is_knocked_down = player.is_knocked_down
+        self.player_is_attacking = player.is_attacking
+        self.player_is_moving = player.is_moving
+        self.player_is_melee = player.is_melee
+        self.weapon_type = player.weapon_type
         
-        attributes = GLOBAL_CACHE.Agent.GetAttributes(self.player_agent_id)
-        self.fast_casting_exists = False
-        self.fast_casting_level = 0
-        self.expertise_exists = False
-        self.expertise_level = 0
         #check for attributes
-        for attribute in attributes:
-            if attribute.GetName() == "Fast Casting":
-                self.fast_casting_exists = True
-                self.fast_casting_level = attribute.level
-                
-            if attribute.GetName() == "Expertise":
-                self.expertise_exists = True
-                self.expertise_level = attribute.level
+        self.fast_casting_exists = player.HasAttribute(Attribute.FastCasting)
+        self.fast_casting_level = player.GetAttributeLevel(Attribute.FastCasting)
+        self.expertise_exists = player.HasAttribute(Attribute.Expertise)
+        self.expertise_level = player.GetAttributeLevel(Attribute.Expertise)
             
         #AgentArray data
         self.pet_id = GLOBAL_CACHE.Party.Pets.GetPetID(self.player_agent_id)
         #combat field data
         self.free_slots_in_inventory = GLOBAL_CACHE.Inventory.GetFreeSlotCount()
         self.target_id = GLOBAL_CACHE.Player.GetTargetID()
-        self.target_is_alive = GLOBAL_CACHE.Agent.IsAlive(self.target_id)
+        self.target_is_alive = IsLivingAgentAlive(GLOBAL_CACHE.Agent.GetAgentByID(self.target_id).living_agent)
 
         
     
@@ -263,15 +339,10 @@ class CacheData:
     def reset(self):
         self.data.reset()   
         
-    def InAggro(self, enemy_array, aggro_range = Range.Earshot.value):
-        distance = aggro_range
-        enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: Utils.Distance(GLOBAL_CACHE.Player.GetXY(), GLOBAL_CACHE.Agent.GetXY(agent_id)) <= distance)
-        enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsAlive(agent_id))
-        enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Player.GetAgentID() != agent_id)
-        enemy_array = AgentArray.Sort.ByDistance(enemy_array, GLOBAL_CACHE.Player.GetXY())
-        if len(enemy_array) > 0:
-            return True
-        return False
+    def InAggro(self, aggro_range = Range.Earshot.value):
+        # one pass over the spatial index per tick, shared with SkillManager and Routines.Checks.Agents.InDanger
+        self.data.aggro = GLOBAL_CACHE.AgentArray.Aggro(GLOBAL_CACHE.Player.GetAgentID())
+        return self.data.aggro.Any(aggro_range)
         
     def UpdateGameOptions(self):
         #control status vars
@@ -307,9 +378,9 @@ class CacheData:
                 self.data.update()
                 
                 if self.stay_alert_timer.HasElapsed(STAY_ALERT_TIME):
-                    self.data.in_aggro = self.InAggro(GLOBAL_CACHE.AgentArray.GetEnemyArray(), Range.Earshot.value)
+                    self.data.in_aggro = self.InAggro(Range.Earshot.value)
                 else:
-                    self.data.in_aggro = self.InAggro(GLOBAL_CACHE.AgentArray.GetEnemyArray(), Range.Spellcast.value)
+                    self.data.in_aggro = self.InAggro(Range.Spellcast.value)
                     
                 if self.data.in_aggro:
                     self.stay_alert_timer.Reset()
@@ -0,0 +1,319 @@
+from Py4GWCoreLib import GLOBAL_CACHE, Routines, Range, AgentArray
+from .targeting import GetAllAlliesArray
+from .types import SkillNature, SkillType
+from .constants import MAX_NUM_PLAYERS
+
+# === Target feature bits ===
+FEATURE_ALIVE = 1 << 0
+FEATURE_DEAD = 1 << 1
+FEATURE_CONDITIONED = 1 << 2
+FEATURE_BLEEDING = 1 << 3
+FEATURE_BLIND = 1 << 4
+FEATURE_BURNING = 1 << 5
+FEATURE_CRACKED_ARMOR = 1 << 6
+FEATURE_CRIPPLED = 1 << 7
+FEATURE_DAZED = 1 << 8
+FEATURE_DEEP_WOUND = 1 << 9
+FEATURE_DISEASE = 1 << 10
+FEATURE_POISONED = 1 << 11
+FEATURE_WEAKNESS = 1 << 12
+FEATURE_ANY_CONDITION = 1 << 13       # derived from the condition bits above
+FEATURE_WEAPON_SPELLED = 1 << 14
+FEATURE_ENCHANTED = 1 << 15
+FEATURE_HEXED = 1 << 16
+FEATURE_CASTING = 1 << 17
+FEATURE_KNOCKED_DOWN = 1 << 18
+FEATURE_MOVING = 1 << 19
+FEATURE_ATTACKING = 1 << 20
+FEATURE_HOLDING_ITEM = 1 << 21
+FEATURE_PARTY_MEMBER = 1 << 22
+FEATURE_IS_PLAYER = 1 << 23
+
+CONDITION_FEATURES = (FEATURE_CONDITIONED | FEATURE_BLEEDING | FEATURE_BLIND | FEATURE_BURNING |
+                      FEATURE_CRACKED_ARMOR | FEATURE_CRIPPLED | FEATURE_DAZED | FEATURE_DEEP_WOUND |
+                      FEATURE_DISEASE | FEATURE_POISONED | FEATURE_WEAKNESS)
+
+# (bit, fetch(combat, agent_id)) - each one is read at most once per target per frame
+_FEATURE_FETCHERS = (
+    (FEATURE_ALIVE, lambda combat, agent_id: GLOBAL_CACHE.Agent.IsAlive(agent_id)),
+    (FEATURE_DEAD, lambda combat, agent_id: GLOBAL_CACHE.Agent.IsDead(agent_id)),
+    (FEATURE_CONDITIONED, lambda combat, agent_id: GLOBAL_CACHE.Agent.IsConditioned(agent_id)),
+    (FEATURE_BLEEDING, lambda combat, agent_id: GLOBAL_CACHE.Agent.IsBleeding(agent_id)),
+    (FEATURE_BLIND, lambda combat, agent_id: combat.HasEffect(agent_id, combat.blind)),
+    (FEATURE_BURNING, lambda combat, agent_id: combat.HasEffect(agent_id, combat.burning)),
+    (FEATURE_CRACKED_ARMOR, lambda combat, agent_id: combat.HasEffect(agent_id, combat.cracked_armor)),
+    (FEATURE_CRIPPLED, lambda combat, agent_id: GLOBAL_CACHE.Agent.IsCrippled(agent_id)),
+    (FEATURE_DAZED, lambda combat, agent_id: combat.HasEffect(agent_id, combat.dazed)),
+    (FEATURE_DEEP_WOUND, lambda combat, agent_id: combat.HasEffect(agent_id, combat.deep_wound)),
+    (FEATURE_DISEASE, lambda combat, agent_id: combat.HasEffect(agent_id, combat.disease)),
+    (FEATURE_POISONED, lambda combat, agent_id: GLOBAL_CACHE.Agent.IsPoisoned(agent_id)),
+    (FEATURE_WEAKNESS, lambda combat, agent_id: combat.HasEffect(agent_id, combat.weakness)),
+    (FEATURE_WEAPON_SPELLED, lambda combat, agent_id: GLOBAL_CACHE.Agent.IsWeaponSpelled(agent_id)),
+    (FEATURE_ENCHANTED, lambda combat, agent_id: GLOBAL_CACHE.Agent.IsEnchanted(agent_id)),
+    (FEATURE_HEXED, lambda combat, agent_id: GLOBAL_CACHE.Agent.IsHexed(agent_id)),
+    (FEATURE_CASTING, lambda combat, agent_id: GLOBAL_CACHE.Agent.IsCasting(agent_id)),
+    (FEATURE_KNOCKED_DOWN, lambda combat, agent_id: GLOBAL_CACHE.Agent.IsKnockedDown(agent_id)),
+    (FEATURE_MOVING, lambda combat, agent_id: GLOBAL_CACHE.Agent.IsMoving(agent_id)),
+    (FEATURE_ATTACKING, lambda combat, agent_id: GLOBAL_CACHE.Agent.IsAttacking(agent_id)),
+    (FEATURE_HOLDING_ITEM, lambda combat, agent_id: GLOBAL_CACHE.Agent.GetWeaponType(agent_id)[0] == 0),
+    (FEATURE_PARTY_MEMBER, lambda combat, agent_id: combat.IsPartyMember(agent_id)),
+    (FEATURE_IS_PLAYER, lambda combat, agent_id: GLOBAL_CACHE.Player.GetAgentID() == agent_id),
+)
+
+
+class TargetFeatures:
+    """
+    Feature vector of one agent for the current frame.
+    Bits are fetched on first use and then answered from the mask, so every skill
+    evaluated against the same target shares the same game reads.
+    """
+    __slots__ = ("agent_id", "mask", "known", "_health")
+
+    def __init__(self, agent_id: int):
+        self.agent_id = agent_id
+        self.mask = 0
+        self.known = 0
+        self._health = None
+
+    def Fetch(self, combat, bits: int) -> int:
+        """Make sure the requested bits are known and return the feature mask."""
+        missing = bits & ~self.known
+        if missing:
+            if missing & FEATURE_ANY_CONDITION:
+                missing |= CONDITION_FEATURES & ~self.known
+            for bit, fetch in _FEATURE_FETCHERS:
+                if missing & bit and fetch(combat, self.agent_id):
+                    self.mask |= bit
+            if missing & FEATURE_ANY_CONDITION and self.mask & CONDITION_FEATURES:
+                self.mask |= FEATURE_ANY_CONDITION
+            self.known |= missing
+        return self.mask
+
+    def Has(self, combat, bits: int) -> bool:
+        return self.Fetch(combat, bits) & bits == bits
+
+    def HasAny(self, combat, bits: int) -> bool:
+        return self.Fetch(combat, bits) & bits != 0
+
+    def Health(self) -> float:
+        if self._health is None:
+            self._health = GLOBAL_CACHE.Agent.GetHealth(self.agent_id)
+        return self._health
+
+
+def GetReportedEnergy(combat, agent_id: int):
+    """Energy reported through shared memory, None for agents that do not report it."""
+    for i in range(MAX_NUM_PLAYERS):
+        player_data = combat.shared_memory_handler.get_player(i)
+        if player_data and player_data["IsActive"] and player_data["PlayerID"] == agent_id:
+            return player_data["Energy"]
+    return None
+
+
+_pet_attack_skills = None
+
+def _GetPetAttackSkills() -> frozenset:
+    global _pet_attack_skills
+    if _pet_attack_skills is None:
+        _pet_attack_skills = frozenset(GLOBAL_CACHE.Skill.GetID(name) for name in (
+            "Bestial_Mauling", "Bestial_Pounce", "Brutal_Strike", "Disrupting_Lunge", "Enraged_Lunge",
+            "Feral_Lunge", "Ferocious_Strike", "Maiming_Strike", "Melandrus_Assault", "Poisonous_Bite",
+            "Pounce", "Predators_Pounce", "Savage_Pounce", "Scavenger_Strike"))
+    return _pet_attack_skills
+
+
+class CompiledCastConditions:
+    """
+    CastConditions of one skill reduced to what actually has to be checked:
+    a mask of target feature bits that must all be set, followed by residual checks
+    (thresholds, skill lists, area scans) in roughly increasing cost.
+    """
+    __slots__ = ("skill_id", "required", "checks", "unique", "resurrection")
+
+    def __init__(self, skill_id: int):
+        self.skill_id = skill_id
+        self.required = 0
+        self.checks = []        # [check(combat, features) -> bool]
+        self.unique = None      # check(combat, features) replacing everything else
+        self.resurrection = False
+
+    def Evaluate(self, combat, features: TargetFeatures) -> bool:
+        if self.resurrection:
+            return features.Has(combat, FEATURE_DEAD)
+        if self.unique is not None:
+            return self.unique(combat, features)
+        required = self.required
+        if required and features.Fetch(combat, required) & required != required:
+            return False
+        for check in self.checks:
+            if not check(combat, features):
+                return False
+        return True
+
+
+def CompileCastConditions(skill_id: int, custom_skill_data, unique_rules: dict) -> CompiledCastConditions:
+    """
+    Purpose: Compile the CastConditions of a skill into a CompiledCastConditions.
+    Args:
+        skill_id (int): The skill id.
+        custom_skill_data (CustomSkill): The custom skill definition of the skill.
+        unique_rules (dict): skill_id -> check(combat, features, conditions) for UniqueProperty skills.
+    Returns: CompiledCastConditions
+    """
+    compiled = CompiledCastConditions(skill_id)
+    conditions = custom_skill_data.Conditions
+
+    if custom_skill_data.Nature == SkillNature.Resurrection.value:
+        compiled.resurrection = True
+        return compiled
+
+    if conditions.UniqueProperty:
+        rule = unique_rules.get(skill_id)
+        compiled.unique = (lambda combat, features: rule(combat, features, conditions)) if rule else (lambda combat, features: True)
+        return compiled
+
+    required = 0
+    checks = []
+
+    for enabled, bit in (
+        (conditions.IsAlive, FEATURE_ALIVE),
+        (conditions.HasCondition, FEATURE_ANY_CONDITION),
+        (conditions.HasBleeding, FEATURE_BLEEDING),
+        (conditions.HasBlindness, FEATURE_BLIND),
+        (conditions.HasBurning, FEATURE_BURNING),
+        (conditions.HasCrackedArmor, FEATURE_CRACKED_ARMOR),
+        (conditions.HasCrippled, FEATURE_CRIPPLED),
+        (conditions.HasDazed, FEATURE_DAZED),
+        (conditions.HasDeepWound, FEATURE_DEEP_WOUND),
+        (conditions.HasDisease, FEATURE_DISEASE),
+        (conditions.HasPoison, FEATURE_POISONED),
+        (conditions.HasWeakness, FEATURE_WEAKNESS),
+        (conditions.HasWeaponSpell, FEATURE_WEAPON_SPELLED),
+        (conditions.HasEnchantment, FEATURE_ENCHANTED),
+        (conditions.HasDervishEnchantment, FEATURE_IS_PLAYER),
+        (conditions.HasHex, FEATURE_HEXED),
+        (conditions.HasChant, FEATURE_PARTY_MEMBER),
+        (conditions.IsCasting, FEATURE_CASTING),
+        (conditions.IsKnockedDown, FEATURE_KNOCKED_DOWN),
+        (conditions.IsMoving, FEATURE_MOVING),
+        (conditions.IsAttacking, FEATURE_ATTACKING),
+        (conditions.IsHoldingItem, FEATURE_HOLDING_ITEM),
+        (conditions.Overcast > 0, FEATURE_IS_PLAYER),
+    ):
+        if enabled:
+            required |= bit
+
+    # === Skill lists ===
+    if conditions.HasWeaponSpell and len(conditions.WeaponSpellList) > 0:
+        weapon_spells = tuple(conditions.WeaponSpellList)
+        checks.append(lambda combat, features: any(combat.HasEffect(features.agent_id, effect_id, exact_weapon_spell=True) for effect_id in weapon_spells))
+
+    if conditions.HasEnchantment and len(conditions.EnchantmentList) > 0:
+        enchantments = tuple(conditions.EnchantmentList)
+        checks.append(lambda combat, features: any(combat.HasEffect(features.agent_id, effect_id) for effect_id in enchantments))
+
+    if conditions.HasHex and len(conditions.HexList) > 0:
+        hexes = tuple(conditions.HexList)
+        checks.append(lambda combat, features: any(combat.HasEffect(features.agent_id, effect_id) for effect_id in hexes))
+
+    if conditions.IsCasting:
+        casting_skills = frozenset(conditions.CastingSkillList)
+        def casting_check(combat, features):
+            casting_skill_id = GLOBAL_CACHE.Agent.GetCastingSkill(features.agent_id)
+            if GLOBAL_CACHE.Skill.Data.GetActivation(casting_skill_id) < 0.250:
+                return False
+            return not casting_skills or casting_skill_id in casting_skills
+        checks.append(casting_check)
+
+    # === Thresholds ===
+    if conditions.LessLife > 0:
+        less_life = conditions.LessLife
+        checks.append(lambda combat, features: features.Health() < less_life)
+
+    if conditions.MoreLife > 0:
+        more_life = conditions.MoreLife
+        checks.append(lambda combat, features: features.Health() > more_life)
+
+    if conditions.LessEnergy > 0:
+        less_energy = conditions.LessEnergy
+        def energy_check(combat, features):
+            if not features.Has(combat, FEATURE_PARTY_MEMBER):
+                return True  # henchmen, allies, pets or something else thats not reporting energy
+            energy = GetReportedEnergy(combat, features.agent_id)
+            return energy is not None and energy < less_energy
+        checks.append(energy_check)
+
+    if conditions.Overcast > 0:
+        overcast = conditions.Overcast
+        checks.append(lambda combat, features: GLOBAL_CACHE.Agent.GetOvercast(features.agent_id) < overcast)
+
+    # === Buff scans ===
+    if conditions.HasDervishEnchantment:
+        def dervish_enchantment_check(combat, features):
+            for buff in combat.shared_memory_handler.get_agent_buffs(features.agent_id):
+                skill_type, _ = GLOBAL_CACHE.Skill.GetType(buff)
+                if skill_type == SkillType.Enchantment.value:
+                    _, profession = GLOBAL_CACHE.Skill.GetProfession(buff)
+                    if profession == "Dervish":
+                        return True
+            return False
+        checks.append(dervish_enchantment_check)
+
+    if conditions.HasChant:
+        chants = frozenset(conditions.ChantList)
+        def chant_check(combat, features):
+            for buff in combat.shared_memory_handler.get_agent_buffs(features.agent_id):
+                skill_type, _ = GLOBAL_CACHE.Skill.GetType(buff)
+                if skill_type == SkillType.Chant.value and (not chants or buff in chants):
+                    return True
+            return False
+        checks.append(chant_check)
+
+    # === Area checks, independent of the target ===
+    if conditions.IsPartyWide:
+        area = Range.SafeCompass.value if conditions.PartyWideArea == 0 else conditions.PartyWideArea
+        party_less_life = conditions.LessLife
+        def party_wide_check(combat, features):
+            allies_array = GetAllAlliesArray(area)
+            if len(allies_array) == 0:
+                return False
+            total_group_life = 0.0
+            for agent in allies_array:
+                total_group_life += GLOBAL_CACHE.Agent.GetHealth(agent)
+            return total_group_life / len(allies_array) < party_less_life
+        checks.append(party_wide_check)
+
+    if conditions.RequiresSpiritInEarshot:
+        def spirit_check(combat, features):
+            spirit_array = GLOBAL_CACHE.AgentArray.GetSpiritPetArray()
+            spirit_array = AgentArray.Filter.ByDistance(spirit_array, GLOBAL_CACHE.Player.GetXY(), Range.Earshot.value)
+            spirit_array = AgentArray.Filter.ByCondition(spirit_array, lambda agent_id: GLOBAL_CACHE.Agent.IsAlive(agent_id))
+            return len(spirit_array) > 0
+        checks.append(spirit_check)
+
+    if custom_skill_data.SkillType == SkillType.PetAttack.value:
+        is_pet_attack = skill_id in _GetPetAttackSkills()
+        def pet_check(combat, features):
+            pet_id = GLOBAL_CACHE.Party.Pets.GetPetID(GLOBAL_CACHE.Player.GetAgentID())
+            if GLOBAL_CACHE.Agent.IsDead(pet_id):
+                return False
+            return not (is_pet_attack and combat.HasEffect(pet_id, skill_id))
+        checks.append(pet_check)
+
+    if conditions.EnemiesInRange != 0:
+        enemies_in_range, enemies_area = conditions.EnemiesInRange, conditions.EnemiesInRangeArea
+        def enemies_check(combat, features):
+            player_pos = GLOBAL_CACHE.Player.GetXY()
+            return len(Routines.Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], enemies_area)) >= enemies_in_range
+        checks.append(enemies_check)
+
+    if conditions.AlliesInRange != 0:
+        allies_in_range, allies_area = conditions.AlliesInRange, conditions.AlliesInRangeArea
+        def allies_check(combat, features):
+            player_pos = GLOBAL_CACHE.Player.GetXY()
+            return len(Routines.Agents.GetFilteredAllyArray(player_pos[0], player_pos[1], allies_area, other_ally=True)) >= allies_in_range
+        checks.append(allies_check)
+
+    compiled.required = required
+    compiled.checks = checks
+    return compiled
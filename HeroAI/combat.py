@@ -5,6 +5,10 @@ from .custom_skill import CustomSkillClass
 from .targeting import TargetLowestAlly, TargetLowestAllyEnergy, TargetClusteredEnemy, TargetLowestAllyCaster, TargetLowestAllyMartial, TargetLowestAllyMelee, TargetLowestAllyRanged, GetAllAlliesArray
 from .targeting import GetEnemyAttacking, GetEnemyCasting, GetEnemyCastingSpell, GetEnemyInjured, GetEnemyConditioned
 from .targeting import GetEnemyHexed, GetEnemyDegenHexed, GetEnemyEnchanted, GetEnemyMoving, GetEnemyKnockedDown
+from .targeting import TargetingContext, GetNearestEnemy, GetNearestEnemyCaster, GetNearestEnemyMartial, GetNearestEnemyMelee, GetNearestEnemyRanged
+from .skill_priority import SkillPriorityCache
+from .cast_conditions import TargetFeatures, CompiledCastConditions, CompileCastConditions
+from .cast_conditions import FEATURE_BURNING, FEATURE_CASTING, FEATURE_ATTACKING, FEATURE_CONDITIONED, FEATURE_ENCHANTED, FEATURE_HEXED, FEATURE_DEAD
 from .types import SkillNature, Skilltarget, SkillType
 from .constants import MAX_NUM_PLAYERS
 from typing import Optional
@@ -83,6 +87,7 @@ class CombatClass:
         """
         self.skills = []
         self.skill_order = [0] * MAX_SKILLS
+        self.prioritized_order = None  # SkillPriorityCache order the skills were built from
         self.skill_pointer = 0
         self.in_casting_routine = False
         self.aftercast = 0
@@ -156,6 +161,13 @@ class CombatClass:
         self.heal_as_one = GLOBAL_CACHE.Skill.GetID("Heal_as_One")
         self.heroic_refrain = GLOBAL_CACHE.Skill.GetID("Heroic_Refrain")
         
+        # compiled cast conditions, rebuilt only for skills not seen before
+        self.unique_rules = self._BuildUniqueRules()
+        self.compiled_conditions_by_skill = {}
+        self.compiled_conditions_version = CustomSkillClass.data_version  # custom skill data the compiled conditions came from
+        self.compiled_conditions = []
+        self.target_features = {}
+        
     def Update(self, cached_data):
         self.in_aggro = cached_data.in_aggro
         self.is_targeting_enabled = cached_data.is_targeting_enabled
@@ -165,21 +177,39 @@ class CombatClass:
         self.fast_casting_level = cached_data.fast_casting_level
         self.expertise_exists = cached_data.expertise_exists
         self.expertise_level = cached_data.expertise_level
+        self.target_features.clear()  # new frame, target features are read again on demand
+        TargetingContext().Begin()
         
 
     def PrioritizeSkills(self):
         """
         Create a priority-based skill execution order.
+        The order is memoized on the equipped skill ids (SkillPriorityCache); while the bar is unchanged
+        only the skillbar data (recharge, adrenaline) of the slots is read again.
         """
-        #initialize skillbar
-        original_skills = []
-        for i in range(MAX_SKILLS):
-            original_skills.append(self.SkillData(i+1))
+        skill_ids = tuple(GLOBAL_CACHE.SkillBar.GetSkillIDBySlot(i+1) for i in range(MAX_SKILLS))
+        order = SkillPriorityCache().GetOrder("HeroAI", skill_ids, self._OrderSkills)
+        if order is self.prioritized_order:
+            for skill, i in zip(self.skills, order):
+                skill.skillbar_data = GLOBAL_CACHE.SkillBar.GetSkillData(i+1)
+            return
+
+        ordered_skills = [self.SkillData(i+1) for i in order]
+        self.skill_order[:] = order
+        self.prioritized_order = order
+        self.skills = ordered_skills
+        self.compiled_conditions = [self.GetCompiledConditions(skill) for skill in ordered_skills]
+
+    def _OrderSkills(self, skill_ids):
+        """
+        Order the slots of a skillbar by skill nature, skill type and combo.
+        Returns the 0 based slot indices in execution order.
+        """
+        custom_skills = [custom_skill_data_handler.get_skill(skill_id) for skill_id in skill_ids]
 
-        # Initialize the pointer and tracking list
-        ptr = 0
+        # Initialize the tracking lists
         ptr_chk = [False] * MAX_SKILLS
-        ordered_skills = []
+        order = []
         
         priorities = [
             SkillNature.CustomA,
@@ -212,14 +242,10 @@ class CombatClass:
         ]
 
         for priority in priorities:
-            #for i in range(ptr,MAX_SKILLS):
             for i in range(MAX_SKILLS):
-                skill = original_skills[i]
-                if not ptr_chk[i] and skill.custom_skill_data.Nature == priority.value:
-                    self.skill_order[ptr] = i
+                if not ptr_chk[i] and custom_skills[i].Nature == priority.value:
                     ptr_chk[i] = True
-                    ptr += 1
-                    ordered_skills.append(skill)
+                    order.append(i)
         
         skill_types = [
             SkillType.Form,
@@ -243,37 +269,26 @@ class CombatClass:
             SkillType.Attack,
         ]
 
-        
         for skill_type in skill_types:
-            #for i in range(ptr,MAX_SKILLS):
             for i in range(MAX_SKILLS):
-                skill = original_skills[i]
-                if not ptr_chk[i] and skill.custom_skill_data.SkillType == skill_type.value:
-                    self.skill_order[ptr] = i
+                if not ptr_chk[i] and custom_skills[i].SkillType == skill_type.value:
                     ptr_chk[i] = True
-                    ptr += 1
-                    ordered_skills.append(skill)
+                    order.append(i)
 
         combos = [3, 2, 1]  # Dual attack, off-hand attack, lead attack
         for combo in combos:
-            #for i in range(ptr,MAX_SKILLS):
             for i in range(MAX_SKILLS):
-                skill = original_skills[i]
-                if not ptr_chk[i] and GLOBAL_CACHE.Skill.Data.GetCombo(skill.skill_id) == combo:
-                    self.skill_order[ptr] = i
+                if not ptr_chk[i] and GLOBAL_CACHE.Skill.Data.GetCombo(skill_ids[i]) == combo:
                     ptr_chk[i] = True
-                    ptr += 1
-                    ordered_skills.append(skill)
+                    order.append(i)
         
         # Fill in remaining unprioritized skills
         for i in range(MAX_SKILLS):
             if not ptr_chk[i]:
-                self.skill_order[ptr] = i
                 ptr_chk[i] = True
-                ptr += 1
-                ordered_skills.append(original_skills[i])
+                order.append(i)
         
-        self.skills = ordered_skills
+        return order
         
         
     def GetSkills(self):
@@ -382,7 +397,7 @@ class CombatClass:
         target_allegiance = self.skills[slot].custom_skill_data.TargetAllegiance
         
         
-        nearest_enemy = Routines.Agents.GetNearestEnemy(self.get_combat_distance())
+        nearest_enemy = GetNearestEnemy(self.get_combat_distance())
         lowest_ally = TargetLowestAlly(filter_skill_id=self.skills[slot].skill_id)
 
         if self.skills[slot].skill_id == self.heroic_refrain:
@@ -394,15 +409,15 @@ class CombatClass:
             if v_target == 0:
                 v_target = nearest_enemy
         elif target_allegiance == Skilltarget.EnemyCaster:
-            v_target = Routines.Agents.GetNearestEnemyCaster(self.get_combat_distance())
+            v_target = GetNearestEnemyCaster(self.get_combat_distance())
             if v_target == 0 and not targeting_strict:
                 v_target =nearest_enemy
         elif target_allegiance == Skilltarget.EnemyMartial:
-            v_target = Routines.Agents.GetNearestEnemyMartial(self.get_combat_distance())
+            v_target = GetNearestEnemyMartial(self.get_combat_distance())
             if v_target == 0 and not targeting_strict:
                 v_target = nearest_enemy
         elif target_allegiance == Skilltarget.EnemyMartialMelee:
-            v_target = Routines.Agents.GetNearestEnemyMelee(self.get_combat_distance())
+            v_target = GetNearestEnemyMelee(self.get_combat_distance())
             if v_target == 0 and not targeting_strict:
                 v_target = nearest_enemy
         elif target_allegiance == Skilltarget.EnemyClustered:
@@ -450,7 +465,7 @@ class CombatClass:
             if v_target == 0 and not targeting_strict:
                 v_target = nearest_enemy           
         elif target_allegiance == Skilltarget.AllyMartialRanged:
-            v_target = Routines.Agents.GetNearestEnemyRanged(self.get_combat_distance())
+            v_target = GetNearestEnemyRanged(self.get_combat_distance())
             if v_target == 0 and not targeting_strict:
                 v_target = nearest_enemy
         elif target_allegiance == Skilltarget.Ally:
@@ -521,9 +536,7 @@ class CombatClass:
 
         if self.IsPartyMember(agent_id):
             player_buffs = self.shared_memory_handler.get_agent_buffs(agent_id)
-            for buff in player_buffs:                
-                if buff == skill_id or buff in shared_effects:
-                    result = True
+            result = skill_id in player_buffs or not player_buffs.isdisjoint(shared_effects)
         else:
             result = (
                 GLOBAL_CACHE.Effects.BuffExists(agent_id, skill_id) 
@@ -538,386 +551,128 @@ class CombatClass:
         return result
 
 
-    def AreCastConditionsMet(self, slot, vTarget):
-        number_of_features = 0
-        feature_count = 0
+    def GetTargetFeatures(self, agent_id) -> TargetFeatures:
+        """
+        Feature vector of an agent for the current frame, shared by every skill evaluated against it.
+        """
+        features = self.target_features.get(agent_id)
+        if features is None:
+            features = TargetFeatures(agent_id)
+            self.target_features[agent_id] = features
+        return features
+
+    def GetCompiledConditions(self, skill) -> CompiledCastConditions:
+        if self.compiled_conditions_version != CustomSkillClass.data_version:
+            self.compiled_conditions_by_skill.clear()
+            self.compiled_conditions_version = CustomSkillClass.data_version
+        compiled = self.compiled_conditions_by_skill.get(skill.skill_id)
+        if compiled is None:
+            compiled = CompileCastConditions(skill.skill_id, skill.custom_skill_data, self.unique_rules)
+            self.compiled_conditions_by_skill[skill.skill_id] = compiled
+        return compiled
+
+    def _BuildUniqueRules(self):
+        """
+        Cast rules of the UniqueProperty skills, as check(combat, features, conditions).
+        """
+        def player_features(combat):
+            return combat.GetTargetFeatures(GLOBAL_CACHE.Player.GetAgentID())
 
-        Conditions = self.skills[slot].custom_skill_data.Conditions
+        def player_energy_below(combat, conditions):
+            return combat.GetEnergyValues(GLOBAL_CACHE.Player.GetAgentID()) < conditions.LessEnergy
 
-        """ Check if the skill is a resurrection skill and the target is dead """
-        if self.skills[slot].custom_skill_data.Nature == SkillNature.Resurrection.value:
-            return True if GLOBAL_CACHE.Agent.IsDead(vTarget) else False
+        def player_health():
+            return GLOBAL_CACHE.Agent.GetHealth(GLOBAL_CACHE.Player.GetAgentID())
 
+        def energy_only(combat, features, conditions):
+            return player_energy_below(combat, conditions)
 
-        if self.skills[slot].custom_skill_data.Conditions.UniqueProperty:
-            """ check all UniqueProperty skills """
-            if (self.skills[slot].skill_id == self.energy_drain or 
-                self.skills[slot].skill_id == self.energy_tap or
-                self.skills[slot].skill_id == self.ether_lord 
-                ):
-                return self.GetEnergyValues(GLOBAL_CACHE.Player.GetAgentID()) < Conditions.LessEnergy
-        
-            if (self.skills[slot].skill_id == self.essence_strike):
-                energy = self.GetEnergyValues(GLOBAL_CACHE.Player.GetAgentID()) < Conditions.LessEnergy
-                return energy and (Routines.Agents.GetNearestSpirit(Range.Spellcast.value) != 0)
-
-            if (self.skills[slot].skill_id == self.glowing_signet):
-                energy= self.GetEnergyValues(GLOBAL_CACHE.Player.GetAgentID()) < Conditions.LessEnergy
-                return energy and self.HasEffect(vTarget, self.burning)
-
-            if (self.skills[slot].skill_id == self.clamor_of_souls):
-                energy = self.GetEnergyValues(GLOBAL_CACHE.Player.GetAgentID()) < Conditions.LessEnergy
-                weapon_type, _ = GLOBAL_CACHE.Agent.GetWeaponType(GLOBAL_CACHE.Player.GetAgentID())
-                return energy and weapon_type == 0
-
-            if (self.skills[slot].skill_id == self.waste_not_want_not):
-                energy= self.GetEnergyValues(GLOBAL_CACHE.Player.GetAgentID()) < Conditions.LessEnergy
-                return energy and not GLOBAL_CACHE.Agent.IsCasting(vTarget) and not GLOBAL_CACHE.Agent.IsAttacking(vTarget)
-
-            if (self.skills[slot].skill_id == self.mend_body_and_soul):
-                spirits_exist = Routines.Agents.GetNearestSpirit(Range.Earshot.value)
-                life = GLOBAL_CACHE.Agent.GetHealth(GLOBAL_CACHE.Player.GetAgentID()) < Conditions.LessLife
-                return life or (spirits_exist and GLOBAL_CACHE.Agent.IsConditioned(vTarget))
-
-            if (self.skills[slot].skill_id == self.grenths_balance):
-                life = GLOBAL_CACHE.Agent.GetHealth(GLOBAL_CACHE.Player.GetAgentID()) < Conditions.LessLife
-                return life and GLOBAL_CACHE.Agent.GetHealth(GLOBAL_CACHE.Player.GetAgentID()) < GLOBAL_CACHE.Agent.GetHealth(vTarget)
-
-            if (self.skills[slot].skill_id == self.deaths_retreat):
-                return GLOBAL_CACHE.Agent.GetHealth(GLOBAL_CACHE.Player.GetAgentID()) < GLOBAL_CACHE.Agent.GetHealth(vTarget)
-
-            if (self.skills[slot].skill_id == self.plague_sending or
-                self.skills[slot].skill_id == self.plague_signet or
-                self.skills[slot].skill_id == self.plague_touch
-                ):
-                return GLOBAL_CACHE.Agent.IsConditioned(GLOBAL_CACHE.Player.GetAgentID())
-
-            if (self.skills[slot].skill_id == self.golden_fang_strike or
-                self.skills[slot].skill_id == self.golden_fox_strike or
-                self.skills[slot].skill_id == self.golden_lotus_strike or
-                self.skills[slot].skill_id == self.golden_phoenix_strike or
-                self.skills[slot].skill_id == self.golden_skull_strike
-                ):
-                return GLOBAL_CACHE.Agent.IsEnchanted(GLOBAL_CACHE.Player.GetAgentID())
-
-            if (self.skills[slot].skill_id == self.brutal_weapon):
-                return not GLOBAL_CACHE.Agent.IsEnchanted(GLOBAL_CACHE.Player.GetAgentID())
-
-            if (self.skills[slot].skill_id == self.signet_of_removal):
-                return not GLOBAL_CACHE.Agent.IsEnchanted(vTarget) and GLOBAL_CACHE.Agent.IsConditioned(vTarget)
-
-            if (self.skills[slot].skill_id == self.dwaynas_kiss or
-                self.skills[slot].skill_id == self.unnatural_signet or
-                self.skills[slot].skill_id == self.toxic_chill
-                ):
-                return GLOBAL_CACHE.Agent.IsHexed(vTarget) or GLOBAL_CACHE.Agent.IsEnchanted(vTarget)
-
-            if (self.skills[slot].skill_id == self.discord):
-                return (GLOBAL_CACHE.Agent.IsHexed(vTarget) and GLOBAL_CACHE.Agent.IsConditioned(vTarget)) or (GLOBAL_CACHE.Agent.IsEnchanted(vTarget))
-
-            if (self.skills[slot].skill_id == self.empathic_removal or
-                self.skills[slot].skill_id == self.iron_palm or
-                self.skills[slot].skill_id == self.melandrus_resilience or
-                self.skills[slot].skill_id == self.necrosis or
-                self.skills[slot].skill_id == self.peace_and_harmony or
-                self.skills[slot].skill_id == self.purge_signet or
-                self.skills[slot].skill_id == self.resilient_weapon
-                ):
-                return GLOBAL_CACHE.Agent.IsHexed(vTarget) or GLOBAL_CACHE.Agent.IsConditioned(vTarget)
-
-            if (self.skills[slot].skill_id == self.gaze_from_beyond or
-                self.skills[slot].skill_id == self.spirit_burn or
-                self.skills[slot].skill_id == self.signet_of_ghostly_might
-                ):
-                return True if Routines.Agents.GetNearestSpirit(Range.Spellcast.value) != 0 else False
-            
-            if (self.skills[slot].skill_id == self.comfort_animal or
-                self.skills[slot].skill_id == self.heal_as_one
-                ):
-                LessLife = GLOBAL_CACHE.Agent.GetHealth(vTarget) < Conditions.LessLife
-                dead = GLOBAL_CACHE.Agent.IsDead(vTarget)
-                return LessLife or dead
-                
+        def essence_strike(combat, features, conditions):
+            return player_energy_below(combat, conditions) and (Routines.Agents.GetNearestSpirit(Range.Spellcast.value) != 0)
 
-            return True  # if no unique property is configured, return True for all UniqueProperty
-
-        feature_count += (1 if Conditions.IsAlive else 0)
-        feature_count += (1 if Conditions.HasCondition else 0)
-        feature_count += (1 if Conditions.HasBleeding else 0)
-        feature_count += (1 if Conditions.HasBlindness else 0)
-        feature_count += (1 if Conditions.HasBurning else 0)
-        feature_count += (1 if Conditions.HasCrackedArmor else 0)
-        feature_count += (1 if Conditions.HasCrippled else 0)
-        feature_count += (1 if Conditions.HasDazed else 0)
-        feature_count += (1 if Conditions.HasDeepWound else 0)
-        feature_count += (1 if Conditions.HasDisease else 0)
-        feature_count += (1 if Conditions.HasPoison else 0)
-        feature_count += (1 if Conditions.HasWeakness else 0)
-        feature_count += (1 if Conditions.HasWeaponSpell else 0)
-        feature_count += (1 if Conditions.HasEnchantment else 0)
-        feature_count += (1 if Conditions.HasDervishEnchantment else 0)
-        feature_count += (1 if Conditions.HasHex else 0)
-        feature_count += (1 if Conditions.HasChant else 0)
-        feature_count += (1 if Conditions.IsCasting else 0)
-        feature_count += (1 if Conditions.IsKnockedDown else 0)
-        feature_count += (1 if Conditions.IsMoving else 0)
-        feature_count += (1 if Conditions.IsAttacking else 0)
-        feature_count += (1 if Conditions.IsHoldingItem else 0)
-        feature_count += (1 if Conditions.LessLife > 0 else 0)
-        feature_count += (1 if Conditions.MoreLife > 0 else 0)
-        feature_count += (1 if Conditions.LessEnergy > 0 else 0)
-        feature_count += (1 if Conditions.Overcast > 0 else 0)
-        feature_count += (1 if Conditions.IsPartyWide else 0)
-        feature_count += (1 if Conditions.RequiresSpiritInEarshot else 0)
-        feature_count += (1 if Conditions.EnemiesInRange > 0 else 0)
-        feature_count += (1 if Conditions.AlliesInRange > 0 else 0)
-
-        if Conditions.IsAlive:
-            if GLOBAL_CACHE.Agent.IsAlive(vTarget):
-                number_of_features += 1
-
-        is_conditioned = GLOBAL_CACHE.Agent.IsConditioned(vTarget)
-        is_bleeding = GLOBAL_CACHE.Agent.IsBleeding(vTarget)
-        is_blind = self.HasEffect(vTarget, self.blind)
-        is_burning = self.HasEffect(vTarget, self.burning)
-        is_cracked_armor = self.HasEffect(vTarget, self.cracked_armor)
-        is_crippled = GLOBAL_CACHE.Agent.IsCrippled(vTarget)
-        is_dazed = self.HasEffect(vTarget, self.dazed)
-        is_deep_wound = self.HasEffect(vTarget, self.deep_wound)
-        is_disease = self.HasEffect(vTarget, self.disease)
-        is_poison = GLOBAL_CACHE.Agent.IsPoisoned(vTarget)
-        is_weakness = self.HasEffect(vTarget, self.weakness)
-        
-        if Conditions.HasCondition:
-            if (is_conditioned or 
-                is_bleeding or 
-                is_blind or 
-                is_burning or 
-                is_cracked_armor or 
-                is_crippled or 
-                is_dazed or 
-                is_deep_wound or 
-                is_disease or 
-                is_poison or 
-                is_weakness):
-                number_of_features += 1
-
-
-        if Conditions.HasBleeding:
-            if is_bleeding:
-                number_of_features += 1
-
-        if Conditions.HasBlindness:
-            if is_blind:
-                number_of_features += 1
-
-        if Conditions.HasBurning:
-            if is_burning:
-                number_of_features += 1
-
-        if Conditions.HasCrackedArmor:
-            if is_cracked_armor:
-                number_of_features += 1
-          
-        if Conditions.HasCrippled:
-            if is_crippled:
-                number_of_features += 1
-                
-        if Conditions.HasDazed:
-            if is_dazed:
-                number_of_features += 1
-          
-        if Conditions.HasDeepWound:
-            if is_deep_wound:
-                number_of_features += 1
-                
-        if Conditions.HasDisease:
-            if is_disease:
-                number_of_features += 1
+        def glowing_signet(combat, features, conditions):
+            return player_energy_below(combat, conditions) and features.Has(combat, FEATURE_BURNING)
 
-        if Conditions.HasPoison:
-            if is_poison:
-                number_of_features += 1
+        def clamor_of_souls(combat, features, conditions):
+            weapon_type, _ = GLOBAL_CACHE.Agent.GetWeaponType(GLOBAL_CACHE.Player.GetAgentID())
+            return player_energy_below(combat, conditions) and weapon_type == 0
 
-        if Conditions.HasWeakness:
-            if is_weakness:
-                number_of_features += 1
-         
-        if Conditions.HasWeaponSpell:
-            if GLOBAL_CACHE.Agent.IsWeaponSpelled(vTarget):
-                if len(Conditions.WeaponSpellList) == 0:
-                    number_of_features += 1
-                else:
-                    for skill_id in Conditions.WeaponSpellList:
-                        if self.HasEffect(vTarget, skill_id, exact_weapon_spell=True):
-                            number_of_features += 1
-                            break
-
-        if Conditions.HasEnchantment:
-            if GLOBAL_CACHE.Agent.IsEnchanted(vTarget):
-                if len(Conditions.EnchantmentList) == 0:
-                    number_of_features += 1
-                else:
-                    for skill_id in Conditions.EnchantmentList:
-                        if self.HasEffect(vTarget, skill_id):
-                            number_of_features += 1
-                            break
-
-        if Conditions.HasDervishEnchantment:
-            if GLOBAL_CACHE.Player.GetAgentID() == vTarget:
-                buff_list = self.shared_memory_handler.get_agent_buffs(vTarget)
-                for buff in buff_list:
-                    skill_type, _ = GLOBAL_CACHE.Skill.GetType(buff)
-                    if skill_type == SkillType.Enchantment.value:
-                        _, profession = GLOBAL_CACHE.Skill.GetProfession(buff)
-                        if profession == "Dervish":
-                            number_of_features += 1
-                            break
-
-        if Conditions.HasHex:
-            if GLOBAL_CACHE.Agent.IsHexed(vTarget):
-                if len(Conditions.HexList) == 0:
-                    number_of_features += 1
-                else:
-                    for skill_id in Conditions.HexList:
-                        if self.HasEffect(vTarget, skill_id):
-                            number_of_features += 1
-                            break
-
-        if Conditions.HasChant:
-            if self.IsPartyMember(vTarget):
-                buff_list = self.shared_memory_handler.get_agent_buffs(vTarget)
-                for buff in buff_list:
-                    skill_type, _ = GLOBAL_CACHE.Skill.GetType(buff)
-                    if skill_type == SkillType.Chant.value:
-                        if len(Conditions.ChantList) == 0:
-                            number_of_features += 1
-                        else:
-                            if buff in Conditions.ChantList:
-                                number_of_features += 1
-                                break
-                                
-        if Conditions.IsCasting:
-            if GLOBAL_CACHE.Agent.IsCasting(vTarget):
-                casting_skill_id = GLOBAL_CACHE.Agent.GetCastingSkill(vTarget)
-                if GLOBAL_CACHE.Skill.Data.GetActivation(casting_skill_id) >= 0.250:
-                    if len(Conditions.CastingSkillList) == 0:
-                        number_of_features += 1
-                    else:
-                        if casting_skill_id in Conditions.CastingSkillList:
-                            number_of_features += 1
-
-        if Conditions.IsKnockedDown:
-            if GLOBAL_CACHE.Agent.IsKnockedDown(vTarget):
-                number_of_features += 1
-                            
-        if Conditions.IsMoving:
-            if GLOBAL_CACHE.Agent.IsMoving(vTarget):
-                number_of_features += 1
-        
-        if Conditions.IsAttacking:
-            if GLOBAL_CACHE.Agent.IsAttacking(vTarget):
-                number_of_features += 1
-
-        if Conditions.IsHoldingItem:
-            weapon_type, _ = GLOBAL_CACHE.Agent.GetWeaponType(vTarget)
-            if weapon_type == 0:
-                number_of_features += 1
-
-        if Conditions.LessLife != 0:
-            if GLOBAL_CACHE.Agent.GetHealth(vTarget) < Conditions.LessLife:
-                number_of_features += 1
-
-        if Conditions.MoreLife != 0:
-            if GLOBAL_CACHE.Agent.GetHealth(vTarget) > Conditions.MoreLife:
-                number_of_features += 1
-        
-        if Conditions.LessEnergy != 0:
-            if self.IsPartyMember(vTarget):
-                for i in range(MAX_NUM_PLAYERS):
-                    player_data = self.shared_memory_handler.get_player(i)
-                    if player_data and player_data["IsActive"] and player_data["PlayerID"] == vTarget:
-                        if player_data["Energy"] < Conditions.LessEnergy:
-                            number_of_features += 1
-            else:
-                number_of_features += 1 #henchmen, allies, pets or something else thats not reporting energy
+        def waste_not_want_not(combat, features, conditions):
+            return player_energy_below(combat, conditions) and not features.HasAny(combat, FEATURE_CASTING | FEATURE_ATTACKING)
 
-        if Conditions.Overcast != 0:
-            if GLOBAL_CACHE.Player.GetAgentID() == vTarget:
-                if GLOBAL_CACHE.Agent.GetOvercast(vTarget) < Conditions.Overcast:
-                    number_of_features += 1
-                    
-        if Conditions.IsPartyWide:
-            area = Range.SafeCompass.value if Conditions.PartyWideArea == 0 else Conditions.PartyWideArea
-            less_life = Conditions.LessLife
-            
-            allies_array = GetAllAlliesArray(area)
-            total_group_life = 0.0
-            for agent in allies_array:
-                total_group_life += GLOBAL_CACHE.Agent.GetHealth(agent)
-                
-            total_group_life /= len(allies_array)
-            
-            if total_group_life < less_life:
-                number_of_features += 1
-                                    
-        if Conditions.RequiresSpiritInEarshot:            
-            distance = Range.Earshot.value
-            spirit_array = GLOBAL_CACHE.AgentArray.GetSpiritPetArray()
-            spirit_array = AgentArray.Filter.ByDistance(spirit_array, GLOBAL_CACHE.Player.GetXY(), distance)            
-            spirit_array = AgentArray.Filter.ByCondition(spirit_array, lambda agent_id: GLOBAL_CACHE.Agent.IsAlive(agent_id))
-            
-            if(len(spirit_array) > 0):
-                number_of_features += 1
-                    
-        if self.skills[slot].custom_skill_data.SkillType == SkillType.PetAttack.value:
-            pet_id = GLOBAL_CACHE.Party.Pets.GetPetID(GLOBAL_CACHE.Player.GetAgentID())
-            if GLOBAL_CACHE.Agent.IsDead(pet_id):
-                return False
-            
-            pet_attack_list = [GLOBAL_CACHE.Skill.GetID("Bestial_Mauling"),
-                               GLOBAL_CACHE.Skill.GetID("Bestial_Pounce"),
-                               GLOBAL_CACHE.Skill.GetID("Brutal_Strike"),
-                               GLOBAL_CACHE.Skill.GetID("Disrupting_Lunge"),
-                               GLOBAL_CACHE.Skill.GetID("Enraged_Lunge"),
-                               GLOBAL_CACHE.Skill.GetID("Feral_Lunge"),
-                               GLOBAL_CACHE.Skill.GetID("Ferocious_Strike"),
-                               GLOBAL_CACHE.Skill.GetID("Maiming_Strike"),
-                               GLOBAL_CACHE.Skill.GetID("Melandrus_Assault"),
-                               GLOBAL_CACHE.Skill.GetID("Poisonous_Bite"),
-                               GLOBAL_CACHE.Skill.GetID("Pounce"),
-                               GLOBAL_CACHE.Skill.GetID("Predators_Pounce"),
-                               GLOBAL_CACHE.Skill.GetID("Savage_Pounce"),
-                               GLOBAL_CACHE.Skill.GetID("Scavenger_Strike")
-                               ]
-            
-            for skill_id in pet_attack_list:
-                if self.skills[slot].skill_id == skill_id:
-                    if self.HasEffect(pet_id,self.skills[slot].skill_id ):
-                        return False
-            
-        if Conditions.EnemiesInRange != 0:
-            player_pos = GLOBAL_CACHE.Player.GetXY()
-            enemy_array = enemy_array = Routines.Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], Conditions.EnemiesInRangeArea)
-            if len(enemy_array) >= Conditions.EnemiesInRange:
-                number_of_features += 1
-            else:
-                number_of_features = 0
-                
-        if Conditions.AlliesInRange != 0:
-            player_pos = GLOBAL_CACHE.Player.GetXY()
-            ally_array = ally_array = Routines.Agents.GetFilteredAllyArray(player_pos[0], player_pos[1], Conditions.AlliesInRangeArea,other_ally=True)
-            if len(ally_array) >= Conditions.AlliesInRange:
-                number_of_features += 1
-            else:
-                number_of_features = 0
-
-        #Py4GW.Console.Log("AreCastConditionsMet", f"feature count: {feature_count}, No of features {number_of_features}", Py4GW.Console.MessageType.Info)
-        
-        if feature_count == number_of_features:
-            return True
+        def mend_body_and_soul(combat, features, conditions):
+            if player_health() < conditions.LessLife:
+                return True
+            return bool(Routines.Agents.GetNearestSpirit(Range.Earshot.value)) and features.Has(combat, FEATURE_CONDITIONED)
+
+        def grenths_balance(combat, features, conditions):
+            health = player_health()
+            return health < conditions.LessLife and health < features.Health()
+
+        def deaths_retreat(combat, features, conditions):
+            return player_health() < features.Health()
+
+        def player_conditioned(combat, features, conditions):
+            return player_features(combat).Has(combat, FEATURE_CONDITIONED)
+
+        def player_enchanted(combat, features, conditions):
+            return player_features(combat).Has(combat, FEATURE_ENCHANTED)
+
+        def player_not_enchanted(combat, features, conditions):
+            return not player_features(combat).Has(combat, FEATURE_ENCHANTED)
+
+        def signet_of_removal(combat, features, conditions):
+            mask = features.Fetch(combat, FEATURE_ENCHANTED | FEATURE_CONDITIONED)
+            return not mask & FEATURE_ENCHANTED and bool(mask & FEATURE_CONDITIONED)
+
+        def hexed_or_enchanted(combat, features, conditions):
+            return features.HasAny(combat, FEATURE_HEXED | FEATURE_ENCHANTED)
+
+        def discord(combat, features, conditions):
+            return features.Has(combat, FEATURE_HEXED | FEATURE_CONDITIONED) or features.Has(combat, FEATURE_ENCHANTED)
+
+        def hexed_or_conditioned(combat, features, conditions):
+            return features.HasAny(combat, FEATURE_HEXED | FEATURE_CONDITIONED)
+
+        def spirit_nearby(combat, features, conditions):
+            return Routines.Agents.GetNearestSpirit(Range.Spellcast.value) != 0
+
+        def pet_heal(combat, features, conditions):
+            return features.Health() < conditions.LessLife or features.Has(combat, FEATURE_DEAD)
+
+        rules = {}
+        for skill_ids, rule in (
+            ((self.energy_drain, self.energy_tap, self.ether_lord), energy_only),
+            ((self.essence_strike,), essence_strike),
+            ((self.glowing_signet,), glowing_signet),
+            ((self.clamor_of_souls,), clamor_of_souls),
+            ((self.waste_not_want_not,), waste_not_want_not),
+            ((self.mend_body_and_soul,), mend_body_and_soul),
+            ((self.grenths_balance,), grenths_balance),
+            ((self.deaths_retreat,), deaths_retreat),
+            ((self.plague_sending, self.plague_signet, self.plague_touch), player_conditioned),
+            ((self.golden_fang_strike, self.golden_fox_strike, self.golden_lotus_strike,
+              self.golden_phoenix_strike, self.golden_skull_strike), player_enchanted),
+            ((self.brutal_weapon,), player_not_enchanted),
+            ((self.signet_of_removal,), signet_of_removal),
+            ((self.dwaynas_kiss, self.unnatural_signet, self.toxic_chill), hexed_or_enchanted),
+            ((self.discord,), discord),
+            ((self.empathic_removal, self.iron_palm, self.melandrus_resilience, self.necrosis,
+              self.peace_and_harmony, self.purge_signet, self.resilient_weapon), hexed_or_conditioned),
+            ((self.gaze_from_beyond, self.spirit_burn, self.signet_of_ghostly_might), spirit_nearby),
+            ((self.comfort_animal, self.heal_as_one), pet_heal),
+        ):
+            for skill_id in skill_ids:
+                rules.setdefault(skill_id, rule)  # first match wins, as in the original if-chain
+        return rules
 
-        return False
+    def AreCastConditionsMet(self, slot, vTarget):
+        """
+        Evaluate the compiled CastConditions of the skill in slot against the frame's features of vTarget.
+        """
+        if slot >= len(self.compiled_conditions):
+            return False
+        return self.compiled_conditions[slot].Evaluate(self, self.GetTargetFeatures(vTarget))
 
 
     def SpiritBuffExists(self, skill_id):
@@ -394,22 +394,30 @@ class SharedMemoryManager:
             Py4GW.Console.Log(SMM_MODULE_NAME, f"Failed to retrieve buff {buff_index}: {e}", Py4GW.Console.MessageType.Error)
             return None
   
-    def get_agent_buffs(self, agent_id):
-        """Retrieve all buffs for a specific agent."""
+    def get_agent_buffs(self, agent_id) -> frozenset[int]:
+        """
+        Retrieve all buffs for a specific agent.
+        Agents published in the core shared memory are answered from its cached per-slot set,
+        the legacy buff table is only scanned for agents it does not know.
+        """
         try:
+            buff_set = GLOBAL_CACHE.ShMem.GetAgentBuffSet(agent_id)
+            if buff_set is not None:
+                return buff_set
+            
             buff_list = []
+            current_offset = get_base_timestamp()
             for buff_index, buff in enumerate(self.game_struct.PlayerBuffs):
                 if buff.PlayerID == agent_id:
-                    current_offset = get_base_timestamp()
                     if (current_offset - buff.LastUpdated) > SUBSCRIBE_TIMEOUT_SECONDS:
                         self.reset_buff(buff_index)
                     else:
                         buff_list.append(buff.Buff_id)
-            return buff_list
+            return frozenset(buff_list)
         except Exception as e:
             Py4GW.Console.Log(
                 SMM_MODULE_NAME, f"Failed to retrieve buffs for agent {agent_id}: {e}", Py4GW.Console.MessageType.Error)
-            return []
+            return frozenset()
 
     def set_buff(self, buff_data):
         """Set or update a party buff."""
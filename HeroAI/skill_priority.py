@@ -0,0 +1,57 @@
+from .custom_skill import CustomSkillClass
+
+
+class SkillPriorityCache:
+    """
+    Execution order of a skillbar, memoized on the equipped skill ids.
+
+    The order only depends on the custom skill data and the combo of each equipped skill, so it is
+    computed again only when the bar or the custom skill data (CustomSkillClass.data_version) changes.
+    HeroAI combat and SkillManager.Autocombat share the cache; they order with different priority
+    lists, so each one looks up its orders under its own scope.
+    """
+    _instance = None
+    MAX_ENTRIES = 64
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(SkillPriorityCache, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self._initialized = True
+        self._orders: dict[tuple, tuple[int, ...]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def GetOrder(self, scope: str, skill_ids: tuple[int, ...], build) -> tuple[int, ...]:
+        """
+        Purpose: Retrieve the execution order of a skillbar.
+        Args:
+            scope (str): The prioritization the order belongs to.
+            skill_ids (tuple): The equipped skill id of each slot.
+            build (callable): build(skill_ids) -> list of 0 based slot indices, called on a miss.
+        Returns: tuple: The 0 based slot indices in execution order. The same tuple object is returned
+                 until the bar or the custom skill data changes.
+        """
+        key = (scope, skill_ids, CustomSkillClass.data_version)
+        order = self._orders.get(key)
+        if order is not None:
+            self.hits += 1
+            return order
+
+        self.misses += 1
+        order = tuple(build(skill_ids))
+        if len(self._orders) >= self.MAX_ENTRIES:
+            self._orders.clear()
+        self._orders[key] = order
+        return order
+
+    def Clear(self):
+        self._orders.clear()
+
+    def GetStats(self) -> dict:
+        return {"entries": len(self._orders), "hits": self.hits, "misses": self.misses}
@@ -6,118 +6,331 @@ from .constants import (
     MAX_NUM_PLAYERS,
 )
 
+
+class TargetCandidate:
+    """One ally, spirit/pet or enemy of the current targeting tick."""
+    __slots__ = ("agent_id", "distance_sq", "flags", "known", "_health")
+
+    def __init__(self, agent_id: int, distance_sq: float):
+        self.agent_id = agent_id
+        self.distance_sq = distance_sq
+        self.flags = 0
+        self.known = 0
+        self._health = None
+
+
+class TargetingContext:
+    """
+    Per-tick view of the targeting candidates around the player.
+    The ally, spirit/pet and enemy arrays and their distances are read once per tick;
+    every other attribute (alive, hexed, casting, class, health, energy, effects) is read
+    the first time a selector needs it and then shared by every selector of the same tick.
+    A tick starts with Begin() (HeroAI calls it once per frame) or whenever the RawAgentArray
+    refreshed since the view was built. Callers that never call Begin() (SkillManager) share the
+    view of the current RawAgentArray frame: flags and health read once are reused until the array
+    refreshes (its throttle, ~35 ms), so they can be that much older than a direct game read.
+    """
+    _instance = None
+
+    # === Candidate flag bits ===
+    ALIVE = 1 << 0
+    SPAWNED = 1 << 1
+    ATTACKING = 1 << 2
+    CASTING = 1 << 3
+    CASTING_SPELL = 1 << 4
+    CONDITIONED = 1 << 5
+    HEXED = 1 << 6
+    DEGEN_HEXED = 1 << 7
+    ENCHANTED = 1 << 8
+    MOVING = 1 << 9
+    KNOCKED_DOWN = 1 << 10
+    AGGRESSIVE = 1 << 11
+    MARTIAL = 1 << 12
+    CASTER = 1 << 13
+    MELEE = 1 << 14
+    RANGED = 1 << 15
+
+    _FETCHERS = {
+        ALIVE: lambda agent_id: GLOBAL_CACHE.Agent.IsAlive(agent_id),
+        SPAWNED: lambda agent_id: GLOBAL_CACHE.Agent.IsSpawned(agent_id),
+        ATTACKING: lambda agent_id: GLOBAL_CACHE.Agent.IsAttacking(agent_id),
+        CASTING: lambda agent_id: GLOBAL_CACHE.Agent.IsCasting(agent_id),
+        CASTING_SPELL: lambda agent_id: GLOBAL_CACHE.Skill.Flags.IsSpell(GLOBAL_CACHE.Agent.GetCastingSkill(agent_id)),
+        CONDITIONED: lambda agent_id: GLOBAL_CACHE.Agent.IsConditioned(agent_id),
+        HEXED: lambda agent_id: GLOBAL_CACHE.Agent.IsHexed(agent_id),
+        DEGEN_HEXED: lambda agent_id: GLOBAL_CACHE.Agent.IsDegenHexed(agent_id),
+        ENCHANTED: lambda agent_id: GLOBAL_CACHE.Agent.IsEnchanted(agent_id),
+        MOVING: lambda agent_id: GLOBAL_CACHE.Agent.IsMoving(agent_id),
+        KNOCKED_DOWN: lambda agent_id: GLOBAL_CACHE.Agent.IsKnockedDown(agent_id),
+        AGGRESSIVE: lambda agent_id: GLOBAL_CACHE.Agent.IsAggressive(agent_id),
+        MARTIAL: lambda agent_id: GLOBAL_CACHE.Agent.IsMartial(agent_id),
+        CASTER: lambda agent_id: GLOBAL_CACHE.Agent.IsCaster(agent_id),
+        MELEE: lambda agent_id: GLOBAL_CACHE.Agent.IsMelee(agent_id),
+        RANGED: lambda agent_id: GLOBAL_CACHE.Agent.IsRanged(agent_id),
+    }
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(TargetingContext, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self._initialized = True
+        self.frame = -1
+        self.dirty = True
+        self.player_id = 0
+        self.player_xy = (0.0, 0.0)
+        self.allies: list[TargetCandidate] = []
+        self.spirit_pets: list[TargetCandidate] = []
+        self.enemies: list[TargetCandidate] = []
+        self.candidates: dict[int, TargetCandidate] = {}
+        self.effects: dict[tuple[int, int], bool] = {}
+        self.energy: dict[int, float] = {}
+
+        # === Stats ===
+        self.ticks = 0
+        self.builds = 0
+        self.calls = 0          # selector calls this tick
+        self.lookups = 0        # per-agent attribute lookups answered this tick
+        self.reads = 0          # game reads actually made this tick
+        self.last_calls = 0
+        self.last_lookups = 0
+        self.last_reads = 0
+
+    # === Tick ===
+    def Begin(self):
+        """Start a new targeting tick, the view is rebuilt on the next selector call."""
+        self.last_calls, self.last_lookups, self.last_reads = self.calls, self.lookups, self.reads
+        self.calls = self.lookups = self.reads = 0
+        self.ticks += 1
+        self.dirty = True
+
+    def GetStats(self) -> dict:
+        """Counters of the last completed tick; saved_reads are the lookups that did not hit the game."""
+        return {
+            "ticks": self.ticks,
+            "builds": self.builds,
+            "calls": self.last_calls,
+            "lookups": self.last_lookups,
+            "reads": self.last_reads,
+            "saved_reads": max(self.last_lookups - self.last_reads, 0),
+        }
+
+    def _ensure(self):
+        self.calls += 1
+        snapshot = GLOBAL_CACHE.AgentArray.Snapshot()
+        if not self.dirty and snapshot.frame == self.frame:
+            return
+        self._build(snapshot)
+
+    def _build(self, snapshot):
+        self.dirty = False
+        self.frame = snapshot.frame
+        self.builds += 1
+        self.player_id = GLOBAL_CACHE.Player.GetAgentID()
+        self.player_xy = GLOBAL_CACHE.Player.GetXY()
+        self.candidates = {}
+        self.effects = {}
+        self.energy = {}
+        px, py = self.player_xy[0], self.player_xy[1]
+        xs, ys, row_of = snapshot.x, snapshot.y, snapshot.row_of
+
+        def materialize(agent_array):
+            result = []
+            for agent_id in agent_array:
+                if agent_id == 0:
+                    continue
+                row = row_of.get(agent_id)
+                if row is None:
+                    agent_x, agent_y = GLOBAL_CACHE.Agent.GetXY(agent_id)
+                    self.reads += 1
+                else:
+                    agent_x, agent_y = xs[row], ys[row]
+                candidate = TargetCandidate(agent_id, (agent_x - px) ** 2 + (agent_y - py) ** 2)
+                self.candidates.setdefault(agent_id, candidate)
+                result.append(candidate)
+            return result
+
+        self.allies = materialize(GLOBAL_CACHE.AgentArray.GetAllyArray())
+        self.spirit_pets = materialize(GLOBAL_CACHE.AgentArray.GetSpiritPetArray())
+        self.enemies = materialize(GLOBAL_CACHE.AgentArray.GetEnemyArray())
+
+    # === Candidate attributes ===
+    def Has(self, candidate: TargetCandidate, bit: int) -> bool:
+        self.lookups += 1
+        if not candidate.known & bit:
+            self.reads += 1
+            if TargetingContext._FETCHERS[bit](candidate.agent_id):
+                candidate.flags |= bit
+            candidate.known |= bit
+        return bool(candidate.flags & bit)
+
+    def Health(self, candidate: TargetCandidate) -> float:
+        self.lookups += 1
+        if candidate._health is None:
+            self.reads += 1
+            candidate._health = GLOBAL_CACHE.Agent.GetHealth(candidate.agent_id)
+        return candidate._health
+
+    def Energy(self, agent_id: int) -> float:
+        """Energy reported through shared memory, 1.0 for agents that do not report it."""
+        self.lookups += 1
+        energy = self.energy.get(agent_id)
+        if energy is None:
+            import HeroAI.shared_memory_manager as shared_memory_manager
+            shared_memory_handler = shared_memory_manager.SharedMemoryManager()
+            energy = 1.0 #default return full energy to prevent issues
+            for i in range(MAX_NUM_PLAYERS):
+                self.reads += 1
+                player_data = shared_memory_handler.get_player(i)
+                if player_data and player_data["IsActive"] and player_data["PlayerID"] == agent_id:
+                    energy = player_data["Energy"]
+                    break
+            self.energy[agent_id] = energy
+        return energy
+
+    def HasEffect(self, agent_id: int, skill_id: int) -> bool:
+        from .utils import CheckForEffect
+        self.lookups += 1
+        key = (agent_id, skill_id)
+        result = self.effects.get(key)
+        if result is None:
+            self.reads += 1
+            result = CheckForEffect(agent_id, skill_id)
+            self.effects[key] = result
+        return result
+
+    # === Selection helpers ===
+    def _allies_in_range(self, candidates, distance, other_ally=False, filter_skill_id=0, require=0, spirits_only=False):
+        limit = distance * distance
+        result = []
+        for candidate in candidates:
+            if candidate.distance_sq > limit or not self.Has(candidate, TargetingContext.ALIVE):
+                continue
+            if other_ally and candidate.agent_id == self.player_id:
+                continue
+            if filter_skill_id != 0 and self.HasEffect(candidate.agent_id, filter_skill_id):
+                continue
+            if require and not self.Has(candidate, require):
+                continue
+            if spirits_only and self.Has(candidate, TargetingContext.SPAWNED):
+                continue #filter spirits
+            result.append(candidate)
+        return result
+
+    def _enemies_in_range(self, max_distance, aggressive_only=False, require=0, exclude_player=True):
+        limit = max_distance * max_distance
+        result = []
+        for candidate in self.enemies:
+            if candidate.distance_sq > limit or not self.Has(candidate, TargetingContext.ALIVE):
+                continue
+            if exclude_player and candidate.agent_id == self.player_id:
+                continue
+            if aggressive_only and not self.Has(candidate, TargetingContext.AGGRESSIVE):
+                continue
+            if require and not self.Has(candidate, require):
+                continue
+            result.append(candidate)
+        return result
+
+    def _merge(self, candidates, spirit_pets):
+        """Same id order as AgentArray.Manipulation.Merge, so ties resolve like the array helpers."""
+        merged = AgentArray.Manipulation.Merge([c.agent_id for c in candidates], [c.agent_id for c in spirit_pets])
+        return [self.candidates[agent_id] for agent_id in merged]
+
+    def _lowest_health(self, candidates) -> int:
+        best, best_health = 0, 0.0
+        for candidate in candidates:
+            health = self.Health(candidate)
+            if best == 0 or health < best_health:
+                best, best_health = candidate.agent_id, health
+        return best
+
+    @staticmethod
+    def _nearest(candidates) -> int:
+        best = None
+        for candidate in candidates:
+            if best is None or candidate.distance_sq < best.distance_sq:
+                best = candidate
+        return best.agent_id if best is not None else 0
+
+    # === Selectors ===
+    def AllAllies(self, distance=Range.SafeCompass.value) -> list[int]:
+        self._ensure()
+        limit = distance * distance
+        allies = [c for c in self.allies if c.distance_sq <= limit and self.Has(c, TargetingContext.ALIVE)]
+        spirit_pets = [c for c in self.spirit_pets if c.distance_sq <= limit and not self.Has(c, TargetingContext.SPAWNED)]
+        return [c.agent_id for c in self._merge(allies, spirit_pets)]
+
+    def LowestAlly(self, other_ally=False, filter_skill_id=0, require=0, include_spirit_pets=True) -> int:
+        self._ensure()
+        distance = Range.Spellcast.value
+        allies = self._allies_in_range(self.allies, distance, other_ally, filter_skill_id, require)
+        if include_spirit_pets:
+            spirit_pets = self._allies_in_range(self.spirit_pets, distance, other_ally, filter_skill_id, spirits_only=True)
+            allies = self._merge(allies, spirit_pets)
+        return self._lowest_health(allies)
+
+    def LowestAllyEnergy(self, other_ally=False, filter_skill_id=0) -> int:
+        self._ensure()
+        allies = self._allies_in_range(self.allies, Range.Spellcast.value, other_ally, filter_skill_id)
+        best, best_energy = 0, 0.0
+        for candidate in allies:
+            if self.HasEffect(candidate.agent_id, BLOOD_IS_POWER) or self.HasEffect(candidate.agent_id, BLOOD_RITUAL):
+                continue
+            energy = self.Energy(candidate.agent_id)
+            if best == 0 or energy < best_energy:
+                best, best_energy = candidate.agent_id, energy
+        return best
+
+    def NearestEnemy(self, max_distance=4500.0, aggressive_only=False, require=0) -> int:
+        self._ensure()
+        return self._nearest(self._enemies_in_range(max_distance, aggressive_only, require))
+
+    def NearestEnemyCastingSpell(self, max_distance=4500.0, aggressive_only=False) -> int:
+        self._ensure()
+        enemies = [c for c in self._enemies_in_range(max_distance, aggressive_only, TargetingContext.CASTING)
+                   if self.Has(c, TargetingContext.CASTING_SPELL)]
+        return self._nearest(enemies)
+
+    def InjuredEnemy(self, max_distance=4500.0, aggressive_only=False) -> int:
+        self._ensure()
+        return self._lowest_health(self._enemies_in_range(max_distance, aggressive_only))
+
+    def ClusteredEnemy(self, area=4500.0) -> int:
+        self._ensure()
+        enemies = self._enemies_in_range(area, exclude_player=False)
+        return AgentArray.Routines.DetectLargestAgentCluster([c.agent_id for c in enemies], area)
+
+
 def GetAllAlliesArray(distance=Range.SafeCompass.value):
-    ally_array = GLOBAL_CACHE.AgentArray.GetAllyArray()
-    ally_array = AgentArray.Filter.ByDistance(ally_array, GLOBAL_CACHE.Player.GetXY(), distance)
-    ally_array = AgentArray.Filter.ByCondition(ally_array, lambda agent_id: GLOBAL_CACHE.Agent.IsAlive(agent_id))
-    
-    spirit_pet_array = GLOBAL_CACHE.AgentArray.GetSpiritPetArray()
-    spirit_pet_array = AgentArray.Filter.ByDistance(spirit_pet_array, GLOBAL_CACHE.Player.GetXY(), distance)
-    spirit_pet_array = AgentArray.Filter.ByCondition(spirit_pet_array, lambda agent_id: not GLOBAL_CACHE.Agent.IsSpawned(agent_id)) #filter spirits
-    ally_array = AgentArray.Manipulation.Merge(ally_array, spirit_pet_array) #added Pets
-    
-    
-    return ally_array   
-
-def FilterAllyArray(array, distance, other_ally=False, filter_skill_id=0):
-    from .utils import CheckForEffect
-    array = AgentArray.Filter.ByDistance(array, GLOBAL_CACHE.Player.GetXY(), distance)
-    array = AgentArray.Filter.ByCondition(array, lambda agent_id: GLOBAL_CACHE.Agent.IsAlive(agent_id))
-        
-    if other_ally:
-        array = AgentArray.Filter.ByCondition(array, lambda agent_id: GLOBAL_CACHE.Player.GetAgentID() != agent_id)
-    
-    if filter_skill_id != 0:
-        array = AgentArray.Filter.ByCondition(array, lambda agent_id: not CheckForEffect(agent_id, filter_skill_id))
-    
-    return array
+    return TargetingContext().AllAllies(distance)
 
 def TargetLowestAlly(other_ally=False,filter_skill_id=0):
-    distance = Range.Spellcast.value
-    ally_array = GLOBAL_CACHE.AgentArray.GetAllyArray()
-    ally_array = FilterAllyArray(ally_array, distance, other_ally, filter_skill_id) 
-     
-    
-    spirit_pet_array = GLOBAL_CACHE.AgentArray.GetSpiritPetArray()
-    spirit_pet_array = FilterAllyArray(spirit_pet_array, distance, other_ally, filter_skill_id)
-    spirit_pet_array = AgentArray.Filter.ByCondition(spirit_pet_array, lambda agent_id: not GLOBAL_CACHE.Agent.IsSpawned(agent_id)) #filter spirits
-    ally_array = AgentArray.Manipulation.Merge(ally_array, spirit_pet_array) #added Pets
-    
-    ally_array = AgentArray.Sort.ByHealth(ally_array)   
-    return Utils.GetFirstFromArray(ally_array)
+    return TargetingContext().LowestAlly(other_ally, filter_skill_id)
     
 
 def TargetLowestAllyEnergy(other_ally=False, filter_skill_id=0):
-    global BLOOD_IS_POWER, BLOOD_RITUAL
-    from .utils import (CheckForEffect)
-    def GetEnergyValues(agent_id):
-        import HeroAI.shared_memory_manager as shared_memory_manager
-        shared_memory_handler = shared_memory_manager.SharedMemoryManager()
-
-        for i in range(MAX_NUM_PLAYERS):
-            player_data = shared_memory_handler.get_player(i)
-            if player_data and player_data["IsActive"] and player_data["PlayerID"] == agent_id:
-                return player_data["Energy"]
-        return 1.0 #default return full energy to prevent issues
-    
-    distance = Range.Spellcast.value
-    ally_array = GLOBAL_CACHE.AgentArray.GetAllyArray()
-    ally_array = FilterAllyArray(ally_array, distance, other_ally, filter_skill_id)
-    ally_array = AgentArray.Filter.ByCondition(ally_array, lambda agent_id: not CheckForEffect(agent_id, BLOOD_IS_POWER))
-    ally_array = AgentArray.Filter.ByCondition(ally_array, lambda agent_id: not CheckForEffect(agent_id, BLOOD_RITUAL))
-    
-    ally_array = AgentArray.Sort.ByCondition(ally_array, lambda agent_id: GetEnergyValues(agent_id))
-    return Utils.GetFirstFromArray(ally_array)
+    return TargetingContext().LowestAllyEnergy(other_ally, filter_skill_id)
 
 
 def TargetLowestAllyCaster(other_ally=False, filter_skill_id=0):
-    distance = Range.Spellcast.value
-    ally_array = GLOBAL_CACHE.AgentArray.GetAllyArray()
-    ally_array = FilterAllyArray(ally_array, distance, other_ally, filter_skill_id)
-    ally_array = AgentArray.Filter.ByCondition(ally_array, lambda agent_id: GLOBAL_CACHE.Agent.IsCaster(agent_id))
-
-    ally_array = AgentArray.Sort.ByHealth(ally_array)
-    return Utils.GetFirstFromArray(ally_array)
+    return TargetingContext().LowestAlly(other_ally, filter_skill_id, TargetingContext.CASTER, include_spirit_pets=False)
 
 
 def TargetLowestAllyMartial(other_ally=False, filter_skill_id=0):
-    distance = Range.Spellcast.value
-    ally_array = GLOBAL_CACHE.AgentArray.GetAllyArray()
-    ally_array = FilterAllyArray(ally_array, distance, other_ally, filter_skill_id)
-    ally_array = AgentArray.Filter.ByCondition(ally_array, lambda agent_id: GLOBAL_CACHE.Agent.IsMartial(agent_id))
-    
-    spirit_pet_array = GLOBAL_CACHE.AgentArray.GetSpiritPetArray()
-    spirit_pet_array = FilterAllyArray(spirit_pet_array, distance, other_ally, filter_skill_id)
-    spirit_pet_array = AgentArray.Filter.ByCondition(spirit_pet_array, lambda agent_id: not GLOBAL_CACHE.Agent.IsSpawned(agent_id)) #filter spirits
-    ally_array = AgentArray.Manipulation.Merge(ally_array, spirit_pet_array) #added Pets
-    
-    ally_array = AgentArray.Sort.ByHealth(ally_array)
-    return Utils.GetFirstFromArray(ally_array)
+    return TargetingContext().LowestAlly(other_ally, filter_skill_id, TargetingContext.MARTIAL)
 
 
 def TargetLowestAllyMelee(other_ally=False, filter_skill_id=0):
-    distance = Range.Spellcast.value
-    ally_array = GLOBAL_CACHE.AgentArray.GetAllyArray()
-    ally_array = FilterAllyArray(ally_array, distance, other_ally, filter_skill_id)
-    ally_array = AgentArray.Filter.ByCondition(ally_array, lambda agent_id: GLOBAL_CACHE.Agent.IsMelee(agent_id))
-    
-    spirit_pet_array = GLOBAL_CACHE.AgentArray.GetSpiritPetArray()
-    spirit_pet_array = FilterAllyArray(spirit_pet_array, distance, other_ally, filter_skill_id)
-    spirit_pet_array = AgentArray.Filter.ByCondition(spirit_pet_array, lambda agent_id: not GLOBAL_CACHE.Agent.IsSpawned(agent_id)) #filter spirits
-    ally_array = AgentArray.Manipulation.Merge(ally_array, spirit_pet_array) #added Pets
-    
-    ally_array = AgentArray.Sort.ByHealth(ally_array)
-    return Utils.GetFirstFromArray(ally_array)
+    return TargetingContext().LowestAlly(other_ally, filter_skill_id, TargetingContext.MELEE)
 
 
 def TargetLowestAllyRanged(other_ally=False, filter_skill_id=0):
-    distance = Range.Spellcast.value
-    ally_array = GLOBAL_CACHE.AgentArray.GetAllyArray()
-    ally_array = FilterAllyArray(ally_array, distance, other_ally, filter_skill_id)
-    ally_array = AgentArray.Filter.ByCondition(ally_array, lambda agent_id: GLOBAL_CACHE.Agent.IsRanged(agent_id))
-    
-    ally_array = AgentArray.Sort.ByHealth(ally_array)
-    return Utils.GetFirstFromArray(ally_array)
+    return TargetingContext().LowestAlly(other_ally, filter_skill_id, TargetingContext.RANGED, include_spirit_pets=False)
 
 
 def IsValidItem(item_id):
@@ -141,90 +354,49 @@ def TargetNearestItem():
 
 
 def TargetClusteredEnemy(area=4500.0):
-    distance = area
-    enemy_array = GLOBAL_CACHE.AgentArray.GetEnemyArray()
-    enemy_array = AgentArray.Filter.ByDistance(enemy_array, GLOBAL_CACHE.Player.GetXY(), distance)
-    enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsAlive(agent_id))
-    
-    clustered_agent = AgentArray.Routines.DetectLargestAgentCluster(enemy_array, area)
-    return Utils.GetFirstFromArray(clustered_agent)
+    return TargetingContext().ClusteredEnemy(area)
+
+def GetNearestEnemy(max_distance=4500.0, aggressive_only = False):
+    return TargetingContext().NearestEnemy(max_distance, aggressive_only)
+
+def GetNearestEnemyCaster(max_distance=4500.0, aggressive_only = False):
+    return TargetingContext().NearestEnemy(max_distance, aggressive_only, TargetingContext.CASTER)
+
+def GetNearestEnemyMartial(max_distance=4500.0, aggressive_only = False):
+    return TargetingContext().NearestEnemy(max_distance, aggressive_only, TargetingContext.MARTIAL)
+
+def GetNearestEnemyMelee(max_distance=4500.0, aggressive_only = False):
+    return TargetingContext().NearestEnemy(max_distance, aggressive_only, TargetingContext.MELEE)
+
+def GetNearestEnemyRanged(max_distance=4500.0, aggressive_only = False):
+    return TargetingContext().NearestEnemy(max_distance, aggressive_only, TargetingContext.RANGED)
 
 def GetEnemyAttacking(max_distance=4500.0, aggressive_only = False):
-    player_pos = GLOBAL_CACHE.Player.GetXY()
-    enemy_array = Routines.Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-    enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsAttacking(agent_id))
-    enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-    return Utils.GetFirstFromArray(enemy_array)
+    return TargetingContext().NearestEnemy(max_distance, aggressive_only, TargetingContext.ATTACKING)
 
 def GetEnemyCasting(max_distance=4500.0, aggressive_only = False):
-    player_pos = GLOBAL_CACHE.Player.GetXY()
-    enemy_array = Routines.Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-    enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsCasting(agent_id))
-    enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-    return Utils.GetFirstFromArray(enemy_array)
+    return TargetingContext().NearestEnemy(max_distance, aggressive_only, TargetingContext.CASTING)
 
 def GetEnemyCastingSpell(max_distance=4500.0, aggressive_only = False):
-    def _filter_spells(enemy_array):
-        result_array = []
-        for enemy_id in enemy_array:
-            casting_skill_id = GLOBAL_CACHE.Agent.GetCastingSkill(enemy_id)
-            if GLOBAL_CACHE.Skill.Flags.IsSpell(casting_skill_id):
-                result_array.append(enemy_id)
-        return result_array
-
-                
-    player_pos = GLOBAL_CACHE.Player.GetXY()
-    enemy_array = Routines.Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-    enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsCasting(agent_id))
-    enemy_array = _filter_spells(enemy_array)
-    
-    enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-    return Utils.GetFirstFromArray(enemy_array)
+    return TargetingContext().NearestEnemyCastingSpell(max_distance, aggressive_only)
 
 def GetEnemyInjured(max_distance=4500.0, aggressive_only = False):
-    player_pos = GLOBAL_CACHE.Player.GetXY()
-    enemy_array = Routines.Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-    enemy_array = AgentArray.Sort.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.GetHealth(agent_id))
-    return Utils.GetFirstFromArray(enemy_array)
+    return TargetingContext().InjuredEnemy(max_distance, aggressive_only)
 
 def GetEnemyConditioned(max_distance=4500.0, aggressive_only = False):
-    player_pos = GLOBAL_CACHE.Player.GetXY()
-    enemy_array = Routines.Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-    enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsConditioned(agent_id))
-    enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-    return Utils.GetFirstFromArray(enemy_array)
+    return TargetingContext().NearestEnemy(max_distance, aggressive_only, TargetingContext.CONDITIONED)
 
 def GetEnemyHexed(max_distance=4500.0, aggressive_only = False):
-    player_pos = GLOBAL_CACHE.Player.GetXY()
-    enemy_array = Routines.Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-    enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsHexed(agent_id))
-    enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-    return Utils.GetFirstFromArray(enemy_array)
+    return TargetingContext().NearestEnemy(max_distance, aggressive_only, TargetingContext.HEXED)
 
 def GetEnemyDegenHexed(max_distance=4500.0, aggressive_only = False):
-    player_pos = GLOBAL_CACHE.Player.GetXY()
-    enemy_array = Routines.Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-    enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsDegenHexed(agent_id))
-    enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-    return Utils.GetFirstFromArray(enemy_array)
+    return TargetingContext().NearestEnemy(max_distance, aggressive_only, TargetingContext.DEGEN_HEXED)
 
 def GetEnemyEnchanted(max_distance=4500.0, aggressive_only = False):
-    player_pos = GLOBAL_CACHE.Player.GetXY()
-    enemy_array = Routines.Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-    enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsEnchanted(agent_id))
-    enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-    return Utils.GetFirstFromArray(enemy_array)
+    return TargetingContext().NearestEnemy(max_distance, aggressive_only, TargetingContext.ENCHANTED)
 
 def GetEnemyMoving(max_distance=4500.0, aggressive_only = False):
-    player_pos = GLOBAL_CACHE.Player.GetXY()
-    enemy_array = Routines.Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-    enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsMoving(agent_id))
-    enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-    return Utils.GetFirstFromArray(enemy_array)
+    return TargetingContext().NearestEnemy(max_distance, aggressive_only, TargetingContext.MOVING)
 
 def GetEnemyKnockedDown(max_distance=4500.0, aggressive_only = False):
-    player_pos = GLOBAL_CACHE.Player.GetXY()
-    enemy_array = Routines.Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-    enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsKnockedDown(agent_id))
-    enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-    return Utils.GetFirstFromArray(enemy_array)
\ No newline at end of file
+    return TargetingContext().NearestEnemy(max_distance, aggressive_only, TargetingContext.KNOCKED_DOWN)
@@ -38,10 +38,7 @@ def CheckForEffect(agent_id, skill_id):
     """
     result = False
     if _IsPartyMember(agent_id):
-        player_buffs = shared_memory_handler.get_agent_buffs(agent_id)
-        for buff in player_buffs:
-            if buff == skill_id:
-                result = True
+        result = skill_id in shared_memory_handler.get_agent_buffs(agent_id)
     else:
         result = GLOBAL_CACHE.Effects.BuffExists(agent_id, skill_id) or GLOBAL_CACHE.Effects.EffectExists(agent_id, skill_id)
     
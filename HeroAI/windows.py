@@ -6,6 +6,8 @@ from .constants import MAX_NUM_PLAYERS, NUMBER_OF_SKILLS
 from .types import SkillType, SkillNature, Skilltarget, GameOptionStruct
 from .globals import capture_mouse_timer, show_area_rings, show_hero_follow_grid, show_distance_on_followers, hero_formation, capture_hero_flag, capture_flag_all, capture_hero_index
 from .utils import IsHeroFlagged, DrawFlagAll, DrawHeroFlag, DistanceFromWaypoint
+from .targeting import TargetingContext
+from .skill_priority import SkillPriorityCache
 
 from .cache_data import CacheData
 
@@ -545,6 +547,10 @@ def DrawFollowDebug(cached_data:CacheData):
     show_distance_on_followers = PyImGui.checkbox("Show Distance on Followers", show_distance_on_followers)
     PyImGui.separator()
     PyImGui.text(f"InAggro: {cached_data.data.in_aggro}")
+    if cached_data.data.aggro is not None:
+        PyImGui.text("Enemies: " + ", ".join(f"{name} {count}" for name, count in cached_data.data.aggro.GetCounts().items()))
+    skill_order_stats = SkillPriorityCache().GetStats()
+    PyImGui.text(f"Skill order: {skill_order_stats['hits']} hits, {skill_order_stats['misses']} rebuilds, {skill_order_stats['entries']} bars")
     PyImGui.text(f"IsMelee: {GLOBAL_CACHE.Agent.IsMelee(cached_data.data.player_agent_id)}")
     PyImGui.text(f"Nearest Enemy: {cached_data.data.nearest_enemy}")
     PyImGui.text(f"stay_alert_timer: {cached_data.stay_alert_timer.GetElapsedTime()}")
@@ -636,12 +642,8 @@ def DrawMessagingOptions(cached_data:CacheData):
         self_account = GLOBAL_CACHE.ShMem.GetAccountDataFromEmail(cached_data.account_email)
         if not self_account:
             return
-        accounts = GLOBAL_CACHE.ShMem.GetAllAccountData()
-        sender_email = cached_data.account_email
-        for account in accounts:
-            ConsoleLog("Messaging", f"Sending Pcon Message to  {account.AccountEmail}")
-            
-            GLOBAL_CACHE.ShMem.SendMessage(sender_email, account.AccountEmail, SharedCommandType.PCon, params)
+        sent = GLOBAL_CACHE.ShMem.BroadcastMessage(cached_data.account_email, SharedCommandType.PCon, params)
+        ConsoleLog("Messaging", f"Sent Pcon Message to {sent} accounts")
 
     if ImGui.colored_button(f"{IconsFontAwesome5.ICON_TIMES}##commands_resign", ButtonColors["Resign"].button_color, ButtonColors["Resign"].hovered_color, ButtonColors["Resign"].active_color):
     #if PyImGui.button(f"{IconsFontAwesome5.ICON_TIMES}##commands_resign"):
@@ -877,6 +879,15 @@ def DrawMessagingOptions(cached_data:CacheData):
     
     
 
+def DrawTargetingDebug(cached_data:CacheData):
+    stats = TargetingContext().GetStats()
+    PyImGui.text(f"Selector calls: {stats['calls']}")
+    PyImGui.text(f"Agent lookups: {stats['lookups']}")
+    PyImGui.text(f"Agent reads: {stats['reads']}")
+    PyImGui.text_colored(f"Reads saved this frame: {stats['saved_reads']}", TrueFalseColor(stats['saved_reads'] > 0))
+    PyImGui.text(f"Ticks: {stats['ticks']} / View builds: {stats['builds']}")
+
+
 def DrawDebugWindow(cached_data:CacheData):
     global MAX_NUM_PLAYERS
 
@@ -895,6 +906,8 @@ def DrawDebugWindow(cached_data:CacheData):
             DrawFlagDebug(cached_data)
         if PyImGui.collapsing_header("Prioritized Skills"):
             DrawPrioritizedSkills(cached_data)
+        if PyImGui.collapsing_header("Targeting Debug"):
+            DrawTargetingDebug(cached_data)
         if PyImGui.collapsing_header("Buff Debug"):
             DrawBuffWindow(cached_data)
         
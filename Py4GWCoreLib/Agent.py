@@ -2,6 +2,7 @@ from unittest import result
 import Py4GW
 import PyAgent
 import PyPlayer
+import time
 from .model_data import ModelData
 
 class ItemOwnerCache:
@@ -25,6 +26,64 @@ class ItemOwnerCache:
         self.cache.clear()
 
 
+class AgentInstanceCache:
+    """
+    Frame-scoped memo of PyAgent instances keyed on (frame, agent_id).
+
+    GlobalCache._update_cache starts a new frame; RawAgentArray seeds it with the agents it
+    already refreshed, so Agent.* and GLOBAL_CACHE.Agent share one object per agent per frame.
+    If nothing advances the frame (scripts running without the Environment Upkeeper),
+    entries expire after max_age_ms so they are never served stale.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(AgentInstanceCache, cls).__new__(cls)
+            cls._instance._init()
+        return cls._instance
+
+    def _init(self):
+        self.instances = {}  # { agent_id: PyAgent }
+        self.frame = 0
+        self.frame_start = time.perf_counter()
+        self.max_age_ms = 33
+        self.constructions = 0       # native PyAgent constructions this frame
+        self.hits = 0                # memo hits this frame
+        self.last_constructions = 0  # totals of the previous frame
+        self.last_hits = 0
+
+    def NewFrame(self):
+        """Drop every memoized instance and start counting a new frame."""
+        self.last_constructions = self.constructions
+        self.last_hits = self.hits
+        self.constructions = 0
+        self.hits = 0
+        self.instances.clear()
+        self.frame += 1
+        self.frame_start = time.perf_counter()
+
+    def Seed(self, agent_id, agent):
+        """Publish an already refreshed instance for the current frame."""
+        self.instances[agent_id] = agent
+
+    def Get(self, agent_id):
+        if (time.perf_counter() - self.frame_start) * 1000 > self.max_age_ms:
+            self.NewFrame()
+        agent = self.instances.get(agent_id)
+        if agent is not None:
+            self.hits += 1
+            return agent
+        agent = PyAgent.PyAgent(agent_id)
+        self.constructions += 1
+        self.instances[agent_id] = agent
+        return agent
+
+    def GetStats(self):
+        """Returns (frame, constructions, hits, last_constructions, last_hits)."""
+        return self.frame, self.constructions, self.hits, self.last_constructions, self.last_hits
+
+
 # Agent
 class Agent:
     @staticmethod
@@ -34,7 +93,7 @@ class Agent:
         Args: agent_id (int): The ID of the agent.
         Returns: bool
         """
-        return PyAgent.PyAgent(agent_id).IsValid(agent_id)
+        return Agent.agent_instance(agent_id).IsValid(agent_id)
     
     @staticmethod
     def agent_instance(agent_id):
@@ -42,10 +101,19 @@ class Agent:
         Helper method to create and return a PyAgent instance.
         Args:
             agent_id (int): The ID of the agent to retrieve.
+        Instances are memoized for the current frame, see AgentInstanceCache.
         Returns:
             PyAgent: The PyAgent instance for the given ID.
         """
-        return PyAgent.PyAgent(agent_id)
+        return AgentInstanceCache().Get(agent_id)
+
+    @staticmethod
+    def GetInstanceCacheStats():
+        """
+        Purpose: Retrieve the PyAgent memoization counters.
+        Returns: tuple (frame, constructions, hits, last_constructions, last_hits)
+        """
+        return AgentInstanceCache().GetStats()
 
     @staticmethod
     def GetIdFromAgent(agent_instance):
@@ -469,7 +537,8 @@ class Agent:
         Args: agent_id (int): The ID of the agent.
         Returns: int
         """
-        pips = 3.0 / 0.99 * Agent.agent_instance(agent_id).living_agent.energy_regen * Agent.agent_instance(agent_id).living_agent.max_energy
+        living_agent = Agent.agent_instance(agent_id).living_agent
+        pips = 3.0 / 0.99 * living_agent.energy_regen * living_agent.max_energy
         return int(pips) if pips > 0 else 0
 
     @staticmethod
@@ -573,7 +642,8 @@ class Agent:
     @staticmethod
     def IsAggressive(agent_id):
         """Check if the agent is attacking or casting."""
-        if Agent.agent_instance(agent_id).living_agent.is_attacking or Agent.agent_instance(agent_id).living_agent.is_casting:
+        living_agent = Agent.agent_instance(agent_id).living_agent
+        if living_agent.is_attacking or living_agent.is_casting:
             return True
         else:
             return False
@@ -602,7 +672,8 @@ class Agent:
     @staticmethod
     def GetWeaponType(agent_id):
         """Purpose: Retrieve the weapon type of the agent."""
-        return Agent.agent_instance(agent_id).living_agent.weapon_type.ToInt(), Agent.agent_instance(agent_id).living_agent.weapon_type.GetName()
+        weapon_type = Agent.agent_instance(agent_id).living_agent.weapon_type
+        return weapon_type.ToInt(), weapon_type.GetName()
 
     @staticmethod
     def GetWeaponExtraData(agent_id):
@@ -665,7 +736,8 @@ class Agent:
     @staticmethod
     def GetAllegiance(agent_id):
         """Purpose: Retrieve the allegiance of the agent."""
-        return  Agent.agent_instance(agent_id).living_agent.allegiance.ToInt(), Agent.agent_instance(agent_id).living_agent.allegiance.GetName()
+        allegiance = Agent.agent_instance(agent_id).living_agent.allegiance
+        return allegiance.ToInt(), allegiance.GetName()
 
     @staticmethod
     def IsPlayer(agent_id):
@@ -1,6 +1,11 @@
 import Py4GW
 import PyPlayer
 import PyAgent
+import math
+import heapq
+from array import array
+from itertools import repeat
+from dataclasses import dataclass, field
 
 from .Agent import *
 from .Player import *
@@ -8,6 +13,19 @@ from .Player import *
 from .Py4GWcorelib import Utils
 
 
+@dataclass
+class AgentCluster:
+    """A group of agents where every member is within cluster_radius of another member."""
+    center: tuple[float, float] = (0.0, 0.0)
+    radius: float = 0.0                     # distance from center to the farthest member
+    agent_ids: list[int] = field(default_factory=list)
+    closest_agent_id: int = 0               # member nearest to center
+
+    @property
+    def size(self) -> int:
+        return len(self.agent_ids)
+
+
 class AgentArray:
     @staticmethod
     def GetRawAgentArray():
@@ -79,6 +97,15 @@ class AgentArray:
         """Purpose: Retrieve the agent array pre filtered by gadgets."""
         return [item for item in Player.player_instance().GetGadgetArray() if item != 0]
     
+    @staticmethod
+    def GetSpatialIndex():
+        """Purpose: Get the spatial index of the current RawAgentArray tick, or None if no agents are loaded."""
+        raw_agent_array = RawAgentArray._instance
+        if raw_agent_array is None or not raw_agent_array._initialized:
+            return None
+        index = raw_agent_array.get_spatial_index()
+        return index if len(index) else None
+
     @staticmethod
     def GetMovementStuckArray():
         """Purpose: Get the unfiltered full agent array."""
@@ -174,6 +201,9 @@ class AgentArray:
             """
             if agent_array is None:
                 return []
+            index = AgentArray.GetSpatialIndex()
+            if index is not None:
+                return index.SortByDistance(agent_array, pos, descending)
             return AgentArray.Sort.ByCondition(
                 agent_array,
                 condition_func=lambda agent_id: Utils.Distance(
@@ -244,6 +274,10 @@ class AgentArray:
             """
             if agent_array is None:
                 return []
+            index = AgentArray.GetSpatialIndex()
+            if index is not None:
+                return index.FilterByDistance(agent_array, pos, max_distance, negate)
+
             def distance_filter(agent_id):
                 agent_x, agent_y = Agent.GetXY(agent_id)
                 distance = Utils.Distance((agent_x, agent_y), (pos[0], pos[1]))
@@ -252,70 +286,600 @@ class AgentArray:
             return AgentArray.Filter.ByCondition(agent_array, distance_filter)
 
 
+    class Scoring:
+        """
+        Scorers for AgentArray.Routines.RankTargets.
+        Each receives the candidate positions, their health and a reference position,
+        and returns one score per candidate; lower scores rank first.
+        """
+        @staticmethod
+        def ClusterDensity(positions, healths, pos):
+            """Sum of distances to every other candidate (most balled up first)."""
+            dist = math.dist
+            return [sum(map(dist, repeat(point, len(positions)), positions)) for point in positions]
+
+        @staticmethod
+        def LowestHP(positions, healths, pos):
+            """Candidate health (most injured first)."""
+            return list(healths)
+
+        @staticmethod
+        def Nearest(positions, healths, pos):
+            """Distance to the reference position (closest first)."""
+            dist = math.dist
+            return list(map(dist, positions, repeat((pos[0], pos[1]), len(positions))))
+
     class Routines:
         @staticmethod
-        def DetectLargestAgentCluster(agent_array, cluster_radius):
+        def RankTargets(agent_array, scoring=None, pos=(0.0, 0.0)):
             """
-            Detects the largest cluster of agents based on proximity and returns the center of mass (XY) of the cluster
-            and the closest agent ID to the center of mass.
+            Ranks agents with a pluggable scorer in one batched pass over their positions.
+
+            Args:
+                agent_array (list[int]): Candidate agent IDs.
+                scoring (callable): One of AgentArray.Scoring (or a compatible callable), defaults to ClusterDensity.
+                pos (tuple): Reference (x, y) position handed to the scorer.
+
+            Returns:
+                list[int]: Agent IDs ordered from best to worst score.
+
+            Example:
+                ranked = AgentArray.Routines.RankTargets(enemy_array, AgentArray.Scoring.LowestHP, player_pos)
+            """
+            if not agent_array:
+                return []
+            if scoring is None:
+                scoring = AgentArray.Scoring.ClusterDensity
+
+            agent_ids = list(agent_array)
+            snapshot = RawAgentArray._instance.snapshot if RawAgentArray._instance is not None else None
+            row_of = snapshot.row_of if snapshot is not None else {}
+            positions = []
+            healths = []
+            for agent_id in agent_ids:
+                row = row_of.get(agent_id)
+                if row is not None:
+                    positions.append((snapshot.x[row], snapshot.y[row]))
+                    healths.append(snapshot.hp[row])
+                else:
+                    positions.append(Agent.GetXY(agent_id))
+                    healths.append(Agent.GetHealth(agent_id))
+
+            scores = scoring(positions, healths, pos)
+            order = sorted(range(len(agent_ids)), key=scores.__getitem__)
+            return [agent_ids[i] for i in order]
+
+        _cluster_cache: dict = {}
+        _cluster_cache_frame = -1
+
+        @staticmethod
+        def DetectAgentClusters(agent_array, cluster_radius, min_size=1):
+            """
+            Groups agents into proximity clusters (DBSCAN with single-linkage, grid hashed).
+
+            Agents are bucketed into cells of cluster_radius, so each agent is only compared
+            against the 9 surrounding cells and the pass is linear in the number of agents.
+            Results are cached for the current RawAgentArray tick.
 
             Args:
                 agent_array (list[int]): List of agent IDs.
                 cluster_radius (float): The maximum distance between agents to consider them in the same cluster.
+                min_size (int): Clusters smaller than this are dropped.
 
             Returns:
-                tuple: (center_of_mass (tuple), closest_agent_id (int))
-                    - center_of_mass: (x, y) coordinates of the cluster's center of mass.
-                    - closest_agent_id: The ID of the agent closest to the center of mass.
+                list[AgentCluster]: Clusters ordered from largest to smallest.
 
             Example:
-                center_xy, closest_agent_id = Filters.DetectLargestAgentCluster(agent_array, cluster_radius=100)
+                clusters = AgentArray.Routines.DetectAgentClusters(enemy_array, Range.Nearby.value, min_size=3)
             """
+            if not agent_array or cluster_radius <= 0:
+                return []
+
+            raw_agent_array = RawAgentArray._instance
+            snapshot = raw_agent_array.snapshot if raw_agent_array is not None else None
+            frame = snapshot.frame if snapshot is not None and len(snapshot) else -1
+            if frame != AgentArray.Routines._cluster_cache_frame or frame < 0:
+                AgentArray.Routines._cluster_cache.clear()
+                AgentArray.Routines._cluster_cache_frame = frame
+            agent_ids = tuple(dict.fromkeys(agent_array))
+            cache_key = (agent_ids, cluster_radius, min_size)
+            if frame >= 0 and cache_key in AgentArray.Routines._cluster_cache:
+                return AgentArray.Routines._cluster_cache[cache_key]
+
+            row_of = snapshot.row_of if snapshot is not None else {}
+            positions = []
+            for agent_id in agent_ids:
+                row = row_of.get(agent_id)
+                positions.append((snapshot.x[row], snapshot.y[row]) if row is not None else Agent.GetXY(agent_id))
+
+            # === Grid hash ===
+            inv = 1.0 / cluster_radius
+            cells: dict[tuple[int, int], list[int]] = {}
+            for i, (x, y) in enumerate(positions):
+                cells.setdefault((int(math.floor(x * inv)), int(math.floor(y * inv))), []).append(i)
+
+            # === Union-find over neighbouring cells ===
+            parent = list(range(len(agent_ids)))
+
+            def find(i):
+                while parent[i] != i:
+                    parent[i] = parent[parent[i]]
+                    i = parent[i]
+                return i
+
+            radius_sq = cluster_radius * cluster_radius
+            for (cx, cy), members in cells.items():
+                neighbours = []
+                for dx in (-1, 0, 1):
+                    for dy in (-1, 0, 1):
+                        bucket = cells.get((cx + dx, cy + dy))
+                        if bucket:
+                            neighbours.extend(bucket)
+                for i in members:
+                    xi, yi = positions[i]
+                    for j in neighbours:
+                        if j <= i:
+                            continue
+                        xj, yj = positions[j]
+                        if (xi - xj) ** 2 + (yi - yj) ** 2 <= radius_sq:
+                            root_i, root_j = find(i), find(j)
+                            if root_i != root_j:
+                                parent[root_j] = root_i
+
+            groups: dict[int, list[int]] = {}
+            for i in range(len(agent_ids)):
+                groups.setdefault(find(i), []).append(i)
+
+            # === Describe each cluster ===
             clusters = []
-            ungrouped_agents = set(agent_array)
+            for members in groups.values():
+                if len(members) < min_size:
+                    continue
+                center_x = sum(positions[i][0] for i in members) / len(members)
+                center_y = sum(positions[i][1] for i in members) / len(members)
+                distances = [math.dist(positions[i], (center_x, center_y)) for i in members]
+                closest = min(range(len(members)), key=distances.__getitem__)
+                clusters.append(AgentCluster(
+                    center=(center_x, center_y),
+                    radius=max(distances),
+                    agent_ids=[agent_ids[i] for i in members],
+                    closest_agent_id=agent_ids[members[closest]],
+                ))
+
+            clusters.sort(key=lambda cluster: cluster.size, reverse=True)
+            if frame >= 0:
+                AgentArray.Routines._cluster_cache[cache_key] = clusters
+            return clusters
 
-            def is_in_radius(agent1, agent2):
-                x1, y1 = Agent.GetXY(agent1)
-                x2, y2 = Agent.GetXY(agent2)
-                distance_sq = (x1 - x2) ** 2 + (y1 - y2) ** 2
-                return distance_sq <= cluster_radius ** 2
+        @staticmethod
+        def DetectLargestAgentCluster(agent_array, cluster_radius):
+            """
+            Detects the largest cluster of agents based on proximity and returns the agent closest to its center of mass.
 
-            # Create clusters by grouping nearby agents
-            while ungrouped_agents:
-                current_agent = ungrouped_agents.pop()
-                cluster = [current_agent]
+            Args:
+                agent_array (list[int]): List of agent IDs.
+                cluster_radius (float): The maximum distance between agents to consider them in the same cluster.
 
-                # Find agents in the same cluster
-                for agent in list(ungrouped_agents):
-                    if any(is_in_radius(current_agent, other) for other in cluster):
-                        cluster.append(agent)
-                        ungrouped_agents.remove(agent)
+            Returns:
+                int: The ID of the agent closest to the center of mass of the largest cluster, or 0 if agent_array is empty.
 
-                clusters.append(cluster)
+            Example:
+                closest_agent_id = AgentArray.Routines.DetectLargestAgentCluster(agent_array, cluster_radius=100)
+            """
+            clusters = AgentArray.Routines.DetectAgentClusters(agent_array, cluster_radius)
+            if not clusters:
+                return 0
+            return clusters[0].closest_agent_id
+
+class AgentSnapshot:
+    """
+    Columnar, per-tick copy of the agent array.
+
+    Every column is a contiguous typed ``array.array`` indexed by row, so a consumer can
+    filter, sort and measure distances over plain numbers instead of calling ``Agent.*``
+    once per agent. Rows follow the order of ``RawAgentArray.agent_array``.
+    The buffers can be wrapped without copying (``memoryview`` / ``numpy.frombuffer``).
+    """
+    # === Flag bits ===
+    LIVING      = 0x0001
+    ITEM        = 0x0002
+    GADGET      = 0x0004
+    ALIVE       = 0x0008
+    DEAD        = 0x0010
+    CASTING     = 0x0020
+    ATTACKING   = 0x0040
+    MOVING      = 0x0080
+    KNOCKED_DOWN = 0x0100
+    HEXED       = 0x0200
+    DEGEN_HEXED = 0x0400
+    ENCHANTED   = 0x0800
+    CONDITIONED = 0x1000
+    WEAPON_SPELLED = 0x2000
+    BOSS        = 0x4000
+    PLAYER      = 0x8000
+
+    def __init__(self):
+        self.frame = 0
+        self.ids = array('I')
+        self.x = array('f')
+        self.y = array('f')
+        self.z = array('f')
+        self.hp = array('f')
+        self.energy = array('f')
+        self.allegiance = array('B')
+        self.flags = array('I')
+        self.row_of: dict[int, int] = {}    # agent_id -> row
+
+    def __len__(self):
+        return len(self.ids)
+
+    def clear(self):
+        """Drop all rows."""
+        for column in (self.ids, self.x, self.y, self.z, self.hp, self.energy, self.allegiance, self.flags):
+            del column[:]
+        self.row_of.clear()
+
+    def build(self, agent_array):
+        """Rebuild every column from a list of PyAgent instances."""
+        self.clear()
+        self.frame += 1
+        for agent in agent_array:
+            if not agent.id:
+                continue
+            flags = 0
+            hp = energy = 0.0
+            allegiance = 0
+            if agent.is_living:
+                living = agent.living_agent
+                hp = living.hp
+                energy = living.energy
+                allegiance = living.allegiance.ToInt()
+                flags |= AgentSnapshot.LIVING
+                if living.is_dead or living.is_dead_by_typemap or hp <= 0.0:
+                    flags |= AgentSnapshot.DEAD
+                else:
+                    flags |= AgentSnapshot.ALIVE
+                if living.is_casting:
+                    flags |= AgentSnapshot.CASTING
+                if living.is_attacking:
+                    flags |= AgentSnapshot.ATTACKING
+                if living.is_moving:
+                    flags |= AgentSnapshot.MOVING
+                if living.is_knocked_down:
+                    flags |= AgentSnapshot.KNOCKED_DOWN
+                if living.is_hexed:
+                    flags |= AgentSnapshot.HEXED
+                if living.is_degen_hexed:
+                    flags |= AgentSnapshot.DEGEN_HEXED
+                if living.is_enchanted:
+                    flags |= AgentSnapshot.ENCHANTED
+                if living.is_conditioned:
+                    flags |= AgentSnapshot.CONDITIONED
+                if living.is_weapon_spelled:
+                    flags |= AgentSnapshot.WEAPON_SPELLED
+                if living.has_boss_glow:
+                    flags |= AgentSnapshot.BOSS
+                if living.login_number != 0:
+                    flags |= AgentSnapshot.PLAYER
+            elif agent.is_item:
+                flags |= AgentSnapshot.ITEM
+            elif agent.is_gadget:
+                flags |= AgentSnapshot.GADGET
+
+            self.row_of[agent.id] = len(self.ids)
+            self.ids.append(agent.id)
+            self.x.append(agent.x)
+            self.y.append(agent.y)
+            self.z.append(agent.z)
+            self.hp.append(hp)
+            self.energy.append(energy)
+            self.allegiance.append(allegiance)
+            self.flags.append(flags)
+
+    # === Row access ===
+    def Contains(self, agent_id: int) -> bool:
+        return agent_id in self.row_of
+
+    def GetXY(self, agent_id: int) -> tuple[float, float]:
+        row = self.row_of.get(agent_id)
+        if row is None:
+            return 0.0, 0.0
+        return self.x[row], self.y[row]
+
+    def GetHealth(self, agent_id: int) -> float:
+        row = self.row_of.get(agent_id)
+        return self.hp[row] if row is not None else 0.0
+
+    def GetEnergy(self, agent_id: int) -> float:
+        row = self.row_of.get(agent_id)
+        return self.energy[row] if row is not None else 0.0
+
+    def GetAllegiance(self, agent_id: int) -> int:
+        row = self.row_of.get(agent_id)
+        return self.allegiance[row] if row is not None else 0
+
+    def HasFlags(self, agent_id: int, flags: int) -> bool:
+        row = self.row_of.get(agent_id)
+        return row is not None and (self.flags[row] & flags) == flags
+
+    # === Bulk queries ===
+    def Rows(self, allegiance: int | None = None, require: int = 0, exclude: int = 0) -> list[int]:
+        """
+        Return the row indexes matching an allegiance and flag masks.
+        Args:
+            allegiance (int | None): Allegiance value to keep, None keeps all.
+            require (int): Every bit in this mask must be set.
+            exclude (int): No bit in this mask may be set.
+        """
+        flags = self.flags
+        if allegiance is None:
+            return [row for row in range(len(flags))
+                    if (flags[row] & require) == require and not (flags[row] & exclude)]
+        column = self.allegiance
+        return [row for row in range(len(flags))
+                if column[row] == allegiance and (flags[row] & require) == require and not (flags[row] & exclude)]
+
+    def Ids(self, rows) -> list[int]:
+        ids = self.ids
+        return [ids[row] for row in rows]
+
+    def DistancesSq(self, pos, rows=None) -> list[float]:
+        """Squared distances from pos for the given rows (all rows when None)."""
+        px, py = pos[0], pos[1]
+        xs, ys = self.x, self.y
+        if rows is None:
+            return [(ax - px) ** 2 + (ay - py) ** 2 for ax, ay in zip(xs, ys)]
+        return [(xs[row] - px) ** 2 + (ys[row] - py) ** 2 for row in rows]
+
+    def Filter(self, allegiance: int | None = None, require: int = 0, exclude: int = 0,
+               pos=None, max_distance: float | None = None) -> list[int]:
+        """
+        Return agent ids matching allegiance, flag masks and an optional radius around pos.
+        Example:
+            living_enemies = snapshot.Filter(Allegiance.Enemy, require=AgentSnapshot.ALIVE, pos=player_xy, max_distance=Range.Earshot.value)
+        """
+        rows = self.Rows(allegiance, require, exclude)
+        if pos is not None and max_distance is not None:
+            px, py = pos[0], pos[1]
+            xs, ys = self.x, self.y
+            limit = max_distance * max_distance
+            rows = [row for row in rows if (xs[row] - px) ** 2 + (ys[row] - py) ** 2 <= limit]
+        return self.Ids(rows)
+
+    def SortByDistance(self, agent_ids, pos, descending: bool = False) -> list[int]:
+        """Sort agent ids by distance to pos using the snapshot coordinates."""
+        px, py = pos[0], pos[1]
+        xs, ys, row_of = self.x, self.y, self.row_of
+        inf = math.inf
+
+        def key(agent_id):
+            row = row_of.get(agent_id)
+            if row is None:
+                return inf
+            return (xs[row] - px) ** 2 + (ys[row] - py) ** 2
+
+        return sorted(agent_ids, key=key, reverse=descending)
+
+    def SortByHealth(self, agent_ids, descending: bool = False) -> list[int]:
+        """Sort agent ids by health using the snapshot values."""
+        hp, row_of = self.hp, self.row_of
+        return sorted(agent_ids, key=lambda agent_id: hp[row_of[agent_id]] if agent_id in row_of else 0.0, reverse=descending)
+
+
+class AgentSpatialIndex:
+    """
+    Uniform grid over an AgentSnapshot, bucketed in game units.
+
+    Rebuilt once per RawAgentArray update. Range queries only visit the cells overlapping
+    the query circle, so they stay sub-linear when 100+ agents are loaded.
+    """
+    def __init__(self, cell_size: float = Range.Earshot.value):
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], list[int]] = {}  # (cx, cy) -> rows
+        self.snapshot = AgentSnapshot()
+        self._aggro: dict[int, AggroBands] = {}            # agent_id -> bands of the current snapshot frame
+
+    def __len__(self):
+        return len(self.snapshot)
+
+    def clear(self):
+        self.cells.clear()
+        self._aggro.clear()
+
+    def build(self, snapshot: AgentSnapshot):
+        """Bucket every snapshot row into its grid cell."""
+        self.snapshot = snapshot
+        self.cells.clear()
+        self._aggro.clear()
+        cells = self.cells
+        inv = 1.0 / self.cell_size
+        for row, (x, y) in enumerate(zip(snapshot.x, snapshot.y)):
+            key = (int(math.floor(x * inv)), int(math.floor(y * inv)))
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [row]
+            else:
+                bucket.append(row)
+
+    def _rows_in_radius(self, pos, radius: float, allegiance: int | None = None, require: int = 0, exclude: int = 0):
+        """Yield (distance_sq, row) for every row inside the circle that passes the masks."""
+        snapshot = self.snapshot
+        xs, ys, flags, allegiances = snapshot.x, snapshot.y, snapshot.flags, snapshot.allegiance
+        px, py = pos[0], pos[1]
+        limit = radius * radius
+        inv = 1.0 / self.cell_size
+        min_cx, max_cx = int(math.floor((px - radius) * inv)), int(math.floor((px + radius) * inv))
+        min_cy, max_cy = int(math.floor((py - radius) * inv)), int(math.floor((py + radius) * inv))
+        cells = self.cells
+
+        # Huge radii cover more cells than exist; scan the occupied ones instead.
+        if (max_cx - min_cx + 1) * (max_cy - min_cy + 1) > len(cells):
+            candidates = (bucket for (cx, cy), bucket in cells.items()
+                          if min_cx <= cx <= max_cx and min_cy <= cy <= max_cy)
+        else:
+            candidates = (cells[key] for key in
+                          ((cx, cy) for cx in range(min_cx, max_cx + 1) for cy in range(min_cy, max_cy + 1))
+                          if key in cells)
+
+        for bucket in candidates:
+            for row in bucket:
+                if allegiance is not None and allegiances[row] != allegiance:
+                    continue
+                row_flags = flags[row]
+                if (row_flags & require) != require or (row_flags & exclude):
+                    continue
+                distance_sq = (xs[row] - px) ** 2 + (ys[row] - py) ** 2
+                if distance_sq <= limit:
+                    yield distance_sq, row
+
+    # === Queries ===
+    def WithinRadius(self, pos, radius: float, allegiance: int | None = None, require: int = 0, exclude: int = 0) -> list[int]:
+        """
+        Return the ids of agents within radius of pos, unordered.
+        Example:
+            enemies = index.WithinRadius(player_xy, Range.Spellcast.value, Allegiance.Enemy, require=AgentSnapshot.ALIVE)
+        """
+        ids = self.snapshot.ids
+        return [ids[row] for _, row in self._rows_in_radius(pos, radius, allegiance, require, exclude)]
 
-            # Find the largest cluster
-            largest_cluster = max(clusters, key=len)
+    def CountInRadius(self, pos, radius: float, allegiance: int | None = None, require: int = 0, exclude: int = 0) -> int:
+        """Return how many agents are within radius of pos."""
+        return sum(1 for _ in self._rows_in_radius(pos, radius, allegiance, require, exclude))
 
-            # Compute the center of mass (average position) of the largest cluster
-            total_x = total_y = 0
-            for agent_id in largest_cluster:
+    def KNearest(self, pos, k: int, max_distance: float = Range.Compass.value,
+                 allegiance: int | None = None, require: int = 0, exclude: int = 0) -> list[int]:
+        """
+        Return up to k agent ids nearest to pos, closest first.
+        The search radius starts at one cell and doubles until k agents are found or max_distance is reached.
+        """
+        if k <= 0:
+            return []
+        ids = self.snapshot.ids
+        radius = min(self.cell_size, max_distance)
+        while True:
+            found = list(self._rows_in_radius(pos, radius, allegiance, require, exclude))
+            if len(found) >= k or radius >= max_distance:
+                return [ids[row] for _, row in heapq.nsmallest(k, found)]
+            radius = min(radius * 2, max_distance)
+
+    def FilterByDistance(self, agent_array, pos, max_distance: float, negate: bool = False) -> list[int]:
+        """
+        Keep the agents of agent_array within (or, with negate, beyond) max_distance of pos.
+        Agents missing from this tick fall back to a live position read.
+        """
+        in_range = {row for _, row in self._rows_in_radius(pos, max_distance)}
+        row_of = self.snapshot.row_of
+        limit = max_distance * max_distance
+        result = []
+        for agent_id in agent_array:
+            row = row_of.get(agent_id)
+            if row is not None:
+                inside = row in in_range
+            else:
                 agent_x, agent_y = Agent.GetXY(agent_id)
-                total_x += agent_x
-                total_y += agent_y
-
-            center_of_mass_x = total_x / len(largest_cluster)
-            center_of_mass_y = total_y / len(largest_cluster)
-            center_of_mass = (center_of_mass_x, center_of_mass_y)
-
-            # Find the agent closest to the center of mass
-            def distance_to_center(agent_id):
+                inside = (agent_x - pos[0]) ** 2 + (agent_y - pos[1]) ** 2 <= limit
+            if inside != negate:
+                result.append(agent_id)
+        return result
+
+    def SortByDistance(self, agent_array, pos, descending: bool = False) -> list[int]:
+        """Sort agent ids by distance to pos, reading live positions only for agents missing from this tick."""
+        px, py = pos[0], pos[1]
+        xs, ys, row_of = self.snapshot.x, self.snapshot.y, self.snapshot.row_of
+
+        def key(agent_id):
+            row = row_of.get(agent_id)
+            if row is None:
                 agent_x, agent_y = Agent.GetXY(agent_id)
-                #return (agent_x - center_of_mass_x) ** 2 + (agent_y - center_of_mass_y) ** 2  # Squared distance
-                return Utils.Distance((agent_x, agent_y), center_of_mass)
-
-            closest_agent_id = min(largest_cluster, key=distance_to_center)
+                return (agent_x - px) ** 2 + (agent_y - py) ** 2
+            return (xs[row] - px) ** 2 + (ys[row] - py) ** 2
+
+        return sorted(agent_array, key=key, reverse=descending)
+
+    def AnyInRadius(self, pos, radius: float, allegiance: int | None = None, require: int = 0, exclude: int = 0,
+                    ignore_id: int = 0) -> bool:
+        """Return True as soon as one agent (other than ignore_id) is found within radius of pos."""
+        ids = self.snapshot.ids
+        for _, row in self._rows_in_radius(pos, radius, allegiance, require, exclude):
+            if ids[row] != ignore_id:
+                return True
+        return False
+
+    def Aggro(self, agent_id: int) -> "AggroBands":
+        """Living enemies around agent_id, counted once per tick (see AggroBands)."""
+        bands = self._aggro.get(agent_id)
+        if bands is None or bands.frame != self.snapshot.frame:
+            bands = self._aggro[agent_id] = AggroBands(self, agent_id)
+        return bands
+
+
+class AggroBands:
+    """
+    Living enemies around one agent on one tick, counted per Range band in a single pass over the
+    spatial index. Counts are cumulative (Count(Range.Area) includes the Adjacent and Nearby ones);
+    "aggressive" enemies are the ones attacking or casting.
+    """
+    BANDS = (Range.Adjacent, Range.Nearby, Range.Area, Range.Earshot, Range.Spellcast)
+    _RADII = tuple(band.value for band in BANDS)
+    _AGGRESSIVE = AgentSnapshot.ATTACKING | AgentSnapshot.CASTING
+
+    __slots__ = ("frame", "agent_id", "pos", "counts", "aggressive_counts", "nearest_id", "nearest_sq",
+                 "nearest_aggressive_sq", "_index")
+
+    def __init__(self, index: "AgentSpatialIndex", agent_id: int):
+        snapshot = index.snapshot
+        self.frame = snapshot.frame
+        self.agent_id = agent_id
+        self._index = index
+        row = snapshot.row_of.get(agent_id)
+        self.pos = (snapshot.x[row], snapshot.y[row]) if row is not None else Agent.GetXY(agent_id)
+
+        radii_sq = [radius * radius for radius in AggroBands._RADII]
+        counts = [0] * len(radii_sq)
+        aggressive_counts = [0] * len(radii_sq)
+        nearest_id, nearest_sq, nearest_aggressive_sq = 0, math.inf, math.inf
+        ids, flags = snapshot.ids, snapshot.flags
+        aggressive_mask = AggroBands._AGGRESSIVE
+        for distance_sq, enemy_row in index._rows_in_radius(self.pos, AggroBands._RADII[-1], Allegiance.Enemy,
+                                                            require=AgentSnapshot.ALIVE):
+            enemy_id = ids[enemy_row]
+            if enemy_id == agent_id:
+                continue
+            aggressive = flags[enemy_row] & aggressive_mask
+            if distance_sq < nearest_sq:
+                nearest_id, nearest_sq = enemy_id, distance_sq
+            if aggressive and distance_sq < nearest_aggressive_sq:
+                nearest_aggressive_sq = distance_sq
+            for band, limit in enumerate(radii_sq):
+                if distance_sq <= limit:
+                    counts[band] += 1
+                    if aggressive:
+                        aggressive_counts[band] += 1
+        self.counts = counts
+        self.aggressive_counts = aggressive_counts
+        self.nearest_id = nearest_id
+        self.nearest_sq = nearest_sq
+        self.nearest_aggressive_sq = nearest_aggressive_sq
+
+    def Any(self, radius: float, aggressive_only: bool = False) -> bool:
+        """Is any living (and, with aggressive_only, attacking or casting) enemy within radius."""
+        if radius <= AggroBands._RADII[-1]:
+            nearest_sq = self.nearest_aggressive_sq if aggressive_only else self.nearest_sq
+            return nearest_sq <= radius * radius
+        require = AgentSnapshot.ALIVE
+        if not aggressive_only:
+            return self._index.AnyInRadius(self.pos, radius, Allegiance.Enemy, require, ignore_id=self.agent_id)
+        return any(self._index.AnyInRadius(self.pos, radius, Allegiance.Enemy, require | bit, ignore_id=self.agent_id)
+                   for bit in (AgentSnapshot.ATTACKING, AgentSnapshot.CASTING))
+
+    def Count(self, band: Range, aggressive_only: bool = False) -> int:
+        """Living enemies within one of the BANDS."""
+        index = AggroBands.BANDS.index(band)
+        return self.aggressive_counts[index] if aggressive_only else self.counts[index]
+
+    def GetCounts(self) -> dict[str, int]:
+        return {band.name: count for band, count in zip(AggroBands.BANDS, self.counts)}
 
-            return closest_agent_id
 
 class RawAgentArray:
     _instance = None
@@ -348,6 +912,12 @@ class RawAgentArray:
         self.agent_cache = {}           # id -> agent instance
         self.current_map_id = 0
         self.owner_cache = {}            # id -> owner_id (for items)
+        self.partitions = {name: {} for name in RawAgentArray._PARTITIONS}  # partition -> {id: agent}
+        self.partition_of: dict[int, str] = {}     # id -> partition name
+        self.allegiance_of: dict[int, int] = {}    # id -> last allegiance (living agents)
+        self.alive_state: dict[int, bool] = {}     # id -> alive on the last tick (living agents)
+        self.snapshot = AgentSnapshot()  # columnar copy of agent_array
+        self.spatial_index = AgentSpatialIndex()  # grid over snapshot
 
         # === Name handling ===
         self.agent_name_map: dict[int, Tuple[str, float]] = {}  # id -> (name, timestamp)
@@ -355,6 +925,9 @@ class RawAgentArray:
         self.name_timeout_ms = 2_500                           # refresh name every 10s
 
 
+        # === Events ===
+        self.subscribers = {event: [] for event in RawAgentArray.EVENTS}
+
         # === Throttling ===
         self.throttle = throttle
         self.update_throttle = ThrottledTimer(self.throttle)
@@ -362,6 +935,59 @@ class RawAgentArray:
         self._initialized = True
         self.map_valid = False
 
+    # === Events ===
+    EVENTS = ("on_spawn", "on_despawn", "on_allegiance_change", "on_death")
+
+    def subscribe(self, event: str, callback):
+        """
+        Register a callback for an agent event, published once per update after all arrays are consistent.
+            on_spawn(agent_id), on_despawn(agent_id), on_death(agent_id),
+            on_allegiance_change(agent_id, old_allegiance, new_allegiance)
+        """
+        if event not in self.subscribers:
+            raise ValueError(f"Unknown agent event '{event}', expected one of {RawAgentArray.EVENTS}.")
+        if callback not in self.subscribers[event]:
+            self.subscribers[event].append(callback)
+
+    def unsubscribe(self, event: str, callback):
+        """Remove a callback registered with subscribe."""
+        if callback in self.subscribers.get(event, []):
+            self.subscribers[event].remove(callback)
+
+    def _publish(self, events):
+        from .Py4GWcorelib import ConsoleLog
+        for event, args in events:
+            for callback in list(self.subscribers[event]):
+                try:
+                    callback(*args)
+                except Exception as e:
+                    ConsoleLog("RawAgentArray", f"Error in {event} callback: {e}", Py4GW.Console.MessageType.Error)
+
+    @staticmethod
+    def _classify(agent):
+        """Returns (partition name, allegiance) for an agent."""
+        if not agent.id:
+            return None, 0
+        if agent.is_gadget:
+            return "gadget_array", 0
+        if agent.is_item:
+            return "item_array", 0
+        if agent.is_living:
+            allegiance = agent.living_agent.allegiance.ToInt()
+            return RawAgentArray._ALLEGIANCE_PARTITIONS.get(allegiance, "neutral_array"), allegiance
+        return None, 0
+
+    _ALLEGIANCE_PARTITIONS = {
+        Allegiance.Ally: "ally_array",
+        Allegiance.Neutral: "neutral_array",
+        Allegiance.Enemy: "enemy_array",
+        Allegiance.SpiritPet: "spirit_pet_array",
+        Allegiance.Minion: "minion_array",
+        Allegiance.NpcMinipet: "npc_minipet_array",
+    }
+    _PARTITIONS = ("ally_array", "neutral_array", "enemy_array", "spirit_pet_array",
+                   "minion_array", "npc_minipet_array", "item_array", "gadget_array")
+
     def update(self):
         from .Routines import Routines
         from .Map import Map
@@ -379,23 +1005,44 @@ class RawAgentArray:
 
         self.update_throttle.Reset()
 
-        # === Step 1: Get current agent ids ===
+        # === Step 1: Diff current agent ids against the previous tick ===
         current_agent_ids = set(AgentArray.GetAgentArray())
-
-        # === Step 2: Resolve names for requested agents ===
-
-        # === Step 3: Refresh or create agents ===
-        self.agent_array = []
-        for agent_id in current_agent_ids:
-            if agent_id not in self.agent_cache:
-                agent_instance =  Agent.agent_instance(agent_id)
-                self.agent_cache[agent_id] = agent_instance
-                if agent_instance.is_item:
-                    self.owner_cache[agent_id] = agent_instance.item_agent.owner_id
-            else:
-                self.agent_cache[agent_id].GetContext()
-                agent_instance = self.agent_cache[agent_id]
-
+        previous_agent_ids = self.agent_cache.keys()
+        spawned = current_agent_ids - previous_agent_ids
+        despawned = previous_agent_ids - current_agent_ids
+        events = []
+        dirty_partitions = set()
+        agent_memo = AgentInstanceCache()
+
+        # === Step 2: Drop despawned agents and their name data ===
+        for agent_id in despawned:
+            agent_instance = self.agent_cache.pop(agent_id)
+            if agent_instance.is_item:
+                # Remove item owner cache if the item is no longer valid
+                self.owner_cache.pop(agent_id, None)
+            partition = self.partition_of.pop(agent_id, None)
+            if partition is not None:
+                del self.partitions[partition][agent_id]
+                dirty_partitions.add(partition)
+            self.agent_dict.pop(agent_id, None)
+            self.alive_state.pop(agent_id, None)
+            self.agent_name_map.pop(agent_id, None)
+            self.name_requested.discard(agent_id)
+            events.append(("on_despawn", (agent_id,)))
+
+        # === Step 3: Create spawned agents ===
+        for agent_id in spawned:
+            agent_instance = Agent.agent_instance(agent_id)
+            self.agent_cache[agent_id] = agent_instance
+            self.agent_dict[agent_id] = agent_instance
+            if agent_instance.is_item:
+                self.owner_cache[agent_id] = agent_instance.item_agent.owner_id
+            events.append(("on_spawn", (agent_id,)))
+
+        # === Step 4: Refresh every agent, keep partitions and alive state in place ===
+        for agent_id, agent_instance in self.agent_cache.items():
+            if agent_id not in spawned:
+                agent_instance.GetContext()
                 if agent_instance.is_item:
                     current_owner = agent_instance.item_agent.owner_id
                     cached_owner = self.owner_cache.get(agent_id, 0)
@@ -404,66 +1051,54 @@ class RawAgentArray:
                     # Never overwrite a valid owner with 0
                     if current_owner != 0 and current_owner != cached_owner:
                         self.owner_cache[agent_id] = current_owner
-            
-            agent = self.agent_cache[agent_id]
-            self.agent_array.append(agent)
-
-        # === Step 4: Remove stale agents and name data ===
-        
-        for agent_id in list(self.agent_cache.keys()):
-            if agent_id not in current_agent_ids:
-                agent_instance = self.agent_cache[agent_id]
-                if agent_instance.is_item:
-                    # Remove item owner cache if the item is no longer valid
-                    self.owner_cache.pop(agent_id, None)
-                
-                del self.agent_cache[agent_id]
-                self.agent_name_map.pop(agent_id, None)
-                self.name_requested.discard(agent_id)
-
-        # === Step 5: Build id → agent map ===
-        self.agent_dict = {agent.id: agent for agent in self.agent_array}
-
-        # === Step 6: Rebuild filtered arrays ===
-        self.ally_array.clear()
-        self.neutral_array.clear()
-        self.enemy_array.clear()
-        self.spirit_pet_array.clear()
-        self.minion_array.clear()
-        self.npc_minipet_array.clear()
-        self.item_array.clear()
-        self.gadget_array.clear()
-
-        for agent in self.agent_array:
-            if agent.id:
-                if agent.is_gadget:
-                    self.gadget_array.append(agent)
-                elif agent.is_item:
-                    self.item_array.append(agent)
-                elif agent.is_living:
-                    allegiance = agent.living_agent.allegiance.ToInt()
-                    if allegiance == Allegiance.Ally:
-                        self.ally_array.append(agent)
-                    elif allegiance == Allegiance.Neutral:
-                        self.neutral_array.append(agent)
-                    elif allegiance == Allegiance.Enemy:
-                        self.enemy_array.append(agent)
-                    elif allegiance == Allegiance.SpiritPet:
-                        self.spirit_pet_array.append(agent)
-                    elif allegiance == Allegiance.Minion:
-                        self.minion_array.append(agent)
-                    elif allegiance == Allegiance.NpcMinipet:
-                        self.npc_minipet_array.append(agent)
-                    else:
-                        self.neutral_array.append(agent)
-
-        # === Step 7: Clear names if map changes ===
+            agent_memo.Seed(agent_id, agent_instance)
+
+            partition, allegiance = RawAgentArray._classify(agent_instance)
+            previous_partition = self.partition_of.get(agent_id)
+            if partition != previous_partition:
+                if previous_partition is not None:
+                    del self.partitions[previous_partition][agent_id]
+                    dirty_partitions.add(previous_partition)
+                if partition is not None:
+                    self.partitions[partition][agent_id] = agent_instance
+                    self.partition_of[agent_id] = partition
+                    dirty_partitions.add(partition)
+                else:
+                    self.partition_of.pop(agent_id, None)
+
+            if agent_instance.is_living:
+                previous_allegiance = self.allegiance_of.get(agent_id, allegiance)
+                if previous_allegiance != allegiance and agent_id not in spawned:
+                    events.append(("on_allegiance_change", (agent_id, previous_allegiance, allegiance)))
+                self.allegiance_of[agent_id] = allegiance
+
+                living_agent = agent_instance.living_agent
+                alive = not living_agent.is_dead and living_agent.hp > 0.0
+                if self.alive_state.get(agent_id, False) and not alive:
+                    events.append(("on_death", (agent_id,)))
+                self.alive_state[agent_id] = alive
+
+        for agent_id in despawned:
+            self.allegiance_of.pop(agent_id, None)
+
+        # === Step 5: Publish changed arrays in place ===
+        if spawned or despawned:
+            self.agent_array[:] = self.agent_dict.values()
+        for partition in dirty_partitions:
+            getattr(self, partition)[:] = self.partitions[partition].values()
+
+        self.snapshot.build(self.agent_array)
+        self.spatial_index.build(self.snapshot)
+
+        # === Step 6: Clear names if map changes ===
         map_id = Map.GetMapID()
         if self.current_map_id != map_id:
             self.current_map_id = map_id
             self.agent_name_map.clear()
             self.name_requested.clear()
 
+        self._publish(events)
+
 
     def reset(self):
         """Reset the agent array and all caches."""
@@ -471,6 +1106,8 @@ class RawAgentArray:
         # === Reset throttles ===
         self.update_throttle.Reset()
 
+        events = [("on_despawn", (agent_id,)) for agent_id in self.agent_cache]
+
         # === Clear agent and name data ===
         self.agent_array.clear()
         self.ally_array.clear()
@@ -485,11 +1122,20 @@ class RawAgentArray:
         # === Clear caches and mappings ===
         self.agent_dict.clear()
         self.agent_cache.clear()
+        for partition in self.partitions.values():
+            partition.clear()
+        self.partition_of.clear()
+        self.allegiance_of.clear()
+        self.alive_state.clear()
+        self.snapshot.clear()
+        self.spatial_index.clear()
         self.agent_name_map.clear()
         self.name_requested.clear()
 
         # === Reset map state ===
         self.current_map_id = 0
+
+        self._publish(events)
   
 
     def get_array(self) -> list[PyAgent.PyAgent]:
@@ -528,9 +1174,21 @@ class RawAgentArray:
         self.update()
         return self.gadget_array
 
+    def get_snapshot(self) -> AgentSnapshot:
+        self.update()
+        return self.snapshot
+
+    def get_spatial_index(self) -> AgentSpatialIndex:
+        self.update()
+        return self.spatial_index
+
+    def get_aggro(self, agent_id: int) -> AggroBands:
+        self.update()
+        return self.spatial_index.Aggro(agent_id)
+
     def get_agent(self, agent_id: int) -> PyAgent.PyAgent:
         self.update()
-        return self.agent_dict.get(agent_id) or PyAgent.PyAgent(agent_id)
+        return self.agent_dict.get(agent_id) or Agent.agent_instance(agent_id)
     
     def get_item_owner(self, item_id: int) -> int:
         """
@@ -538,7 +1196,7 @@ class RawAgentArray:
         If the item is not found, returns 0.
         """
         self.update()
-        agent = self.agent_dict.get(item_id) or PyAgent.PyAgent(item_id)
+        agent = self.agent_dict.get(item_id) or Agent.agent_instance(item_id)
         owner = agent.item_agent.owner_id if agent.is_item else 0
         cached_owner = self.owner_cache.get(item_id, 0)
 
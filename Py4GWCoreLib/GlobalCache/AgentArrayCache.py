@@ -1,4 +1,4 @@
-from Py4GWCoreLib.AgentArray import RawAgentArray
+from Py4GWCoreLib.AgentArray import RawAgentArray, AgentSnapshot, AgentSpatialIndex, AggroBands
 import PyPlayer
 
 class AgentArrayCache:
@@ -62,5 +62,23 @@ class AgentArrayCache:
     
     def GetRawGadgetArray(self):
         return self._raw_agent_array.get_gadget_array()
+
+    def Snapshot(self) -> AgentSnapshot:
+        """Columnar snapshot (ids, xyz, hp, energy, allegiance, flags) of the current tick."""
+        return self._raw_agent_array.get_snapshot()
+
+    def SpatialIndex(self) -> AgentSpatialIndex:
+        """Grid index over the current tick for WithinRadius / KNearest / CountInRadius queries."""
+        return self._raw_agent_array.get_spatial_index()
+
+    def Aggro(self, agent_id: int) -> AggroBands:
+        """Living enemies around agent_id per Range band, computed once per tick and shared by every caller."""
+        return self._raw_agent_array.get_aggro(agent_id)
+
+    def Subscribe(self, event: str, callback):
+        """Register for on_spawn / on_despawn / on_allegiance_change / on_death agent events."""
+        self._raw_agent_array.subscribe(event, callback)
+
+    def Unsubscribe(self, event: str, callback):
+        self._raw_agent_array.unsubscribe(event, callback)
     
-   
\ No newline at end of file
@@ -1,5 +1,6 @@
 import PyAgent
 from Py4GWCoreLib.AgentArray import RawAgentArray
+from Py4GWCoreLib.Agent import AgentInstanceCache
 import time
 
 class AgentCache:
@@ -41,6 +42,10 @@ class AgentCache:
     def GetAgentByID(self, agent_id):
         return self.raw_agent_array.get_agent(agent_id)
     
+    def GetInstanceCacheStats(self):
+        """Returns (frame, constructions, hits, last_constructions, last_hits) of the PyAgent memo."""
+        return AgentInstanceCache().GetStats()
+    
     def GetAgentEffects(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.living_agent.effects
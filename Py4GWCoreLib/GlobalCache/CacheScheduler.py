@@ -0,0 +1,166 @@
+import time
+from typing import Callable
+
+
+class CacheTask:
+    def __init__(self, name: str, refresh: Callable[[], None], period_ms: float = 0,
+                 depends_on: tuple = (), lazy: bool = False, refresh_while_loading: bool = False):
+        self.name = name
+        self.refresh = refresh
+        self.period_ms = period_ms
+        self.depends_on = tuple(depends_on)
+        self.lazy = lazy                          # only refresh once due AND read
+        self.refresh_while_loading = refresh_while_loading
+        self.enabled = True
+
+        self.last_run = 0.0                       # perf_counter seconds
+        self.dirty = True
+
+        # === Stats ===
+        self.runs = 0
+        self.skipped = 0                          # lazy ticks nobody read
+        self.last_ms = 0.0
+        self.avg_ms = 0.0
+        self.max_ms = 0.0
+        self.total_ms = 0.0
+
+    def is_due(self, now: float) -> bool:
+        return (now - self.last_run) * 1000 >= self.period_ms
+
+    def run(self, now: float):
+        start = time.perf_counter()
+        self.refresh()
+        elapsed = (time.perf_counter() - start) * 1000
+        self.last_run = now
+        self.dirty = False
+        self.runs += 1
+        self.last_ms = elapsed
+        self.total_ms += elapsed
+        self.max_ms = max(self.max_ms, elapsed)
+        self.avg_ms = elapsed if self.runs == 1 else self.avg_ms * 0.9 + elapsed * 0.1
+
+    def reset_stats(self):
+        self.runs = self.skipped = 0
+        self.last_ms = self.avg_ms = self.max_ms = self.total_ms = 0.0
+
+
+class CacheScheduler:
+    """
+    Declarative refresh scheduler for the GlobalCache subsystems.
+
+    Each subsystem registers its refresh callable, period, dependencies and whether it is lazy.
+    Eager tasks refresh as soon as they are due. Lazy tasks are only flagged dirty when due
+    and refresh on the next read of their cache object, so unused caches cost nothing.
+    Dependencies always run before their dependents within a tick.
+    """
+    def __init__(self):
+        self.tasks: dict[str, CacheTask] = {}
+        self.order: list[CacheTask] = []
+
+    def register(self, name: str, refresh: Callable[[], None], period_ms: float = 0,
+                 depends_on: tuple = (), lazy: bool = False, refresh_while_loading: bool = False,
+                 target=None) -> CacheTask:
+        """
+        Register a subsystem.
+        Args:
+            name (str): Unique subsystem name.
+            refresh (callable): Refreshes the subsystem.
+            period_ms (float): Minimum time between refreshes, 0 refreshes every tick.
+            depends_on (tuple[str]): Subsystems that must be fresh before this one refreshes.
+            lazy (bool): Defer the refresh until a public method of target is called.
+            refresh_while_loading (bool): Refresh every tick while the map is loading.
+            target: Cache object whose public methods trigger a lazy refresh.
+        """
+        for dependency in depends_on:
+            if dependency not in self.tasks:
+                raise ValueError(f"CacheScheduler: '{name}' depends on unregistered '{dependency}'.")
+        task = CacheTask(name, refresh, period_ms, depends_on, lazy, refresh_while_loading)
+        self.tasks[name] = task
+        self.order.append(task)  # registration order is a valid topological order
+        if lazy:
+            if target is None:
+                raise ValueError(f"CacheScheduler: lazy task '{name}' needs a target cache object.")
+            self._install_read_hooks(task, target)
+        return task
+
+    def _install_read_hooks(self, task: CacheTask, target):
+        """Shadow the public methods of target so a read refreshes the task when it is dirty."""
+        def make_hook(method):
+            def hook(*args, **kwargs):
+                if task.dirty and task.enabled:
+                    self._run_with_dependencies(task, time.perf_counter())
+                return method(*args, **kwargs)
+            hook.__name__ = method.__name__
+            hook.__doc__ = method.__doc__
+            return hook
+
+        for attribute in dir(type(target)):
+            if attribute.startswith("_"):
+                continue
+            method = getattr(target, attribute)
+            if callable(method):
+                setattr(target, attribute, make_hook(method))
+
+    def _run_with_dependencies(self, task: CacheTask, now: float):
+        for dependency in task.depends_on:
+            dependency_task = self.tasks[dependency]
+            if dependency_task.dirty and dependency_task.enabled:
+                self._run_with_dependencies(dependency_task, now)
+        task.run(now)
+
+    def tick(self, is_loading: Callable[[], bool] | None = None):
+        """
+        Refresh every due eager task and flag due lazy tasks dirty.
+        is_loading is evaluated at most once, when the first not-yet-due refresh_while_loading
+        task is reached, so it sees the subsystems registered before it already refreshed.
+        """
+        now = time.perf_counter()
+        loading = None
+        for task in self.order:
+            if not task.enabled:
+                continue
+            due = task.is_due(now)
+            if not due and task.refresh_while_loading and is_loading is not None:
+                if loading is None:
+                    loading = is_loading()
+                due = loading
+            if not due:
+                continue
+            if task.lazy:
+                if task.dirty:
+                    task.skipped += 1
+                task.dirty = True
+                task.last_run = now
+                continue
+            task.dirty = True
+            self._run_with_dependencies(task, now)
+
+    def set_enabled(self, name: str, enabled: bool):
+        self.tasks[name].enabled = enabled
+
+    def set_period(self, name: str, period_ms: float):
+        self.tasks[name].period_ms = period_ms
+
+    def reset(self):
+        """Mark every task due on the next tick."""
+        for task in self.order:
+            task.last_run = 0.0
+            task.dirty = True
+
+    def get_stats(self) -> list[dict]:
+        """Per-subsystem timing, in execution order."""
+        return [
+            {
+                "name": task.name,
+                "period_ms": task.period_ms,
+                "lazy": task.lazy,
+                "enabled": task.enabled,
+                "runs": task.runs,
+                "skipped": task.skipped,
+                "last_ms": task.last_ms,
+                "avg_ms": task.avg_ms,
+                "max_ms": task.max_ms,
+                "total_ms": task.total_ms,
+            }
+            for task in self.order
+        ]
@@ -0,0 +1,385 @@
+import heapq
+import time
+import traceback
+from collections import deque
+from typing import Callable, Generator, List, Optional
+
+import Py4GW
+
+MODULE_NAME = "CoroutineScheduler"
+
+
+# === Requests a coroutine can yield ===
+class Sleep:
+    """Resume the coroutine once ms have passed."""
+    __slots__ = ("wake_at",)
+
+    def __init__(self, ms: float):
+        self.wake_at = time.perf_counter() + ms / 1000.0
+
+    def is_due(self, now: Optional[float] = None) -> bool:
+        return (time.perf_counter() if now is None else now) >= self.wake_at
+
+
+class WaitUntil:
+    """
+    Resume the coroutine once condition() is true (sent back True) or timeout_ms passed (sent back False).
+    condition is evaluated by the scheduler every poll_ms (0 = every tick) without resuming the coroutine.
+    """
+    __slots__ = ("condition", "deadline", "poll_ms")
+
+    def __init__(self, condition: Callable[[], bool], timeout_ms: Optional[float] = None, poll_ms: float = 0):
+        self.condition = condition
+        self.deadline = None if timeout_ms is None else time.perf_counter() + timeout_ms / 1000.0
+        self.poll_ms = poll_ms
+
+    def expired(self, now: Optional[float] = None) -> bool:
+        return self.deadline is not None and (time.perf_counter() if now is None else now) >= self.deadline
+
+
+class WaitForEvent:
+    """
+    Resume the coroutine once CoroutineScheduler.signal(event) is called (sent back the signal value)
+    or timeout_ms passed (sent back None).
+    """
+    __slots__ = ("event", "deadline", "sequence")
+
+    def __init__(self, event: str, sequence: int, timeout_ms: Optional[float] = None):
+        self.event = event
+        self.sequence = sequence          # signal count of the event when the wait started
+        self.deadline = None if timeout_ms is None else time.perf_counter() + timeout_ms / 1000.0
+
+    def expired(self, now: Optional[float] = None) -> bool:
+        return self.deadline is not None and (time.perf_counter() if now is None else now) >= self.deadline
+
+
+class CoroutineTask:
+    READY = "ready"
+    SLEEPING = "sleeping"
+    WAITING = "waiting"
+    EVENT = "event"
+    DONE = "done"
+    CANCELLED = "cancelled"
+    FAILED = "failed"
+
+    __slots__ = ("id", "name", "generator", "state", "request", "send_value", "heap_key",
+                 "result", "error", "error_trace", "resumes", "total_ms", "max_ms", "created")
+
+    def __init__(self, task_id: int, name: str, generator: Generator):
+        self.id = task_id
+        self.name = name
+        self.generator = generator
+        self.state = CoroutineTask.READY
+        self.request = None
+        self.send_value = None
+        self.heap_key = 0.0               # wake time of the heap entry that is still valid
+        self.result = None                # return value of the generator
+        self.error: Optional[BaseException] = None
+        self.error_trace = ""
+        # === Stats ===
+        self.resumes = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.created = time.perf_counter()
+
+    @property
+    def alive(self) -> bool:
+        return self.state not in (CoroutineTask.DONE, CoroutineTask.CANCELLED, CoroutineTask.FAILED)
+
+
+class CoroutineScheduler:
+    """
+    Runs generator coroutines from GlobalCache without resuming the idle ones every frame.
+
+    A coroutine yields a Sleep, WaitUntil or WaitForEvent request, or anything else to be resumed
+    on the next tick. Sleepers (and waits with a timeout or poll interval) are parked in a min-heap
+    keyed on their wake time and only resumed when due; conditions are checked without resuming
+    the coroutine; event waiters are resumed by signal(). Exceptions raised by a coroutine end it
+    and are kept on its task instead of propagating into the caller of tick().
+
+    Generators appended to the legacy list (GLOBAL_CACHE.Coroutines) are adopted on the next
+    tick; removing them from the list cancels them and finished ones are removed from it.
+    """
+    def __init__(self, legacy: Optional[List[Generator]] = None):
+        self.legacy = legacy if legacy is not None else []
+        self.tasks: dict[int, CoroutineTask] = {}
+        self._legacy_tasks: dict[int, CoroutineTask] = {}    # id(generator) -> task
+        self._ready: deque[CoroutineTask] = deque()
+        self._sleepers: list = []                            # (wake_at, task id, task)
+        self._waiters: list[CoroutineTask] = []
+        self._events: dict[str, list[CoroutineTask]] = {}
+        self._event_counts: dict[str, int] = {}
+        self._event_values: dict[str, object] = {}
+        self._current: Optional[CoroutineTask] = None
+        self._next_id = 1
+        self.finished: deque[CoroutineTask] = deque(maxlen=32)
+        # === Stats ===
+        self.ticks = 0
+        self.resumes = 0
+        self.condition_checks = 0
+        self.failures = 0
+        self.last_tick_ms = 0.0
+        self.max_tick_ms = 0.0
+
+    # === Task management ===
+    def spawn(self, generator: Generator, name: str = "") -> CoroutineTask:
+        """
+        Schedule a generator to run from the next tick.
+        Args:
+            generator (Generator): The coroutine.
+            name (str): Name shown in the stats, defaults to the generator function name.
+        Returns:
+            CoroutineTask: Handle for cancel() and for reading the result or error.
+        """
+        task = CoroutineTask(self._next_id, name or getattr(generator, "__name__", "coroutine"), generator)
+        self._next_id += 1
+        self.tasks[task.id] = task
+        self._ready.append(task)
+        return task
+
+    def cancel(self, task_or_name) -> int:
+        """Cancel a task, or every live task with that name. Returns the number of cancelled tasks."""
+        if isinstance(task_or_name, CoroutineTask):
+            targets = [task_or_name] if task_or_name.alive else []
+        else:
+            targets = [task for task in self.tasks.values() if task.name == task_or_name and task.alive]
+        for task in targets:
+            task.state = CoroutineTask.CANCELLED
+            if task is not self._current:
+                self._close(task)
+        return len(targets)
+
+    def cancel_all(self) -> int:
+        return sum(self.cancel(task) for task in list(self.tasks.values()))
+
+    def find(self, name: str) -> List[CoroutineTask]:
+        return [task for task in self.tasks.values() if task.name == name]
+
+    def is_running(self, name: str) -> bool:
+        return any(task.alive for task in self.tasks.values() if task.name == name)
+
+    # === Events ===
+    def signal(self, event: str, value=True) -> int:
+        """Wake every coroutine waiting for event, sending them value. Returns the number woken."""
+        self._event_counts[event] = self._event_counts.get(event, 0) + 1
+        self._event_values[event] = value
+        waiters = self._events.pop(event, [])
+        woken = 0
+        for task in waiters:
+            if task.state == CoroutineTask.EVENT:
+                self._make_ready(task, value)
+                woken += 1
+        return woken
+
+    def event_count(self, event: str) -> int:
+        return self._event_counts.get(event, 0)
+
+    def event_value(self, event: str):
+        """Value of the last signal of event."""
+        return self._event_values.get(event)
+
+    def wait_for_event(self, event: str, timeout_ms: Optional[float] = None) -> WaitForEvent:
+        """Build a WaitForEvent request that only counts signals from now on."""
+        return WaitForEvent(event, self.event_count(event), timeout_ms)
+
+    # === Tick ===
+    def tick(self):
+        start = time.perf_counter()
+        self.ticks += 1
+        self._sync_legacy()
+
+        now = time.perf_counter()
+        sleepers = self._sleepers
+        while sleepers and sleepers[0][0] <= now:
+            wake_at, _, task = heapq.heappop(sleepers)
+            if task.heap_key != wake_at or not task.alive:
+                continue                                      # stale entry (cancelled or re-parked)
+            self._wake_parked(task, now)
+
+        if self._waiters:
+            waiters, self._waiters = self._waiters, []
+            for task in waiters:
+                if task.state == CoroutineTask.WAITING and not self._check_condition(task, task.request, now):
+                    self._waiters.append(task)
+
+        ready, self._ready = self._ready, deque()
+        for task in ready:
+            if task.state == CoroutineTask.READY:
+                self._resume(task)
+
+        self.last_tick_ms = (time.perf_counter() - start) * 1000
+        self.max_tick_ms = max(self.max_tick_ms, self.last_tick_ms)
+
+    def _wake_parked(self, task: CoroutineTask, now: float):
+        request = task.request
+        if task.state == CoroutineTask.SLEEPING:
+            self._make_ready(task, None)
+        elif task.state == CoroutineTask.WAITING:
+            if not self._check_condition(task, request, now) and request.poll_ms > 0:
+                self._park(task, now + request.poll_ms / 1000.0)
+        elif task.state == CoroutineTask.EVENT and request.expired(now):
+            waiters = self._events.get(request.event)
+            if waiters and task in waiters:
+                waiters.remove(task)
+            self._make_ready(task, None)
+
+    def _check_condition(self, task: CoroutineTask, request: WaitUntil, now: float) -> bool:
+        """Make the task ready if its condition holds or timed out. Returns True when it was woken."""
+        self.condition_checks += 1
+        try:
+            satisfied = bool(request.condition())
+        except Exception as e:
+            self._fail(task, e)
+            return True
+        if satisfied:
+            self._make_ready(task, True)
+            return True
+        if request.expired(now):
+            self._make_ready(task, False)
+            return True
+        return False
+
+    def _resume(self, task: CoroutineTask):
+        value, task.send_value = task.send_value, None
+        self._current = task
+        start = time.perf_counter()
+        try:
+            request = task.generator.send(value)
+        except StopIteration as stop:
+            self._record(task, start)
+            self._finish(task, CoroutineTask.DONE, stop.value)
+            return
+        except Exception as e:
+            self._record(task, start)
+            self._fail(task, e)
+            return
+        finally:
+            self._current = None
+        self._record(task, start)
+
+        if task.state == CoroutineTask.CANCELLED:            # cancelled itself while running
+            self._close(task)
+            return
+        self._dispatch(task, request)
+
+    def _dispatch(self, task: CoroutineTask, request):
+        task.request = request
+        if isinstance(request, Sleep):
+            task.state = CoroutineTask.SLEEPING
+            self._park(task, request.wake_at)
+        elif isinstance(request, WaitUntil):
+            task.state = CoroutineTask.WAITING
+            if request.poll_ms > 0:
+                self._park(task, time.perf_counter() + request.poll_ms / 1000.0)
+            else:
+                self._waiters.append(task)
+                if request.deadline is not None:
+                    self._park(task, request.deadline)
+        elif isinstance(request, WaitForEvent):
+            if self.event_count(request.event) > request.sequence:
+                self._make_ready(task, self.event_value(request.event))   # signalled before the wait was parked
+                return
+            task.state = CoroutineTask.EVENT
+            self._events.setdefault(request.event, []).append(task)
+            if request.deadline is not None:
+                self._park(task, request.deadline)
+        else:
+            task.state = CoroutineTask.READY
+            task.request = None
+            self._ready.append(task)
+
+    def _park(self, task: CoroutineTask, wake_at: float):
+        task.heap_key = wake_at
+        heapq.heappush(self._sleepers, (wake_at, task.id, task))
+
+    def _make_ready(self, task: CoroutineTask, value):
+        if task.state == CoroutineTask.READY:
+            return
+        task.state = CoroutineTask.READY
+        task.request = None
+        task.heap_key = -1.0                                  # invalidates a pending heap entry
+        task.send_value = value
+        self._ready.append(task)
+
+    def _record(self, task: CoroutineTask, start: float):
+        elapsed = (time.perf_counter() - start) * 1000
+        task.resumes += 1
+        task.total_ms += elapsed
+        task.max_ms = max(task.max_ms, elapsed)
+        self.resumes += 1
+
+    def _fail(self, task: CoroutineTask, error: BaseException):
+        task.error = error
+        task.error_trace = traceback.format_exc()
+        self.failures += 1
+        Py4GW.Console.Log(MODULE_NAME, f"Coroutine '{task.name}' failed: {error}", Py4GW.Console.MessageType.Error)
+        Py4GW.Console.Log(MODULE_NAME, task.error_trace, Py4GW.Console.MessageType.Error)
+        self._finish(task, CoroutineTask.FAILED, None)
+
+    def _close(self, task: CoroutineTask):
+        try:
+            task.generator.close()
+        except Exception as e:
+            task.error = e
+        self._finish(task, CoroutineTask.CANCELLED, None)
+
+    def _finish(self, task: CoroutineTask, state: str, result):
+        task.state = state
+        task.result = result
+        task.request = None
+        task.heap_key = -1.0
+        self.tasks.pop(task.id, None)
+        self.finished.append(task)
+        if self._legacy_tasks.pop(id(task.generator), None) is not None:
+            try:
+                self.legacy.remove(task.generator)
+            except ValueError:
+                pass
+
+    # === GLOBAL_CACHE.Coroutines compatibility ===
+    def _sync_legacy(self):
+        legacy_tasks = self._legacy_tasks
+        if not self.legacy and not legacy_tasks:
+            return
+        present = set()
+        for generator in self.legacy:
+            key = id(generator)
+            present.add(key)
+            if key not in legacy_tasks:
+                legacy_tasks[key] = self.spawn(generator)
+        for key in [key for key in legacy_tasks if key not in present]:
+            task = legacy_tasks.pop(key)
+            self.cancel(task)
+
+    # === Stats ===
+    def get_stats(self) -> dict:
+        counts: dict[str, int] = {}
+        for task in self.tasks.values():
+            counts[task.state] = counts.get(task.state, 0) + 1
+        return {
+            "tasks": len(self.tasks),
+            "states": counts,
+            "ticks": self.ticks,
+            "resumes": self.resumes,
+            "condition_checks": self.condition_checks,
+            "failures": self.failures,
+            "last_tick_ms": self.last_tick_ms,
+            "max_tick_ms": self.max_tick_ms,
+        }
+
+    def get_task_stats(self) -> list[dict]:
+        """Per-coroutine stats of the live tasks, in spawn order."""
+        now = time.perf_counter()
+        return [
+            {
+                "id": task.id,
+                "name": task.name,
+                "state": task.state,
+                "resumes": task.resumes,
+                "total_ms": task.total_ms,
+                "max_ms": task.max_ms,
+                "age_s": now - task.created,
+                "wake_in_ms": max(0.0, (task.heap_key - now) * 1000) if task.heap_key > 0 else 0.0,
+            }
+            for task in self.tasks.values()
+        ]
@@ -1,7 +1,7 @@
 
-from Py4GWCoreLib import ThrottledTimer
 from Py4GWCoreLib.Py4GWcorelib import ActionQueueManager
 from Py4GWCoreLib import RawAgentArray
+from Py4GWCoreLib.Agent import AgentInstanceCache
 
 from .PlayerCache import PlayerCache
 from .MapCache import MapCache
@@ -17,6 +17,8 @@ from .QuestCache import QuestCache
 from .SkillCache import SkillCache
 from .SkillbarCache import SkillbarCache
 from .SharedMemory import Py4GWSharedMemoryManager
+from .CacheScheduler import CacheScheduler
+from .CoroutineScheduler import CoroutineScheduler
 
 from typing import Generator, List
 
@@ -31,7 +33,6 @@ class GlobalCache:
 
     def _init_namespaces(self):
         self._ActionQueueManager = ActionQueueManager()
-        self._TrottleTimers = self.TrottleTimers()
         self._RawAgentArray = RawAgentArray()
         self._RawItemCache = RawItemCache()
         self.Player = PlayerCache(self._ActionQueueManager)
@@ -49,7 +50,24 @@ class GlobalCache:
         self.Skill = SkillCache()
         self.SkillBar = SkillbarCache(self._ActionQueueManager)
         self.ShMem = Py4GWSharedMemoryManager()
+        self.ShMem.AttachInstances(self.Map._map_instance, self.Party._party_instance, self.Player._player_instance)
         self.Coroutines: List[Generator] = []
+        self.CoroutineScheduler = CoroutineScheduler(self.Coroutines)
+        self._Scheduler = CacheScheduler()
+        self._register_caches()
+
+    def _register_caches(self):
+        register = self._Scheduler.register
+        register("Map",           self.Map._update_cache)
+        register("Party",         self.Party._update_cache,          150, ("Map",),           refresh_while_loading=True)
+        register("Player",        self.Player._update_cache,         150,                     refresh_while_loading=True)
+        register("RawItemCache",  self._RawItemCache.update,         150,                     refresh_while_loading=True)
+        register("Item",          self.Item._update_cache,           150, ("RawItemCache",),  refresh_while_loading=True)
+        register("Camera",        self.Camera._update_cache,         150, lazy=True, target=self.Camera)
+        register("RawAgentArray", self._RawAgentArray.update,         63, ("Map", "Party"),   refresh_while_loading=True)
+        register("Agent",         self.Agent._update_cache,           63, ("RawAgentArray",), refresh_while_loading=True)
+        register("AgentArray",    self.AgentArray._update_cache,      63, ("RawAgentArray",), refresh_while_loading=True)
+        register("SkillBar",      self.SkillBar._update_cache,        63,                     refresh_while_loading=True)
         
       
     def _reset(self):
@@ -57,62 +75,19 @@ class GlobalCache:
         self.Effects._reset_cache()
         self._RawAgentArray.reset()
         self.Item._reset_cache()
-        self._TrottleTimers.Reset()
+        self._Scheduler.reset()
         
     def _update_cache(self):
-        self.Map._update_cache()
-        if self.Map.IsMapLoading() or self.Map.IsInCinematic():
-            self.Party._update_cache()
-            self.Player._update_cache()
-            self._RawItemCache.update()
-            self.Item._update_cache()
-            self._RawAgentArray.update()
-            self.Agent._update_cache()
-            self.AgentArray._update_cache()
-            self.SkillBar._update_cache()
-               
-        if self._TrottleTimers._63ms.IsExpired():
-            self._TrottleTimers._63ms.Reset()
-            if self._TrottleTimers._150ms.IsExpired():   
-                self._TrottleTimers._150ms.Reset()
-                self.Party._update_cache()
-                self.Player._update_cache()
-                self._RawItemCache.update()
-                self.Item._update_cache()
-                self.Camera._update_cache()
-
-             
-            self._RawAgentArray.update()
-            self.Agent._update_cache()
-            self.AgentArray._update_cache()
-            self.SkillBar._update_cache()
-            
-            
-                  
+        AgentInstanceCache().NewFrame()
+        self._Scheduler.tick(lambda: self.Map.IsMapLoading() or self.Map.IsInCinematic())
 
-    class TrottleTimers:
-        def __init__(self):
-            self._50ms = ThrottledTimer(50)
-            self._63ms = ThrottledTimer(63) #4 frames
-            self._75ms = ThrottledTimer(75)
-            self._100ms = ThrottledTimer(100)
-            self._150ms = ThrottledTimer(150)
-            self._250ms = ThrottledTimer(250)
-            self._500ms = ThrottledTimer(500)
-            self._1_000ms = ThrottledTimer(1000)
-            self._5_000ms = ThrottledTimer(5000)
-            self._10_000ms = ThrottledTimer(10000)         
+    def GetSchedulerStats(self) -> list[dict]:
+        """Per-subsystem refresh timings of _update_cache."""
+        return self._Scheduler.get_stats()
 
-        def Reset(self):
-            self._50ms.Reset()
-            self._63ms.Reset()
-            self._75ms.Reset()
-            self._100ms.Reset()
-            self._150ms.Reset()
-            self._250ms.Reset()
-            self._500ms.Reset()
-            self._1_000ms.Reset()
-            self._5_000ms.Reset()
-            self._10_000ms.Reset()
-    
-        
\ No newline at end of file
+    def SetCacheRefresh(self, name: str, period_ms: float | None = None, enabled: bool | None = None):
+        """Tune a subsystem refresh (e.g. SetCacheRefresh("Camera", enabled=False) when no widget reads it)."""
+        if period_ms is not None:
+            self._Scheduler.set_period(name, period_ms)
+        if enabled is not None:
+            self._Scheduler.set_enabled(name, enabled)
@@ -1,6 +1,6 @@
 import Py4GW
 from Py4GWCoreLib import ConsoleLog, Map, Party, Player, Agent, Effects, SharedCommandType, ThrottledTimer
-from ctypes import Structure, c_uint, c_float, c_bool, c_wchar
+from ctypes import Structure, c_uint, c_int, c_float, c_bool, c_wchar
 from multiprocessing import shared_memory
 from ctypes import sizeof
 from datetime import datetime, timezone
@@ -11,11 +11,13 @@ SHMEM_MAX_CHAR_LEN = 20
 SHMEM_MAX_NUMBER_OF_BUFFS = 240
 SHMEM_MAX_NUM_PLAYERS = 64
 SMM_MODULE_NAME = "Py4GW - Shared Memory"
-SHMEM_SHARED_MEMORY_FILE_NAME = "Py4GW_Shared_Mem"
+SHMEM_LAYOUT_VERSION = 2 # bump whenever AllAccounts changes, clients on another layout attach to their own segment
+SHMEM_SHARED_MEMORY_FILE_NAME = f"Py4GW_Shared_Mem_v{SHMEM_LAYOUT_VERSION}"
 SHMEM_ZERO_EPOCH = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
 SHMEM_SUBSCRIBE_TIMEOUT_MILISECONDS = 500 # milliseconds
 
 SHMEM_NUMBER_OF_SKILLS = 8
+SHMEM_MESSAGE_RING_SIZE = 64 # messages in flight per sender
 
     
 class AccountData(Structure):
@@ -54,6 +56,8 @@ class AccountData(Structure):
         ("PatyIsPartyLeader", c_bool),
         ("PlayerBuffs", c_uint * SHMEM_MAX_NUMBER_OF_BUFFS),  # Buff IDs
         ("LastUpdated", c_uint),
+        ("BuffCount", c_uint),  # Number of valid entries in PlayerBuffs
+        ("BuffVersion", c_uint),  # Odd while PlayerBuffs is being written, bumped on every change
     ]
     
 class SharedMessage(Structure):
@@ -66,6 +70,24 @@ class SharedMessage(Structure):
         ("Active", c_bool), 
         ("Running", c_bool),
         ("Timestamp", c_uint), 
+        ("SenderSlot", c_int),  # AccountData slot of the sender, -1 if unknown
+        ("ReceiverSlot", c_int),  # AccountData slot of the receiver
+        ("Sequence", c_uint),  # Outbox sequence the message was published with
+    ]
+    
+class MessageOutbox(Structure):
+    """
+    Messages sent by one account slot. Only the owning sender writes Head, Dropped, HighWater and
+    claims free entries, so concurrent senders never write the same memory.
+    An entry belongs to its receiver while Active; the receiver clears it when finished, which hands
+    it back to the sender. Receivers find their messages by rescanning an outbox when its Head moves.
+    """
+    _pack_ = 1
+    _fields_ = [
+        ("Head", c_uint),  # Sequence of the next message to publish
+        ("Dropped", c_uint),  # Messages rejected because every entry was in flight
+        ("HighWater", c_uint),  # Largest number of messages in flight observed
+        ("Messages", SharedMessage * SHMEM_MESSAGE_RING_SIZE),
     ]
     
 class HeroAIOptionStruct(Structure):
@@ -83,11 +105,18 @@ class HeroAIOptionStruct(Structure):
         ("FlagFacingAngle", c_float),
     ] 
     
+class SharedMemoryHeader(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("Generation", c_uint),  # Bumped whenever a slot changes identity, map or party
+    ]
+    
 class AllAccounts(Structure):
     _pack_ = 1
     _fields_ = [
+        ("Header", SharedMemoryHeader),
         ("AccountData", AccountData * SHMEM_MAX_NUM_PLAYERS),
-        ("SharedMessage", SharedMessage * SHMEM_MAX_NUM_PLAYERS),  # Messages for each player
+        ("Outboxes", MessageOutbox * SHMEM_MAX_NUM_PLAYERS),  # Messages sent by each player slot
         ("HeroAIOptions", HeroAIOptionStruct * SHMEM_MAX_NUM_PLAYERS),  # Game options for HeroAI
     ]
         
@@ -107,8 +136,32 @@ class Py4GWSharedMemoryManager:
             self.map_instance = Map.map_instance()
             self.party_instance = None #Party.party_instance()
             self.player_instance = None #Player.player_instance()
+            self.instances_attached = False
             self.throttle_timer_150 = ThrottledTimer(150)
             self.throttle_timer_63 = ThrottledTimer(63) # 4 frames at 15 FPS
+            self.game_struct: AllAccounts | None = None
+            
+            # === Slot index, rebuilt when Header.Generation moves ===
+            self.index_generation = -1
+            self.account_index: dict[str, int] = {}  # email -> slot
+            self.account_slots: list[int] = []
+            self.active_slots: list[int] = []
+            self.hero_index: dict[tuple[int, int], int] = {}  # (owner agent id, hero id) -> slot
+            self.heroes_by_owner: dict[int, list[int]] = {}
+            self.pet_index: dict[tuple[int, int], int] = {}  # (owner agent id, pet agent id) -> slot
+            self.pets_by_owner: dict[int, list[int]] = {}
+            self.party_number_index: dict[int, int] = {}  # party position -> first slot
+            self.party_index: dict[tuple[int, int, int, int], list[int]] = {}  # (map, region, district, party) -> account slots
+            self.map_index: dict[tuple[int, int, int], list[int]] = {}  # (map, region, district) -> party ids
+            self.published_keys: dict[int, tuple] = {}  # slot -> identity key last written by this client
+            self.agent_index: dict[int, int] = {}  # agent id -> slot
+            
+            # === Buff sets ===
+            self.published_buffs: dict[int, tuple[int, list[int]]] = {}  # slot -> (version, buff ids) last written by this client
+            self.buff_sets: dict[int, tuple[int, frozenset[int]]] = {}  # slot -> (version, buff ids) last read by this client
+            
+            # === Inboxes, local to this client ===
+            self.inboxes: dict[str, dict] = {}  # receiver email -> {"slot", "heads": sender slot -> Head scanned, "pending": [(sender slot, position, sequence)]}
         
         # Create or attach shared memory
         try:
@@ -118,14 +171,147 @@ class Py4GWSharedMemoryManager:
             self.shm = shared_memory.SharedMemory(name=self.shm_name, create=True, size=self.size)
             ConsoleLog(SMM_MODULE_NAME, "Shared memory area created.", Py4GW.Console.MessageType.Success)
 
-        # Attach the shared memory structure
-        #self.game_struct = AllAccounts.from_buffer(self.shm.buf)
+        # Attach the shared memory structure once, the view stays valid for the life of the mapping
+        self.game_struct = AllAccounts.from_buffer(self.shm.buf)
+        self.index_generation = -1
         self.ResetAllData()  # Initialize all player data
         
         self._initialized = True
     
     def GetStruct(self) -> AllAccounts:
-        return AllAccounts.from_buffer(self.shm.buf)
+        if self.game_struct is None:
+            self.game_struct = AllAccounts.from_buffer(self.shm.buf)
+        return self.game_struct
+    
+    def AttachInstances(self, map_instance, party_instance, player_instance):
+        """
+        Share the map, party and player instances the GlobalCache already refreshes,
+        so _updatechache does not fetch the same contexts a second time.
+        """
+        self.map_instance = map_instance
+        self.party_instance = party_instance
+        self.player_instance = player_instance
+        self.instances_attached = True
+        
+    #region Slot Index
+    def _BumpGeneration(self):
+        """Invalidate the slot index of every client attached to the segment."""
+        header = self.GetStruct().Header
+        header.Generation = (header.Generation + 1) & 0xFFFFFFFF
+        
+    def _SlotKey(self, player: AccountData) -> tuple:
+        return (player.IsSlotActive, player.IsAccount, player.IsHero, player.IsPet, player.AccountEmail,
+                player.OwnerPlayerID, player.HeroID, player.PlayerID,
+                player.MapID, player.MapRegion, player.MapDistrict, player.PartyID, player.PartyPosition)
+        
+    def _PublishSlotKey(self, index: int):
+        """Bump the generation only if a field the index depends on changed since this client last wrote the slot."""
+        key = self._SlotKey(self.GetStruct().AccountData[index])
+        if self.published_keys.get(index) != key:
+            self.published_keys[index] = key
+            self._BumpGeneration()
+    
+    def _EnsureIndex(self):
+        struct = self.GetStruct()
+        generation = struct.Header.Generation
+        if generation == self.index_generation:
+            return
+        
+        account_index, hero_index, pet_index, party_number_index, agent_index = {}, {}, {}, {}, {}
+        heroes_by_owner, pets_by_owner, party_index, map_index = {}, {}, {}, {}
+        account_slots, active_slots = [], []
+        
+        for i in range(self.max_num_players):
+            player = struct.AccountData[i]
+            if not player.IsSlotActive:
+                continue
+            active_slots.append(i)
+            party_number_index.setdefault(player.PartyPosition, i)
+            if player.PlayerID:
+                agent_index.setdefault(player.PlayerID, i)
+            
+            if player.IsAccount:
+                account_index.setdefault(player.AccountEmail, i)
+                account_slots.append(i)
+                map_key = (player.MapID, player.MapRegion, player.MapDistrict)
+                party_index.setdefault(map_key + (player.PartyID,), []).append(i)
+                parties = map_index.setdefault(map_key, [])
+                if player.PartyID not in parties:
+                    parties.append(player.PartyID)
+            if player.IsHero:
+                hero_index.setdefault((player.OwnerPlayerID, player.HeroID), i)
+                heroes_by_owner.setdefault(player.OwnerPlayerID, []).append(i)
+            if player.IsPet:
+                pet_index.setdefault((player.OwnerPlayerID, player.PlayerID), i)
+                pets_by_owner.setdefault(player.OwnerPlayerID, []).append(i)
+                
+        self.account_index, self.hero_index, self.pet_index = account_index, hero_index, pet_index
+        self.heroes_by_owner, self.pets_by_owner = heroes_by_owner, pets_by_owner
+        self.party_index, self.map_index, self.party_number_index = party_index, map_index, party_number_index
+        self.account_slots, self.active_slots = account_slots, active_slots
+        self.agent_index = agent_index
+        self.index_generation = generation
+    #endregion
+    
+    #region Buffs
+    def _PublishBuffs(self, index: int, slot: AccountData, agent_id: int):
+        """
+        Publish the buff and effect ids of an agent into a slot, writing only the entries that changed.
+        BuffVersion is odd while the write is in progress and ends on a new even value,
+        so readers can tell a torn or stale read from a current one.
+        """
+        effects_instance = Effects.get_instance(agent_id)
+        buff_ids = [buff.skill_id for buff in effects_instance.GetBuffs()]
+        buff_ids.extend(effect.skill_id for effect in effects_instance.GetEffects())
+        del buff_ids[SHMEM_MAX_NUMBER_OF_BUFFS:]
+        
+        version = slot.BuffVersion
+        published = self.published_buffs.get(index)
+        if published is not None and published[0] == version:
+            previous = published[1]
+            if previous == buff_ids:
+                return
+        else:
+            previous = slot.PlayerBuffs[:slot.BuffCount]  # another client wrote the slot last
+        
+        slot.BuffVersion = (version | 1) & 0xFFFFFFFF
+        buffs = slot.PlayerBuffs
+        for position, skill_id in enumerate(buff_ids):
+            if position >= len(previous) or previous[position] != skill_id:
+                buffs[position] = skill_id
+        for position in range(len(buff_ids), len(previous)):
+            buffs[position] = 0
+        slot.BuffCount = len(buff_ids)
+        version = ((version | 1) + 1) & 0xFFFFFFFF
+        slot.BuffVersion = version
+        self.published_buffs[index] = (version, buff_ids)
+        
+    def GetBuffSet(self, index: int) -> frozenset[int]:
+        """
+        Get the buff and effect ids published for a slot.
+        The set is cached per slot and only rebuilt when the slot BuffVersion changes.
+        """
+        if not (0 <= index < self.max_num_players):
+            return frozenset()
+        slot = self.GetStruct().AccountData[index]
+        version = slot.BuffVersion
+        cached = self.buff_sets.get(index)
+        if cached is not None and (cached[0] == version or version & 1):
+            return cached[1]  # unchanged, or a write is in progress
+        
+        buff_set = frozenset(slot.PlayerBuffs[:slot.BuffCount])
+        if slot.BuffVersion == version and not version & 1:
+            self.buff_sets[index] = (version, buff_set)
+        return buff_set
+    
+    def GetAgentBuffSet(self, agent_id: int) -> frozenset[int] | None:
+        """Get the published buff ids of an agent, or None if no slot publishes it."""
+        self._EnsureIndex()
+        index = self.agent_index.get(agent_id, -1)
+        if index == -1:
+            return None
+        return self.GetBuffSet(index)
+    #endregion
         
     def GetBaseTimestamp(self):
         # Return milliseconds since ZERO_EPOCH
@@ -137,6 +323,7 @@ class Py4GWSharedMemoryManager:
         for i in range(self.max_num_players):
             self.ResetPlayerData(i)
             self.ResetHeroAIData(i)
+            self.ResetOutbox(i)
         
     def ResetPlayerData(self, index):
         """Reset data for a specific player."""
@@ -174,7 +361,12 @@ class Py4GWSharedMemoryManager:
             player.PatyIsPartyLeader = False
             for j in range(SHMEM_MAX_NUMBER_OF_BUFFS):
                 player.PlayerBuffs[j] = 0
+            player.BuffCount = 0
+            player.BuffVersion = (player.BuffVersion + 2) & ~1 & 0xFFFFFFFF
+            self.published_buffs.pop(index, None)
             player.LastUpdated = self.GetBaseTimestamp()
+            self.published_keys.pop(index, None)
+            self._BumpGeneration()
             
     def ResetHeroAIData(self, index): 
             option = self.GetStruct().HeroAIOptions[index]
@@ -193,38 +385,25 @@ class Py4GWSharedMemoryManager:
 
     def FindAccount(self, account_email: str) -> int:
         """Find the index of the account with the given email."""
-        for i in range(self.max_num_players):
-            player = self.GetStruct().AccountData[i]
-            if not player.IsSlotActive:
-                continue
-            if self.GetStruct().AccountData[i].AccountEmail == account_email and player.IsAccount:
-                return i
-        return -1
+        self._EnsureIndex()
+        return self.account_index.get(account_email, -1)
     
     def FindHero(self, hero_data) -> int:
         """Find the index of the hero with the given ID."""
-        for i in range(self.max_num_players):
-            player = self.GetStruct().AccountData[i]
-            if not player.IsSlotActive:
-                continue
-            if player.IsHero and player.HeroID == hero_data.hero_id.GetID() and player.OwnerPlayerID == Party.Players.GetAgentIDByLoginNumber(hero_data.owner_player_id):
-                return i
-        return -1
+        self._EnsureIndex()
+        owner_id = Party.Players.GetAgentIDByLoginNumber(hero_data.owner_player_id)
+        return self.hero_index.get((owner_id, hero_data.hero_id.GetID()), -1)
     
     def FindPet(self, pet_data) -> int:
         """Find the index of the pet with the given ID."""
-        for i in range(self.max_num_players):
-            player = self.GetStruct().AccountData[i]
-            if not player.IsSlotActive:
-                continue
-            if player.IsPet and player.PlayerID == pet_data.agent_id and player.OwnerPlayerID == pet_data.owner_agent_id:
-                return i
-        return -1
+        self._EnsureIndex()
+        return self.pet_index.get((pet_data.owner_agent_id, pet_data.agent_id), -1)
 
     def FindEmptySlot(self) -> int:
         """Find the first empty slot in shared memory."""
+        struct = self.GetStruct()
         for i in range(self.max_num_players):
-            if not self.GetStruct().AccountData[i].IsSlotActive:
+            if not struct.AccountData[i].IsSlotActive:
                 return i
         return -1
     
@@ -233,10 +412,14 @@ class Py4GWSharedMemoryManager:
         index = self.FindAccount(account_email)
         if index == -1:
             index = self.FindEmptySlot()
+            if index == -1:
+                return -1
             player = self.GetStruct().AccountData[index]
             player.IsSlotActive = True
+            player.IsAccount = True
             player.AccountEmail = account_email
             player.LastUpdated = self.GetBaseTimestamp()
+            self._PublishSlotKey(index)
         return index
     
     def GetHeroSlot(self, hero_data) -> int:
@@ -244,12 +427,15 @@ class Py4GWSharedMemoryManager:
         index = self.FindHero(hero_data)
         if index == -1:
             index = self.FindEmptySlot()
+            if index == -1:
+                return -1
             hero = self.GetStruct().AccountData[index]
             hero.IsSlotActive = True
             hero.IsHero = True
             hero.OwnerPlayerID = Party.Players.GetAgentIDByLoginNumber(hero_data.owner_player_id)
             hero.HeroID = hero_data.hero_id.GetID()
             hero.LastUpdated = self.GetBaseTimestamp()
+            self._PublishSlotKey(index)
         return index
     
     def GetPetSlot(self, pet_data) -> int:
@@ -257,16 +443,28 @@ class Py4GWSharedMemoryManager:
         index = self.FindPet(pet_data)
         if index == -1:
             index = self.FindEmptySlot()
+            if index == -1:
+                return -1
             pet = self.GetStruct().AccountData[index]
             pet.IsSlotActive = True
             pet.IsPet = True
             pet.OwnerPlayerID = pet_data.owner_agent_id
             pet.PlayerID = pet_data.agent_id
             pet.LastUpdated = self.GetBaseTimestamp()
+            self._PublishSlotKey(index)
         return index
     
     def _updatechache(self):
         """Update the shared memory cache."""
+        if self.instances_attached:
+            # map, party and player contexts are refreshed by the GlobalCache scheduler
+            if self.map_instance.is_in_cinematic or self.map_instance.instance_type.GetName() == "Loading":
+                return
+            if self.throttle_timer_63.IsExpired():
+                self.throttle_timer_63.Reset()
+                self.player_instance.agent.GetContext()
+            return
+        
         self.map_instance.GetContext()
         if (self.map_instance.instance_type.GetName() == "Loading" or 
             self.map_instance.is_in_cinematic):
@@ -373,25 +571,8 @@ class Py4GWSharedMemoryManager:
             player.PartyID = self.party_instance.party_id
             player.PartyPosition = party_number
             player.PatyIsPartyLeader = self.party_instance.is_party_leader
-            effects_instance = Effects.get_instance(self.player_instance.id)
-            buff_list = effects_instance.GetBuffs()
-            effect_list = effects_instance.GetEffects()
-            for j in range(SHMEM_MAX_NUMBER_OF_BUFFS):
-                player.PlayerBuffs[j] = 0
-                
-            index = 0
-
-            for buff in buff_list:
-                if index >= SHMEM_MAX_NUMBER_OF_BUFFS:
-                    break
-                player.PlayerBuffs[index] = buff.skill_id
-                index += 1
-
-            for effect in effect_list:
-                if index >= SHMEM_MAX_NUMBER_OF_BUFFS:
-                    break
-                player.PlayerBuffs[index] = effect.skill_id
-                index += 1
+            self._PublishSlotKey(index)
+            self._PublishBuffs(index, player, self.player_instance.id)
             
         else:
             ConsoleLog(SMM_MODULE_NAME, "No empty slot available for new player data.", Py4GW.Console.MessageType.Error)
@@ -456,25 +637,8 @@ class Py4GWSharedMemoryManager:
             hero.PartyID = self.party_instance.party_id
             hero.PartyPosition = 0
             hero.PatyIsPartyLeader = False
-            effects_instance = Effects.get_instance(agent_id)
-            buff_list = effects_instance.GetBuffs()
-            effect_list = effects_instance.GetEffects()
-            for j in range(SHMEM_MAX_NUMBER_OF_BUFFS):
-                hero.PlayerBuffs[j] = 0
-                
-            index = 0
-
-            for buff in buff_list:
-                if index >= SHMEM_MAX_NUMBER_OF_BUFFS:
-                    break
-                hero.PlayerBuffs[index] = buff.skill_id
-                index += 1
-
-            for effect in effect_list:
-                if index >= SHMEM_MAX_NUMBER_OF_BUFFS:
-                    break
-                hero.PlayerBuffs[index] = effect.skill_id
-                index += 1
+            self._PublishSlotKey(index)
+            self._PublishBuffs(index, hero, agent_id)
             
         else:
             ConsoleLog(SMM_MODULE_NAME, "No empty slot available for new hero data.", Py4GW.Console.MessageType.Error)
@@ -529,6 +693,7 @@ class Py4GWSharedMemoryManager:
             pet.PartyPosition = 0
             pet.PatyIsPartyLeader = False  
             pet.PlayerLoginNumber = 0 
+            self._PublishSlotKey(index)
             if self.map_instance.instance_type.GetName() == "Outpost":
                 return
             pet.PlayerHP = agent_instance.living_agent.hp
@@ -543,25 +708,7 @@ class Py4GWSharedMemoryManager:
             pet.PlayerFacingAngle = agent_instance.rotation_angle
             pet.PlayerTargetID = pet_info.locked_target_id
             
-            effects_instance = Effects.get_instance(self.player_instance.id)
-            buff_list = effects_instance.GetBuffs()
-            effect_list = effects_instance.GetEffects()
-            for j in range(SHMEM_MAX_NUMBER_OF_BUFFS):
-                pet.PlayerBuffs[j] = 0
-                
-            index = 0
-
-            for buff in buff_list:
-                if index >= SHMEM_MAX_NUMBER_OF_BUFFS:
-                    break
-                pet.PlayerBuffs[index] = buff.skill_id
-                index += 1
-
-            for effect in effect_list:
-                if index >= SHMEM_MAX_NUMBER_OF_BUFFS:
-                    break
-                pet.PlayerBuffs[index] = effect.skill_id
-                index += 1
+            self._PublishBuffs(index, pet, agent_id)
             
         else:
             ConsoleLog(SMM_MODULE_NAME, "No empty slot available for new Pet data.", Py4GW.Console.MessageType.Error)
@@ -578,20 +725,15 @@ class Py4GWSharedMemoryManager:
             
     def GetAllActivePlayers(self) -> list[AccountData]:
         """Get all active players in shared memory."""
-        players = []
-        for i in range(self.max_num_players):
-            player = self.GetStruct().AccountData[i]
-            if player.IsSlotActive:
-                players.append(player)
-        return players
+        self._EnsureIndex()
+        struct = self.GetStruct()
+        return [struct.AccountData[i] for i in self.active_slots]
         
     def GetAllAccountData(self) -> list[AccountData]:
         """Get all player data, ordered by PartyID, PartyPosition, PlayerLoginNumber, CharacterName."""
-        players = []
-        for i in range(self.max_num_players):
-            player = self.GetStruct().AccountData[i]
-            if player.IsSlotActive and player.IsAccount:
-                players.append(player)
+        self._EnsureIndex()
+        struct = self.GetStruct()
+        players = [struct.AccountData[i] for i in self.account_slots]
 
         # Sort by PartyID, then PartyPosition, then PlayerLoginNumber, then CharacterName
         players.sort(key=lambda p: (
@@ -617,10 +759,10 @@ class Py4GWSharedMemoryManager:
      
     def GetAccountDataFromPartyNumber(self, party_number: int) -> AccountData | None:
         """Get player data for the account with the given party number."""
-        for i in range(self.max_num_players):
-            player = self.GetStruct().AccountData[i]
-            if player.IsSlotActive and player.PartyPosition == party_number:
-                return player
+        self._EnsureIndex()
+        index = self.party_number_index.get(party_number, -1)
+        if index != -1:
+            return self.GetStruct().AccountData[index]
         ConsoleLog(SMM_MODULE_NAME, f"Party number {party_number} not found.", Py4GW.Console.MessageType.Error)
         return None
     
@@ -629,12 +771,11 @@ class Py4GWSharedMemoryManager:
         if effect_id == 0:
             return False
         
-        player = self.GetAccountDataFromEmail(account_email)
-        if player:
-            for buff in player.PlayerBuffs:
-                if buff == effect_id:
-                    return True
-        return False
+        index = self.FindAccount(account_email)
+        if index == -1:
+            ConsoleLog(SMM_MODULE_NAME, f"Account {account_email} not found.", Py4GW.Console.MessageType.Error)
+            return False
+        return effect_id in self.GetBuffSet(index)
         
     def GetHeroAIOptions(self, account_email: str) -> HeroAIOptionStruct | None:
         """Get HeroAI options for the account with the given email."""
@@ -647,10 +788,10 @@ class Py4GWSharedMemoryManager:
         
     def GetGerHeroAIOptionsByPartyNumber(self, party_number: int) -> HeroAIOptionStruct | None:
         """Get HeroAI options for the account with the given party number."""
-        for i in range(self.max_num_players):
-            player = self.GetStruct().AccountData[i]
-            if player.IsSlotActive and player.PartyPosition == party_number:
-                return self.GetStruct().HeroAIOptions[i]
+        self._EnsureIndex()
+        index = self.party_number_index.get(party_number, -1)
+        if index != -1:
+            return self.GetStruct().HeroAIOptions[index]
         return None    
         
         
@@ -685,149 +826,287 @@ class Py4GWSharedMemoryManager:
     
     def GetMapsFromPlayers(self):
         """Get a list of unique maps from all active players."""
-        maps = set()
-        for i in range(self.max_num_players):
-            player = self.GetStruct().AccountData[i]
-            if player.IsSlotActive and player.IsAccount:
-                maps.add((player.MapID, player.MapRegion, player.MapDistrict))
-        return list(maps)
+        self._EnsureIndex()
+        return list(self.map_index)
     
     def GetPartiesFromMaps(self, map_id: int, map_region: int, map_district: int):
         """
         Get a list of unique PartyIDs for players in the specified map/region/district.
         """
-        parties = set()
-        for i in range(self.max_num_players):
-            player = self.GetStruct().AccountData[i]
-            if (player.IsSlotActive and player.IsAccount and
-                player.MapID == map_id and
-                player.MapRegion == map_region and
-                player.MapDistrict == map_district):
-                parties.add(player.PartyID)
-        return list(parties)
+        self._EnsureIndex()
+        return list(self.map_index.get((map_id, map_region, map_district), []))
 
     
     def GetPlayersFromParty(self, party_id: int, map_id: int, map_region: int, map_district: int):
         """Get a list of players in a specific party on a specific map."""
-        players = []
-        for i in range(self.max_num_players):
-            player = self.GetStruct().AccountData[i]
-            if (player.IsSlotActive and player.IsAccount and
-                player.MapID == map_id and
-                player.MapRegion == map_region and
-                player.MapDistrict == map_district and
-                player.PartyID == party_id):
-                players.append(player)
-        return players
+        self._EnsureIndex()
+        struct = self.GetStruct()
+        return [struct.AccountData[i] for i in self.party_index.get((map_id, map_region, map_district, party_id), [])]
     
     def GetHeroesFromPlayers(self, owner_player_id: int):
         """Get a list of heroes owned by the specified player."""
-        heroes = []
-        for i in range(self.max_num_players):
-            player = self.GetStruct().AccountData[i]
-            if (player.IsSlotActive and player.IsHero and
-                player.OwnerPlayerID == owner_player_id):
-                heroes.append(player)
-        return heroes
+        self._EnsureIndex()
+        struct = self.GetStruct()
+        return [struct.AccountData[i] for i in self.heroes_by_owner.get(owner_player_id, [])]
     
     def GetPetsFromPlayers(self, owner_agent_id: int):
         """Get a list of pets owned by the specified player."""
-        pets = []
-        for i in range(self.max_num_players):
-            player = self.GetStruct().AccountData[i]
-            if (player.IsSlotActive and player.IsPet and
-                player.OwnerPlayerID == owner_agent_id):
-                pets.append(player)
-        return pets
+        self._EnsureIndex()
+        struct = self.GetStruct()
+        return [struct.AccountData[i] for i in self.pets_by_owner.get(owner_agent_id, [])]
     
     def UpdateTimeouts(self):
         current_time = self.GetBaseTimestamp()
+        struct = self.GetStruct()
 
         for index in range(self.max_num_players):
-            player = self.GetStruct().AccountData[index]
+            player = struct.AccountData[index]
 
             if player.IsSlotActive:
                 delta = current_time - player.LastUpdated
                 if delta > SHMEM_SUBSCRIBE_TIMEOUT_MILISECONDS:
                     self.ResetPlayerData(index)
+                    self.ResetOutbox(index)  # the slot may be reused by another account
                     
-    def SendMessage(self, sender_email: str, receiver_email: str, command: SharedCommandType, params: tuple = (0.0, 0.0, 0.0, 0.0)):
-        """Send a message to another player."""
-        index = self.FindAccount(receiver_email)
-        if index == -1:
-            ConsoleLog(SMM_MODULE_NAME, f"Receiver account {receiver_email} not found.", Py4GW.Console.MessageType.Error)
-            return
-        
-        for i in range(self.max_num_players):
-            message = self.GetStruct().SharedMessage[i]
-            if message.Active:
-                continue  # Find the first unfinished message slot
+    def ResetOutbox(self, index: int):
+        """Drop every message sent by a player slot."""
+        if 0 <= index < self.max_num_players:
+            outbox = self.GetStruct().Outboxes[index]
+            for message in outbox.Messages:
+                self._ClearMessage(message)
+            outbox.Head = 0
+            outbox.Dropped = 0
+            outbox.HighWater = 0
+            
+    def _ClearMessage(self, message: SharedMessage):
+        message.SenderEmail = ""
+        message.ReceiverEmail = ""
+        message.Command = SharedCommandType.NoCommand
+        message.Params = (c_float * 4)(0.0, 0.0, 0.0, 0.0)
+        message.Timestamp = self.GetBaseTimestamp()
+        message.Running = False
+        message.SenderSlot = -1
+        message.ReceiverSlot = -1
+        message.Active = False  # hands the entry back to the sender once everything else is cleared
             
+    def _DecodeMessageIndex(self, message_index: int) -> tuple[int, int]:
+        """Split a message index into (sender slot, outbox position)."""
+        return divmod(message_index, SHMEM_MESSAGE_RING_SIZE)
+    
+    def _IsReceiverGone(self, message: SharedMessage) -> bool:
+        """True when the account a message was sent to no longer holds its slot, so nobody will finish it."""
+        if not (0 <= message.ReceiverSlot < self.max_num_players):
+            return True
+        receiver = self.GetStruct().AccountData[message.ReceiverSlot]
+        return not receiver.IsSlotActive or receiver.AccountEmail != message.ReceiverEmail
+    
+    def _PublishMessages(self, sender_slot: int, sender_email: str, receiver_slot: int, receiver_email: str, commands: list) -> int:
+        """
+        Write as many (command, params) pairs as there are free entries in the sender outbox and publish them
+        with a single Head update. Entries still held by a receiver that left are reclaimed.
+        Returns the number of messages published.
+        """
+        if sender_slot == -1:
+            ConsoleLog(SMM_MODULE_NAME, f"Sender account {sender_email} not found, {len(commands)} message(s) dropped.", Py4GW.Console.MessageType.Error)
+            return 0
+        
+        outbox = self.GetStruct().Outboxes[sender_slot]
+        messages = outbox.Messages
+        free = [position for position in range(SHMEM_MESSAGE_RING_SIZE)
+                if not messages[position].Active or self._IsReceiverGone(messages[position])]
+        count = min(len(commands), len(free))
+        head = outbox.Head
+        timestamp = self.GetBaseTimestamp()
+        
+        for offset in range(count):
+            command, params = commands[offset]
+            message = messages[free[offset]]
+            message.Active = False
             message.SenderEmail = sender_email
             message.ReceiverEmail = receiver_email
+            message.SenderSlot = sender_slot
+            message.ReceiverSlot = receiver_slot
             message.Command = command.value
             message.Params = (c_float * 4)(*params)
-            message.Active = True
             message.Running = False
-            message.Timestamp = self.GetBaseTimestamp()
-            return
+            message.Timestamp = timestamp
+            message.Sequence = (head + offset) & 0xFFFFFFFF
+            message.Active = True  # the payload is complete before the entry is flagged
+            
+        if count:
+            outbox.Head = (head + count) & 0xFFFFFFFF  # publish the whole batch at once
+            in_flight = SHMEM_MESSAGE_RING_SIZE - len(free) + count
+            if in_flight > outbox.HighWater:
+                outbox.HighWater = in_flight
+        
+        dropped = len(commands) - count
+        if dropped:
+            outbox.Dropped += dropped
+            ConsoleLog(SMM_MODULE_NAME, f"Outbox of {sender_email} is full, {dropped} message(s) to {receiver_email} dropped.", Py4GW.Console.MessageType.Warning)
+        return count
+                    
+    def SendMessage(self, sender_email: str, receiver_email: str, command: SharedCommandType, params: tuple = (0.0, 0.0, 0.0, 0.0)) -> int:
+        """
+        Send a message to another player.
+        Returns the message index, or -1 when an account is unknown or the sender outbox is full.
+        """
+        index = self.FindAccount(receiver_email)
+        if index == -1:
+            ConsoleLog(SMM_MODULE_NAME, f"Receiver account {receiver_email} not found.", Py4GW.Console.MessageType.Error)
+            return -1
+        
+        sender_slot = self.FindAccount(sender_email)
+        if not self._PublishMessages(sender_slot, sender_email, index, receiver_email, [(command, params)]):
+            return -1
+        outbox = self.GetStruct().Outboxes[sender_slot]
+        sequence = (outbox.Head - 1) & 0xFFFFFFFF
+        for position in range(SHMEM_MESSAGE_RING_SIZE):
+            message = outbox.Messages[position]
+            if message.Active and message.Sequence == sequence:
+                return sender_slot * SHMEM_MESSAGE_RING_SIZE + position
+        return -1
+    
+    def SendMessages(self, sender_email: str, receiver_email: str, commands: list[tuple[SharedCommandType, tuple]]) -> int:
+        """
+        Send a batch of (command, params) messages to one player, published together.
+        Returns the number of messages queued, messages that do not fit are dropped and counted.
+        """
+        index = self.FindAccount(receiver_email)
+        if index == -1:
+            ConsoleLog(SMM_MODULE_NAME, f"Receiver account {receiver_email} not found.", Py4GW.Console.MessageType.Error)
+            return 0
+        return self._PublishMessages(self.FindAccount(sender_email), sender_email, index, receiver_email, commands)
+    
+    def BroadcastMessage(self, sender_email: str, command: SharedCommandType, params: tuple = (0.0, 0.0, 0.0, 0.0), include_self: bool = True) -> int:
+        """
+        Send the same message to every active account.
+        Returns the number of accounts the message was queued for.
+        """
+        struct = self.GetStruct()
+        sender_slot = self.FindAccount(sender_email)
+        sent = 0
+        for i in self.account_slots:
+            player = struct.AccountData[i]
+            if not include_self and i == sender_slot:
+                continue
+            sent += self._PublishMessages(sender_slot, sender_email, i, player.AccountEmail, [(command, params)])
+        return sent
+    
+    def _RefreshInbox(self, account_email: str, index: int) -> list:
+        """
+        Collect the messages sent to an account. An outbox is only rescanned when its Head moved since
+        the last pass; messages of one sender keep their publish order.
+        """
+        inbox = self.inboxes.get(account_email)
+        if inbox is None or inbox["slot"] != index:
+            inbox = self.inboxes[account_email] = {"slot": index, "heads": {}, "pending": []}
+        heads, pending = inbox["heads"], inbox["pending"]
+        
+        outboxes = self.GetStruct().Outboxes
+        for sender_slot in self.account_slots:
+            outbox = outboxes[sender_slot]
+            head = outbox.Head
+            if heads.get(sender_slot) == head:
+                continue
+            heads[sender_slot] = head
+            known = {(slot, sequence) for slot, _, sequence in pending}
+            found = []
+            for position in range(SHMEM_MESSAGE_RING_SIZE):
+                message = outbox.Messages[position]
+                if (message.Active and message.ReceiverSlot == index and (sender_slot, message.Sequence) not in known
+                        and message.ReceiverEmail == account_email):
+                    found.append((sender_slot, position, message.Sequence))
+            found.sort(key=lambda entry: (entry[2] - head) & 0xFFFFFFFF)  # oldest first, across the wrap
+            pending.extend(found)
+        return pending
+    
+    def _IterPendingMessages(self, account_email: str, index: int):
+        """Yield (message index, message) for every unfinished message sent to an account, oldest first."""
+        pending = self._RefreshInbox(account_email, index)
+        outboxes = self.GetStruct().Outboxes
+        live = []
+        for entry in pending:
+            sender_slot, position, sequence = entry
+            message = outboxes[sender_slot].Messages[position]
+            if message.Active and message.Sequence == sequence and message.ReceiverSlot == index:
+                live.append(entry)
+        pending[:] = live  # finished or reclaimed entries are dropped
+        for sender_slot, position, _ in live:
+            yield sender_slot * SHMEM_MESSAGE_RING_SIZE + position, outboxes[sender_slot].Messages[position]
      
     def GetNextMessage(self, account_email: str) -> tuple[int, SharedMessage | None]:
         """Read the next message for the given account."""
-        for index in range(self.max_num_players):
-            message = self.GetStruct().SharedMessage[index]
-            if message.ReceiverEmail == account_email and message.Active and not message.Running:
-                return index, message
+        index = self.FindAccount(account_email)
+        if index == -1:
+            return -1, None
+        for message_index, message in self._IterPendingMessages(account_email, index):
+            if not message.Running:
+                return message_index, message
         return -1, None  # Return an empty message if no messages are found
     
+    def GetPendingMessages(self, account_email: str, include_running: bool = False) -> list[tuple[int, SharedMessage]]:
+        """Get every queued message for the given account in one pass, oldest first."""
+        index = self.FindAccount(account_email)
+        if index == -1:
+            return []
+        return [(message_index, message) for message_index, message in self._IterPendingMessages(account_email, index)
+                if include_running or not message.Running]
+    
     def PreviewNextMessage(self, account_email: str, include_running: bool = True) -> tuple[int, SharedMessage | None]:
         """Preview the next message for the given account.
         If include_running is True, will also return a running message."""
-        for index in range(self.max_num_players):
-            message = self.GetStruct().SharedMessage[index]
-            if message.ReceiverEmail != account_email or not message.Active:
-                continue
+        index = self.FindAccount(account_email)
+        if index == -1:
+            return -1, None
+        for message_index, message in self._IterPendingMessages(account_email, index):
             if not message.Running or include_running:
-                return index, message
+                return message_index, message
         return -1, None
-
+    
+    def GetMailboxStats(self, account_email: str) -> tuple[int, int, int, int]:
+        """
+        Backpressure figures for the given account.
+        Returns (pending messages sent to it, outbox capacity, messages it could not send, peak messages it had in flight).
+        """
+        index = self.FindAccount(account_email)
+        if index == -1:
+            return 0, SHMEM_MESSAGE_RING_SIZE, 0, 0
+        pending = sum(1 for _ in self._IterPendingMessages(account_email, index))
+        outbox = self.GetStruct().Outboxes[index]
+        return pending, SHMEM_MESSAGE_RING_SIZE, outbox.Dropped, outbox.HighWater
+    
+    def _GetOwnedMessage(self, account_email: str, message_index: int) -> SharedMessage | None:
+        slot, position = self._DecodeMessageIndex(message_index)
+        if not (0 <= slot < self.max_num_players):
+            ConsoleLog(SMM_MODULE_NAME, f"Invalid message index: {message_index}.", Py4GW.Console.MessageType.Error)
+            return None
+        message = self.GetStruct().Outboxes[slot].Messages[position]
+        if not message.Active or message.ReceiverEmail != account_email:
+            ConsoleLog(SMM_MODULE_NAME, f"Message at index {message_index} does not belong to {account_email}.", Py4GW.Console.MessageType.Error)
+            return None
+        return message
     
     def MarkMessageAsRunning(self, account_email: str, message_index: int):
         """Mark a specific message as running."""
-        if 0 <= message_index < self.max_num_players:
-            message = self.GetStruct().SharedMessage[message_index]
-            if message.ReceiverEmail == account_email:
-                message.Running = True
-                message.Active = True
-                message.Timestamp = self.GetBaseTimestamp()
-            else:
-                ConsoleLog(SMM_MODULE_NAME, f"Message at index {message_index} does not belong to {account_email}.", Py4GW.Console.MessageType.Error)
-        else:
-            ConsoleLog(SMM_MODULE_NAME, f"Invalid message index: {message_index}.", Py4GW.Console.MessageType.Error)
+        message = self._GetOwnedMessage(account_email, message_index)
+        if message is not None:
+            message.Running = True
+            message.Timestamp = self.GetBaseTimestamp()
             
     def MarkMessageAsFinished(self, account_email: str, message_index: int):
-        """Mark a specific message as finished."""
-        if 0 <= message_index < self.max_num_players:
-            message = self.GetStruct().SharedMessage[message_index]
-            if message.ReceiverEmail == account_email:
-                message.SenderEmail = ""
-                message.ReceiverEmail = ""
-                message.Command = SharedCommandType.NoCommand
-                message.Params = (c_float * 4)(0.0, 0.0, 0.0, 0.0)
-                message.Timestamp = self.GetBaseTimestamp()
-                message.Running = False
-                message.Active = False
-            else:
-                ConsoleLog(SMM_MODULE_NAME, f"Message at index {message_index} does not belong to {account_email}.", Py4GW.Console.MessageType.Error)
-        else:
-            ConsoleLog(SMM_MODULE_NAME, f"Invalid message index: {message_index}.", Py4GW.Console.MessageType.Error)
+        """Mark a specific message as finished, handing its entry back to the sender."""
+        message = self._GetOwnedMessage(account_email, message_index)
+        if message is not None:
+            self._ClearMessage(message)
             
     def GetAllMessages(self) -> list[tuple[int, SharedMessage]]:
-        """Get all messages in shared memory with their index."""
+        """Get all messages in shared memory with their index, per sender in publish order."""
         messages = []
-        for index in range(self.max_num_players):
-            message = self.GetStruct().SharedMessage[index]
-            if message.Active:
-                messages.append((index, message))  # Add index and message
+        outboxes = self.GetStruct().Outboxes
+        for sender_slot in range(self.max_num_players):
+            outbox = outboxes[sender_slot]
+            head = outbox.Head
+            in_flight = [(position, message) for position, message in enumerate(outbox.Messages) if message.Active]
+            in_flight.sort(key=lambda entry: (entry[1].Sequence - head) & 0xFFFFFFFF)
+            messages.extend((sender_slot * SHMEM_MESSAGE_RING_SIZE + position, message) for position, message in in_flight)
         return messages
-
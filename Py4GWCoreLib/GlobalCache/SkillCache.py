@@ -1,9 +1,13 @@
 import PySkill
 from typing import Dict
+from .SkillTable import (SkillTable, SKILL_FLAG_TOUCH_RANGE, SKILL_FLAG_ELITE, SKILL_FLAG_HALF_RANGE, SKILL_FLAG_PVP,
+                         SKILL_FLAG_PVE, SKILL_FLAG_PLAYABLE, SKILL_FLAG_STACKING, SKILL_FLAG_NON_STACKING, SKILL_FLAG_UNUSED)
 
 class SkillCache:
     def __init__(self):
         self.skill_cache: Dict[int, PySkill.Skill] = {}
+        self.Table = SkillTable()
+        self._table_requested = False
         self.Data = self._Data(self)
         self.Attribute = self._Attribute(self)
         self.Flags = self._Flags(self)
@@ -21,6 +25,15 @@ class SkillCache:
 
         return PySkill.Skill(0)
     
+    def _get_table(self, skill_id: int) -> SkillTable | None:
+        """The precomputed skill table if it covers skill_id, loaded on first use."""
+        if not self._table_requested:
+            self._table_requested = True
+            self.Table.Load()
+        if self.Table.loaded and 0 <= skill_id < self.Table.max_skills:
+            return self.Table
+        return None
+    
     def GetName(self, skill_id: int) -> str:
         skill = self._get_skill_instance(skill_id)
         if skill.id.id == 0:
@@ -33,6 +46,10 @@ class SkillCache:
         return cached_skill.id.id
         
     def GetType(self, skill_id):
+        table = self._get_table(skill_id)
+        if table is not None and table.IsValid(skill_id):
+            type_id = table.type[skill_id]
+            return type_id, table.type_names.get(type_id, "")
         skill = self._get_skill_instance(skill_id)
         return skill.type.id, skill.type.GetName()
     
@@ -41,6 +58,10 @@ class SkillCache:
         return skill.campaign.ToInt(), skill.campaign.GetName()
     
     def GetProfession(self, skill_id):
+        table = self._get_table(skill_id)
+        if table is not None and table.IsValid(skill_id):
+            profession = table.profession[skill_id]
+            return profession, table.profession_names.get(profession, "")
         skill = self._get_skill_instance(skill_id)
         if skill is None:
             return 0, ""
@@ -54,24 +75,39 @@ class SkillCache:
             return self._parent._get_skill_instance(skill_id)
             
         def GetCombo(self, skill_id) -> int:
+            table = self._parent._get_table(skill_id)
+            if table is not None:
+                return table.combo[skill_id]
             skill = self._get_skill_instance(skill_id)
             return skill.combo
     
         def GetComboReq(self, skill_id) -> int:
+            table = self._parent._get_table(skill_id)
+            if table is not None:
+                return table.combo_req[skill_id]
             skill = self._get_skill_instance(skill_id)
             return skill.combo_req
         
         def GetWeaponReq(self, skill_id) -> int:
+            table = self._parent._get_table(skill_id)
+            if table is not None:
+                return table.weapon_req[skill_id]
             skill = self._get_skill_instance(skill_id)
             return skill.weapon_req
         
         def GetOvercast(self, skill_id) -> int:
+            table = self._parent._get_table(skill_id)
+            if table is not None:
+                return table.overcast[skill_id]
             skill = self._get_skill_instance(skill_id)
             return skill.overcast
         
         def GetEnergyCost(self, skill_id) -> int:
-            skill = self._get_skill_instance(skill_id)
-            cost = skill.energy_cost
+            table = self._parent._get_table(skill_id)
+            if table is not None:
+                cost = table.energy_cost[skill_id]
+            else:
+                cost = self._get_skill_instance(skill_id).energy_cost
             if cost == 11:
                 return 15
             elif cost == 12:
@@ -79,22 +115,37 @@ class SkillCache:
             return cost
         
         def GetHealthCost(self, skill_id) -> int:
+            table = self._parent._get_table(skill_id)
+            if table is not None:
+                return table.health_cost[skill_id]
             skill = self._get_skill_instance(skill_id)
             return skill.health_cost
 
         def GetAdrenaline(self, skill_id) -> int:
+            table = self._parent._get_table(skill_id)
+            if table is not None:
+                return table.adrenaline[skill_id]
             skill = self._get_skill_instance(skill_id)
             return skill.adrenaline
         
         def GetActivation(self, skill_id) -> float:
+            table = self._parent._get_table(skill_id)
+            if table is not None:
+                return table.activation[skill_id]
             skill = self._get_skill_instance(skill_id)
             return skill.activation
         
         def GetAftercast(self, skill_id) -> float:
+            table = self._parent._get_table(skill_id)
+            if table is not None:
+                return table.aftercast[skill_id]
             skill = self._get_skill_instance(skill_id)
             return skill.aftercast
         
         def GetRecharge(self, skill_id) -> int:
+            table = self._parent._get_table(skill_id)
+            if table is not None:
+                return table.recharge[skill_id]
             skill = self._get_skill_instance(skill_id)
             return skill.recharge
         
@@ -103,6 +154,9 @@ class SkillCache:
             return skill.recharge2
         
         def GetAoERange(self, skill_id) -> float:
+            table = self._parent._get_table(skill_id)
+            if table is not None:
+                return table.aoe_range[skill_id]
             skill = self._get_skill_instance(skill_id)
             return skill.aoe_range
         
@@ -143,158 +197,162 @@ class SkillCache:
             
         def _get_skill_instance(self, skill_id) -> PySkill.Skill:
             return self._parent._get_skill_instance(skill_id)
+        
+        def _is_type(self, skill_id, type_name: str) -> bool:
+            table = self._parent._get_table(skill_id)
+            if table is not None:
+                return table.IsType(skill_id, type_name)
+            return self._get_skill_instance(skill_id).type.GetName() == type_name
             
         def IsTouchRange(self, skill_id) -> bool:
+            table = self._parent._get_table(skill_id)
+            if table is not None:
+                return table.HasFlag(skill_id, SKILL_FLAG_TOUCH_RANGE)
             skill = self._get_skill_instance(skill_id)
             return skill.is_touch_range
         
         def IsElite(self, skill_id) -> bool:
+            table = self._parent._get_table(skill_id)
+            if table is not None:
+                return table.HasFlag(skill_id, SKILL_FLAG_ELITE)
             skill = self._get_skill_instance(skill_id)
             return skill.is_elite
         
         def IsHalfRange(self, skill_id) -> bool:
+            table = self._parent._get_table(skill_id)
+            if table is not None:
+                return table.HasFlag(skill_id, SKILL_FLAG_HALF_RANGE)
             skill = self._get_skill_instance(skill_id)
             return skill.is_half_range
         
         def IsPvP(self, skill_id) -> bool:
+            table = self._parent._get_table(skill_id)
+            if table is not None:
+                return table.HasFlag(skill_id, SKILL_FLAG_PVP)
             skill = self._get_skill_instance(skill_id)
             return skill.is_pvp
         
         def IsPvE(self, skill_id) -> bool:
+            table = self._parent._get_table(skill_id)
+            if table is not None:
+                return table.HasFlag(skill_id, SKILL_FLAG_PVE)
             skill = self._get_skill_instance(skill_id)
             return skill.is_pve
         
         def IsPlayable(self, skill_id) -> bool:
+            table = self._parent._get_table(skill_id)
+            if table is not None:
+                return table.HasFlag(skill_id, SKILL_FLAG_PLAYABLE)
             skill = self._get_skill_instance(skill_id)
             return skill.is_playable
         
         def IsStacking(self, skill_id) -> bool:
+            table = self._parent._get_table(skill_id)
+            if table is not None:
+                return table.HasFlag(skill_id, SKILL_FLAG_STACKING)
             skill = self._get_skill_instance(skill_id)
             return skill.is_stacking
         
         def IsNonStacking(self, skill_id) -> bool:
+            table = self._parent._get_table(skill_id)
+            if table is not None:
+                return table.HasFlag(skill_id, SKILL_FLAG_NON_STACKING)
             skill = self._get_skill_instance(skill_id)
             return skill.is_non_stacking
         
         def IsUnused(self, skill_id) -> bool:
+            table = self._parent._get_table(skill_id)
+            if table is not None:
+                return table.HasFlag(skill_id, SKILL_FLAG_UNUSED)
             skill = self._get_skill_instance(skill_id)
             return skill.is_unused
         
         def IsHex(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "Hex"
+            return self._is_type(skill_id, "Hex")
             
         def IsBounty(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "Bounty"
+            return self._is_type(skill_id, "Bounty")
         
         def IsScroll(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "Scroll"
+            return self._is_type(skill_id, "Scroll")
         
         def IsStance(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "Stance"
+            return self._is_type(skill_id, "Stance")
         
         def IsSpell(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "Spell"
+            return self._is_type(skill_id, "Spell")
         
         def IsEnchantment(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "Enchantment"
+            return self._is_type(skill_id, "Enchantment")
         
         def IsSignet(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "Signet"
+            return self._is_type(skill_id, "Signet")
         
         def IsCondition(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "Condition"
+            return self._is_type(skill_id, "Condition")
         
         def IsWell(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "Well"
+            return self._is_type(skill_id, "Well")
         
         def IsSkill(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "Skill"
+            return self._is_type(skill_id, "Skill")
         
         def IsWard(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "Ward"
+            return self._is_type(skill_id, "Ward")
         
         def IsGlyph(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "Glyph"
+            return self._is_type(skill_id, "Glyph")
         
         def IsTitle(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "Title"
+            return self._is_type(skill_id, "Title")
         
         def IsAttack(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "Attack"
+            return self._is_type(skill_id, "Attack")
         
         def IsShout(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "Shout"
+            return self._is_type(skill_id, "Shout")
         
         def IsSkill2(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "Skill2"
+            return self._is_type(skill_id, "Skill2")
         
         def IsPassive(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "Passive"
+            return self._is_type(skill_id, "Passive")
         
         def IsEnvironmental(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "Environmental"
+            return self._is_type(skill_id, "Environmental")
         
         def IsPreparation(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "Preparation"
+            return self._is_type(skill_id, "Preparation")
         
         def IsPetAttack(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "PetAttack"
+            return self._is_type(skill_id, "PetAttack")
         
         def IsTrap(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "Trap"
+            return self._is_type(skill_id, "Trap")
         
         def IsRitual(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "Ritual"
+            return self._is_type(skill_id, "Ritual")
         
         def IsEnvironmentalTrap(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "EnvironmentalTrap"
+            return self._is_type(skill_id, "EnvironmentalTrap")
         
         def IsItemSpell(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "ItemSpell"
+            return self._is_type(skill_id, "ItemSpell")
         
         def IsWeaponSpell(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "WeaponSpell"
+            return self._is_type(skill_id, "WeaponSpell")
         
         def IsForm(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "Form"
+            return self._is_type(skill_id, "Form")
         
         def IsChant(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "Chant"
+            return self._is_type(skill_id, "Chant")
         
         def IsEchoRefrain(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "EchoRefrain"
+            return self._is_type(skill_id, "EchoRefrain")
         
         def IsDisguise(self, skill_id) -> bool:
-            skill = self._get_skill_instance(skill_id)
-            return skill.type.GetName() == "Disguise"
+            return self._is_type(skill_id, "Disguise")
         
     class _Animations:
         def __init__(self, parent):
@@ -0,0 +1,220 @@
+import PySkill
+import Py4GW
+import os
+import json
+import mmap
+import struct
+from array import array
+
+SKILL_TABLE_MODULE_NAME = "Skill Table"
+SKILL_TABLE_FILE_NAME = os.path.join(os.path.dirname(os.path.abspath(__file__)), "skill_table.bin")
+SKILL_TABLE_MAGIC = b"P4GWSKL\0"
+SKILL_TABLE_VERSION = 1  # bump whenever the columns or their meaning change
+SKILL_TABLE_MAX_SKILLS = 3433
+SKILL_TABLE_HEADER = struct.Struct("<8sIII")  # magic, version, skill count, metadata length
+
+# === Flag bits ===
+SKILL_FLAG_VALID = 1 << 0
+SKILL_FLAG_TOUCH_RANGE = 1 << 1
+SKILL_FLAG_ELITE = 1 << 2
+SKILL_FLAG_HALF_RANGE = 1 << 3
+SKILL_FLAG_PVP = 1 << 4
+SKILL_FLAG_PVE = 1 << 5
+SKILL_FLAG_PLAYABLE = 1 << 6
+SKILL_FLAG_STACKING = 1 << 7
+SKILL_FLAG_NON_STACKING = 1 << 8
+SKILL_FLAG_UNUSED = 1 << 9
+
+# (column, typecode, PySkill.Skill attribute)
+SKILL_TABLE_COLUMNS = (
+    ("energy_cost", "i", "energy_cost"),
+    ("health_cost", "i", "health_cost"),
+    ("adrenaline", "i", "adrenaline"),
+    ("overcast", "i", "overcast"),
+    ("activation", "f", "activation"),
+    ("aftercast", "f", "aftercast"),
+    ("recharge", "i", "recharge"),
+    ("aoe_range", "f", "aoe_range"),
+    ("combo", "i", "combo"),
+    ("combo_req", "i", "combo_req"),
+    ("weapon_req", "i", "weapon_req"),
+    ("type", "B", None),
+    ("profession", "B", None),
+    ("flags", "I", None),
+)
+
+_FLAG_ATTRIBUTES = (
+    (SKILL_FLAG_TOUCH_RANGE, "is_touch_range"),
+    (SKILL_FLAG_ELITE, "is_elite"),
+    (SKILL_FLAG_HALF_RANGE, "is_half_range"),
+    (SKILL_FLAG_PVP, "is_pvp"),
+    (SKILL_FLAG_PVE, "is_pve"),
+    (SKILL_FLAG_PLAYABLE, "is_playable"),
+    (SKILL_FLAG_STACKING, "is_stacking"),
+    (SKILL_FLAG_NON_STACKING, "is_non_stacking"),
+    (SKILL_FLAG_UNUSED, "is_unused"),
+)
+
+
+def _aligned(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+class SkillTable:
+    """
+    Static skill metadata for every skill id, stored column-wise in typed arrays.
+    The table is built once from PySkill, persisted to a versioned binary file and memory-mapped
+    read-only on startup, so every client of a multibox setup shares the same pages.
+    Lookups are plain array indexing: table.energy_cost[skill_id].
+    """
+    def __init__(self, file_name: str = SKILL_TABLE_FILE_NAME, max_skills: int = SKILL_TABLE_MAX_SKILLS):
+        self.file_name = file_name
+        self.max_skills = max_skills
+        self.loaded = False
+        self.type_names: dict[int, str] = {}
+        self.type_ids: dict[str, int] = {}
+        self.profession_names: dict[int, str] = {}
+        self._mmap: mmap.mmap | None = None
+        for column, typecode, _ in SKILL_TABLE_COLUMNS:
+            setattr(self, column, array(typecode))
+
+    def Load(self, rebuild: bool = False) -> bool:
+        """
+        Map the table file, building and persisting it first if it is missing, outdated or rebuild is set.
+        Returns True if the table is usable.
+        """
+        if self.loaded and not rebuild:
+            return True
+        try:
+            if not rebuild and self._map_file() and self._matches_game():
+                return True
+            self.Close()
+            self._build()
+        except Exception as e:
+            Py4GW.Console.Log(SKILL_TABLE_MODULE_NAME, f"Failed to build skill table: {e}", Py4GW.Console.MessageType.Error)
+            return False
+        
+        try:
+            self._write_file()
+            self._map_file()
+        except Exception as e:
+            # another client may still map the old file, the in-memory columns of this build stay in use
+            Py4GW.Console.Log(SKILL_TABLE_MODULE_NAME, f"Skill table not persisted: {e}", Py4GW.Console.MessageType.Warning)
+        return True
+
+    def Rebuild(self):
+        """Discard the loaded table and build it again from PySkill."""
+        self.Close()
+        self.Load(rebuild=True)
+
+    def Close(self):
+        for column, typecode, _ in SKILL_TABLE_COLUMNS:
+            setattr(self, column, array(typecode))  # drop the views before the mapping
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self.loaded = False
+
+    def IsValid(self, skill_id: int) -> bool:
+        return 0 < skill_id < len(self.flags) and bool(self.flags[skill_id] & SKILL_FLAG_VALID)
+
+    def HasFlag(self, skill_id: int, flag: int) -> bool:
+        return 0 <= skill_id < len(self.flags) and bool(self.flags[skill_id] & flag)
+
+    def IsType(self, skill_id: int, type_name: str) -> bool:
+        type_id = self.type_ids.get(type_name)
+        return type_id is not None and self.IsValid(skill_id) and self.type[skill_id] == type_id
+
+    def _matches_game(self, samples: int = 4) -> bool:
+        """Spot-check a few persisted entries against PySkill to catch a table left behind by a game update."""
+        step = max(self.max_skills // samples, 1)
+        for skill_id in range(step // 2, self.max_skills, step):
+            skill = PySkill.Skill(skill_id)
+            if (skill.id.id != 0) != self.IsValid(skill_id):
+                return False
+            if skill.id.id != 0 and (skill.energy_cost != self.energy_cost[skill_id] or
+                                     skill.type.id != self.type[skill_id]):
+                return False
+        return True
+
+    # === Build ===
+    def _build(self):
+        columns = {column: array(typecode, bytes(array(typecode).itemsize * self.max_skills))
+                   for column, typecode, _ in SKILL_TABLE_COLUMNS}
+        type_names, profession_names = {}, {}
+
+        for skill_id in range(1, self.max_skills):
+            skill = PySkill.Skill(skill_id)
+            if skill.id.id == 0:
+                continue
+            for column, _, attribute in SKILL_TABLE_COLUMNS:
+                if attribute is not None:
+                    columns[column][skill_id] = getattr(skill, attribute)
+            type_id = skill.type.id
+            profession_id = skill.profession.ToInt()
+            columns["type"][skill_id] = type_id
+            columns["profession"][skill_id] = profession_id
+            type_names.setdefault(type_id, skill.type.GetName())
+            profession_names.setdefault(profession_id, skill.profession.GetName())
+
+            flags = SKILL_FLAG_VALID
+            for flag, attribute in _FLAG_ATTRIBUTES:
+                if getattr(skill, attribute):
+                    flags |= flag
+            columns["flags"][skill_id] = flags
+
+        for column, values in columns.items():
+            setattr(self, column, values)
+        self._set_names(type_names, profession_names)
+        self.loaded = True
+
+    def _set_names(self, type_names: dict, profession_names: dict):
+        self.type_names = {int(k): v for k, v in type_names.items()}
+        self.type_ids = {v: k for k, v in self.type_names.items()}
+        self.profession_names = {int(k): v for k, v in profession_names.items()}
+
+    # === Persistence ===
+    def _write_file(self):
+        metadata = json.dumps({"type_names": self.type_names, "profession_names": self.profession_names}).encode("utf-8")
+        temp_name = f"{self.file_name}.{os.getpid()}.tmp"
+        with open(temp_name, "wb") as f:
+            f.write(SKILL_TABLE_HEADER.pack(SKILL_TABLE_MAGIC, SKILL_TABLE_VERSION, self.max_skills, len(metadata)))
+            f.write(metadata)
+            for column, _, _ in SKILL_TABLE_COLUMNS:
+                f.write(bytes(_aligned(f.tell()) - f.tell()))
+                f.write(getattr(self, column).tobytes())
+        os.replace(temp_name, self.file_name)  # other clients only ever see a complete file
+
+    def _map_file(self) -> bool:
+        if not os.path.exists(self.file_name) or os.path.getsize(self.file_name) < SKILL_TABLE_HEADER.size:
+            return False
+        with open(self.file_name, "rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, metadata_length = SKILL_TABLE_HEADER.unpack_from(mapping, 0)
+        if magic != SKILL_TABLE_MAGIC or version != SKILL_TABLE_VERSION or count != self.max_skills:
+            mapping.close()
+            return False
+
+        offset = SKILL_TABLE_HEADER.size
+        metadata = json.loads(bytes(mapping[offset:offset + metadata_length]).decode("utf-8"))
+        offset += metadata_length
+
+        view = memoryview(mapping)
+        columns = {}
+        for column, typecode, _ in SKILL_TABLE_COLUMNS:
+            offset = _aligned(offset)
+            size = array(typecode).itemsize * count
+            if offset + size > len(mapping):
+                view.release()
+                mapping.close()
+                return False
+            columns[column] = view[offset:offset + size].cast(typecode)  # zero-copy, read-only
+            offset += size
+
+        for column, values in columns.items():
+            setattr(self, column, values)
+        self._set_names(metadata.get("type_names", {}), metadata.get("profession_names", {}))
+        self._mmap = mapping
+        self.loaded = True
+        return True
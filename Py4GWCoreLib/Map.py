@@ -6,10 +6,69 @@ import PyOverlay
 from .enums import outposts, outpost_name_to_id, explorables, explorable_name_to_id, FlagPreference
 from .UIManager import *
 from .Overlay import *
+from .Pathfinding import NavMesh, Pathfinder, SavePathingMaps
+from .PathingGeometry import PathingGeometry, PathingGeometryStore
+from typing import List, Optional, Tuple
 from collections import deque
 import time
 import math
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class ScreenProjection:
+    """
+    Affine game <-> screen projection frozen at construction:
+        screen_x = m00 * x + m01 * y + tx
+        screen_y = m10 * x + m11 * y + ty
+    Subclasses snapshot the map state once per frame; projecting a point is then a handful of
+    multiplications and the *Array methods transform whole coordinate arrays in one call
+    (numpy arrays when numpy is available, lists otherwise).
+    """
+    __slots__ = ("m00", "m01", "tx", "m10", "m11", "ty")
+
+    def __init__(self, m00: float, m01: float, tx: float, m10: float, m11: float, ty: float):
+        self.m00, self.m01, self.tx = m00, m01, tx
+        self.m10, self.m11, self.ty = m10, m11, ty
+
+    def GamePosToScreen(self, x: float, y: float) -> Tuple[float, float]:
+        return self.m00 * x + self.m01 * y + self.tx, self.m10 * x + self.m11 * y + self.ty
+
+    def ScreenToGamePos(self, screen_x: float, screen_y: float) -> Tuple[float, float]:
+        det = self.m00 * self.m11 - self.m01 * self.m10
+        if det == 0:
+            return 0.0, 0.0
+        dx, dy = screen_x - self.tx, screen_y - self.ty
+        return (self.m11 * dx - self.m01 * dy) / det, (self.m00 * dy - self.m10 * dx) / det
+
+    def GamePosArrayToScreen(self, xs, ys):
+        """Project the game positions (xs[i], ys[i]). Returns (screen_xs, screen_ys)."""
+        m00, m01, tx, m10, m11, ty = self.m00, self.m01, self.tx, self.m10, self.m11, self.ty
+        if np is not None:
+            xs, ys = np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64)
+            return m00 * xs + m01 * ys + tx, m10 * xs + m11 * ys + ty
+        return ([m00 * x + m01 * y + tx for x, y in zip(xs, ys)],
+                [m10 * x + m11 * y + ty for x, y in zip(xs, ys)])
+
+    def ScreenArrayToGamePos(self, screen_xs, screen_ys):
+        """Inverse of GamePosArrayToScreen. Returns (game_xs, game_ys)."""
+        det = self.m00 * self.m11 - self.m01 * self.m10
+        if det == 0:
+            count = len(screen_xs)
+            return ([0.0] * count, [0.0] * count) if np is None else (np.zeros(count), np.zeros(count))
+        i00, i01, i10, i11 = self.m11 / det, -self.m01 / det, -self.m10 / det, self.m00 / det
+        tx, ty = self.tx, self.ty
+        if np is not None:
+            dxs = np.asarray(screen_xs, dtype=np.float64) - tx
+            dys = np.asarray(screen_ys, dtype=np.float64) - ty
+            return i00 * dxs + i01 * dys, i10 * dxs + i11 * dys
+        return ([i00 * (x - tx) + i01 * (y - ty) for x, y in zip(screen_xs, screen_ys)],
+                [i10 * (x - tx) + i11 * (y - ty) for x, y in zip(screen_xs, screen_ys)])
+
+
 class Map:
     @staticmethod
     def map_instance():
@@ -437,6 +496,46 @@ class Map:
         def GetPathingMaps() -> List[PyPathing.PathingMap]:
             return PyPathing.get_pathing_maps()
 
+        _pathfinder = Pathfinder()
+
+        @staticmethod
+        def GetNavMesh() -> Optional[NavMesh]:
+            """NavMesh of the current map, built on first use and cached per map id. None while the map is not ready."""
+            if not Map.IsMapReady():
+                return None
+            return Map.Pathing._pathfinder.GetNavMesh(Map.GetMapID(), Map.Pathing.GetPathingMaps)
+
+        @staticmethod
+        def FindPath(start_x: float, start_y: float, goal_x: float, goal_y: float, smooth: bool = True, margin: float = 0.0) -> List[Tuple[float, float]]:
+            """
+            Purpose: Route between two points of the current map over its pathing trapezoids.
+            Args:
+                start_x, start_y (float): Start position, usually the player position.
+                goal_x, goal_y (float): Destination.
+                smooth (bool): Pull the route tight around corners instead of crossing edge midpoints.
+                margin (float): Keep waypoints this far from the ends of the crossed edges.
+            Returns: list of (x, y) waypoints ending at the goal, usable with Routines.Movement.PathHandler
+                     and Routines.Yield.Movement.FollowPath. Empty if there is no route.
+            """
+            nav_mesh = Map.Pathing.GetNavMesh()
+            if nav_mesh is None:
+                return []
+            return nav_mesh.FindPath((start_x, start_y), (goal_x, goal_y), smooth, margin)
+
+        @staticmethod
+        def IsWalkable(x: float, y: float) -> bool:
+            nav_mesh = Map.Pathing.GetNavMesh()
+            return nav_mesh is not None and nav_mesh.IsWalkable(x, y)
+
+        @staticmethod
+        def SavePathingMaps(file_name: str):
+            """Serialize the pathing maps of the current map to json, loadable offline with NavMesh.FromData(LoadPathingMaps(file_name))."""
+            SavePathingMaps(Map.Pathing.GetPathingMaps(), file_name)
+
+        @staticmethod
+        def InvalidateNavMesh(map_id: Optional[int] = None):
+            Map.Pathing._pathfinder.Invalidate(map_id)
+
         @staticmethod
         def WorldToScreen(x,y,z=0.0):
             if z == 0.0:
@@ -492,44 +591,42 @@ class Map:
                     PyOverlay.Point2D(int(shifted_br[0]), int(shifted_br[1])),
                 ]
                 
+        _geometry_store = PathingGeometryStore()
+
+        @staticmethod
+        def GetGeometry() -> Optional[PathingGeometry]:
+            """Flattened pathing geometry of the current map, loaded from its on-disk cache or built on the first visit."""
+            if not Map.IsMapReady():
+                return None
+            return Map.Pathing._geometry_store.Get(Map.GetMapID(), Map.Pathing.GetPathingMaps)
+
         @staticmethod
         def GetComputedGeometry() -> List[List[PyOverlay.Point2D]]:
-            pathintg_maps = Map.Pathing.GetPathingMaps()
-            geometry = []
-            for layer in pathintg_maps:
-                for trapezoid in layer.trapezoids:
-                    geometry.append(Map.Pathing.Quad(trapezoid).GetPoints())
-            return geometry
-                    
-                
+            """Trapezoids as [TL, TR, BL, BR] game coordinates. The list is shared per map, do not modify it."""
+            geometry = Map.Pathing.GetGeometry()
+            return geometry.GetQuads() if geometry is not None else []
+
         @staticmethod
         def GetScreenComputedGeometry() -> List[List[PyOverlay.Point2D]]:
-            pathintg_maps = Map.Pathing.GetPathingMaps()
-            geometry = []
-            for layer in pathintg_maps:
-                for trapezoid in layer.trapezoids:
-                    geometry.append(Map.Pathing.Quad(trapezoid).GetScreenPoints())
-            return geometry
-            
+            geometry = Map.Pathing.GetGeometry()
+            if geometry is None:
+                return []
+            return geometry.ProjectQuads(*Map.MissionMap.MapProjection.GetGameMapToScreenTransform())
+
         @staticmethod
         def GetShiftedComputedGeometry(origin_x: float, origin_y: float) -> List[List[PyOverlay.Point2D]]:
-            pathing_maps = Map.Pathing.GetPathingMaps()
-            geometry = []
-            for layer in pathing_maps:
-                for trapezoid in layer.trapezoids:
-                    quad = Map.Pathing.Quad(trapezoid)
-                    geometry.append(quad.GetShiftedPoints(origin_x, origin_y))
-            return geometry
+            geometry = Map.Pathing.GetGeometry()
+            if geometry is None:
+                return []
+            return geometry.ProjectQuads(1.0, -origin_x, 1.0, -origin_y)
 
         @staticmethod
         def GetshiftedScreenComputedGeometry(origin_x: float, origin_y: float) -> List[List[PyOverlay.Point2D]]:
-            pathing_maps = Map.Pathing.GetPathingMaps()
-            geometry = []
-            for layer in pathing_maps:
-                for trapezoid in layer.trapezoids:
-                    quad = Map.Pathing.Quad(trapezoid)
-                    geometry.append(quad.GetShiftedScreenPoints(origin_x, origin_y))
-            return geometry
+            geometry = Map.Pathing.GetGeometry()
+            if geometry is None:
+                return []
+            scale_x, offset_x, scale_y, offset_y = Map.MissionMap.MapProjection.GetGameMapToScreenTransform()
+            return geometry.ProjectQuads(scale_x, offset_x - origin_x * scale_x, scale_y, offset_y - origin_y * scale_y)
     
     class MissionMap:
         @staticmethod
@@ -605,7 +702,57 @@ class Map:
             """Get the map screen center coordinates."""
             return Map.MissionMap._mission_map_instance().mission_map_screen_center_x, Map.MissionMap._mission_map_instance().mission_map_screen_center_y
         
+        class Projection(ScreenProjection):
+            """Mission map GameMapToScreen snapshot, see ScreenProjection."""
+            __slots__ = ()
+
+            def __init__(self, zoom_offset=0.0):
+                scale_x, offset_x, scale_y, offset_y = Map.MissionMap.MapProjection.GetGameMapToScreenTransform(zoom_offset)
+                super().__init__(scale_x, 0.0, offset_x, 0.0, scale_y, offset_y)
+
+            @staticmethod
+            def FromValues(zoom: float, left_bound: float, top_bound: float, boundaries,
+                           pan_offset_x: float, pan_offset_y: float, scale_x: float, scale_y: float,
+                           center_x: float, center_y: float) -> "Map.MissionMap.Projection":
+                """Build the snapshot from mission map values the caller already read this frame."""
+                projection = Map.MissionMap.Projection.__new__(Map.MissionMap.Projection)
+                sx, ox, sy, oy = Map.MissionMap.MapProjection.ComputeGameMapToScreenTransform(
+                    zoom, left_bound, top_bound, boundaries, pan_offset_x, pan_offset_y, scale_x, scale_y, center_x, center_y)
+                ScreenProjection.__init__(projection, sx, 0.0, ox, 0.0, sy, oy)
+                return projection
+
         class MapProjection:
+            @staticmethod
+            def ComputeGameMapToScreenTransform(zoom, left_bound, top_bound, boundaries,
+                                                pan_offset_x, pan_offset_y, scale_x, scale_y, center_x, center_y):
+                """GameMapToScreen of the given mission map values as (scale_x, offset_x, scale_y, offset_y) per axis."""
+                gwinches = 96.0
+                if len(boundaries) < 5:
+                    game_scale_x = game_scale_y = 0.0
+                    origin_x = origin_y = 0.0
+                else:
+                    origin_x = left_bound + abs(boundaries[1]) / gwinches
+                    origin_y = top_bound + abs(boundaries[4]) / gwinches
+                    game_scale_x = 1.0 / gwinches
+                    game_scale_y = -1.0 / gwinches
+
+                return (game_scale_x * scale_x * zoom, (origin_x - pan_offset_x) * scale_x * zoom + center_x,
+                        game_scale_y * scale_y * zoom, (origin_y - pan_offset_y) * scale_y * zoom + center_y)
+
+            @staticmethod
+            def GetGameMapToScreenTransform(zoom_offset=0.0):
+                """
+                Purpose: GameMapToScreen as an affine transform, read once so whole vertex arrays can be projected at once.
+                Returns: (scale_x, offset_x, scale_y, offset_y) with screen = game * scale + offset per axis.
+                """
+                left, top, _, _ = Map.GetMapWorldMapBounds()
+                pan_offset_x, pan_offset_y = Map.MissionMap.GetPanOffset()
+                scale_x, scale_y = Map.MissionMap.GetScale()
+                center_x, center_y = Map.MissionMap.GetMapScreenCenter()
+                return Map.MissionMap.MapProjection.ComputeGameMapToScreenTransform(
+                    Map.MissionMap.GetZoom() + zoom_offset, left, top, Map.map_instance().map_boundaries,
+                    pan_offset_x, pan_offset_y, scale_x, scale_y, center_x, center_y)
+
             @staticmethod
             def GamePosToWorldMap(x: float, y: float):
                 gwinches = 96.0
@@ -882,6 +1029,33 @@ class Map:
 
             return center_x, center_y
         
+        class Projection(ScreenProjection):
+            """
+            Compass projection snapshot, see ScreenProjection. Matches MiniMap.MapProjection.GamePosToScreen:
+            player position, compass center, scale and rotation are read once and folded into one matrix.
+            """
+            __slots__ = ()
+
+            def __init__(self, player_x = None, player_y = None,
+                         center_x = None, center_y = None,
+                         scale = None, rotation = None):
+                from .Player import Player
+
+                if player_x == None or player_y == None:
+                    player_x, player_y = Player.GetXY()
+                if center_x == None or center_y == None:
+                    center_x, center_y = Map.MiniMap.GetMapScreenCenter()
+                if scale == None:
+                    scale = Map.MiniMap.GetScale()
+                if rotation == None:
+                    rotation = Map.MiniMap.GetRotation()
+
+                factor = scale/5000
+                m00, m01 = math.cos(rotation)*factor, math.sin(rotation)*factor
+                m10, m11 = math.sin(rotation)*factor, -math.cos(rotation)*factor
+                super().__init__(m00, m01, center_x - m00*player_x - m01*player_y,
+                                 m10, m11, center_y - m10*player_x - m11*player_y)
+
         class MapProjection:
             @staticmethod
             def GamePosToScreen(game_x, game_y,
@@ -0,0 +1,470 @@
+import os
+import json
+import math
+import heapq
+from typing import List, Tuple, Optional
+
+# Pure python on purpose: a NavMesh can be built from live PyPathing maps or from a
+# serialized snapshot of them, so routing can be exercised offline.
+
+NAVMESH_FORMAT_VERSION = 1
+NAVMESH_CELL_SIZE = 512.0
+NAVMESH_EDGE_EPSILON = 1.0
+NAVMESH_CACHE_SIZE = 4
+
+NavPoint = Tuple[float, float]
+
+
+def SerializePathingMaps(pathing_maps) -> dict:
+    """
+    Purpose: Convert PyPathing.PathingMap layers into plain data (see NavMesh.FromData).
+    Args:
+        pathing_maps (list): Result of PyPathing.get_pathing_maps().
+    Returns: dict
+    """
+    layers = []
+    for layer in pathing_maps:
+        layers.append({
+            "zplane": layer.zplane,
+            "trapezoids": [[t.id, t.XTL, t.XTR, t.YT, t.XBL, t.XBR, t.YB, list(t.neighbor_ids)] for t in layer.trapezoids],
+            "portals": [[p.left_layer_id, p.right_layer_id, p.pair_index, list(p.trapezoid_indices)] for p in layer.portals],
+        })
+    return {"version": NAVMESH_FORMAT_VERSION, "layers": layers}
+
+
+def SavePathingMaps(pathing_maps, file_name: str):
+    """Write serialized pathing maps to file_name (json)."""
+    data = pathing_maps if isinstance(pathing_maps, dict) else SerializePathingMaps(pathing_maps)
+    temp_name = f"{file_name}.{os.getpid()}.tmp"
+    with open(temp_name, "w") as f:
+        json.dump(data, f)
+    os.replace(temp_name, file_name)
+
+
+def LoadPathingMaps(file_name: str) -> dict:
+    with open(file_name, "r") as f:
+        return json.load(f)
+
+
+def _cross(o: NavPoint, a: NavPoint, b: NavPoint) -> float:
+    """z of (a - o) x (b - o); positive when b lies counter-clockwise (left) of o->a."""
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def _closest_on_segment(p: NavPoint, a: NavPoint, b: NavPoint) -> NavPoint:
+    dx, dy = b[0] - a[0], b[1] - a[1]
+    length_sq = dx * dx + dy * dy
+    if length_sq == 0.0:
+        return a
+    t = ((p[0] - a[0]) * dx + (p[1] - a[1]) * dy) / length_sq
+    t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
+    return a[0] + t * dx, a[1] + t * dy
+
+
+class NavMesh:
+    """
+    Walkable area of a map as a graph of trapezoids.
+
+    Trapezoids of every layer are flattened into one index space. Two trapezoids are linked
+    when the game lists them as neighbors or through a pair of layer portals; each link keeps
+    the shared edge it is crossed through. A uniform grid over the trapezoid bounds answers
+    point location, A* runs over the trapezoids and the corridor is pulled tight with the
+    funnel algorithm.
+    """
+    def __init__(self, cell_size: float = NAVMESH_CELL_SIZE):
+        self.cell_size = cell_size
+        # === Trapezoid columns ===
+        self.layer: List[int] = []
+        self.trapezoid_id: List[int] = []
+        self.yt: List[float] = []
+        self.yb: List[float] = []
+        self.xtl: List[float] = []
+        self.xtr: List[float] = []
+        self.xbl: List[float] = []
+        self.xbr: List[float] = []
+        self.center: List[NavPoint] = []
+        # index -> [(neighbor index, edge a, edge b, edge midpoint)]
+        self.links: List[list] = []
+        # (cx, cy) -> trapezoid indexes whose bounds touch the cell
+        self.cells: dict[tuple[int, int], List[int]] = {}
+        self.bounds = (0.0, 0.0, 0.0, 0.0)
+
+    def __len__(self):
+        return len(self.layer)
+
+    # === Construction ===
+    @staticmethod
+    def FromPathingMaps(pathing_maps, cell_size: float = NAVMESH_CELL_SIZE) -> "NavMesh":
+        return NavMesh.FromData(SerializePathingMaps(pathing_maps), cell_size)
+
+    @staticmethod
+    def FromData(data: dict, cell_size: float = NAVMESH_CELL_SIZE) -> "NavMesh":
+        """
+        Purpose: Build a NavMesh from serialized pathing maps.
+        Args:
+            data (dict): {"layers": [{"trapezoids": [[id, XTL, XTR, YT, XBL, XBR, YB, [neighbor ids]], ...],
+                                      "portals": [[left_layer_id, right_layer_id, pair_index, [trapezoid indexes]], ...]}]}
+            cell_size (float): Point location grid cell size in game units.
+        Returns: NavMesh
+        """
+        mesh = NavMesh(cell_size)
+        layers = data.get("layers", [])
+        layer_offsets = []
+        id_to_index: List[dict] = []
+
+        for layer_index, layer in enumerate(layers):
+            layer_offsets.append(len(mesh.layer))
+            ids = {}
+            for trapezoid_id, xtl, xtr, yt, xbl, xbr, yb, _ in layer["trapezoids"]:
+                if yt < yb:  # keep yt as the upper edge
+                    xtl, xtr, yt, xbl, xbr, yb = xbl, xbr, yb, xtl, xtr, yt
+                ids[trapezoid_id] = len(mesh.layer)
+                mesh.layer.append(layer_index)
+                mesh.trapezoid_id.append(trapezoid_id)
+                mesh.yt.append(yt)
+                mesh.yb.append(yb)
+                mesh.xtl.append(xtl)
+                mesh.xtr.append(xtr)
+                mesh.xbl.append(xbl)
+                mesh.xbr.append(xbr)
+                mesh.center.append(((xtl + xtr + xbl + xbr) * 0.25, (yt + yb) * 0.5))
+                mesh.links.append([])
+            id_to_index.append(ids)
+
+        linked = set()
+        for layer_index, layer in enumerate(layers):
+            ids = id_to_index[layer_index]
+            for trapezoid_id, *_, neighbor_ids in layer["trapezoids"]:
+                index = ids[trapezoid_id]
+                for neighbor_id in neighbor_ids:
+                    neighbor = ids.get(neighbor_id)
+                    if neighbor is not None and neighbor != index:
+                        mesh._link(index, neighbor, linked, require_contact=False)
+
+            # portals come in pairs across layers, link the trapezoids that actually touch
+            portals = layer["portals"]
+            for left_layer_id, right_layer_id, pair_index, trapezoid_indices in portals:
+                other_layer = right_layer_id if left_layer_id == layer_index else left_layer_id
+                if not 0 <= other_layer < len(layers) or other_layer == layer_index:
+                    continue
+                other_portals = layers[other_layer]["portals"]
+                if not 0 <= pair_index < len(other_portals):
+                    continue
+                other_offset = layer_offsets[other_layer]
+                other_count = len(layers[other_layer]["trapezoids"])
+                for local in trapezoid_indices:
+                    if not 0 <= local < len(layer["trapezoids"]):
+                        continue
+                    for other_local in other_portals[pair_index][3]:
+                        if 0 <= other_local < other_count:
+                            mesh._link(layer_offsets[layer_index] + local, other_offset + other_local, linked, require_contact=True)
+
+        mesh._build_grid()
+        return mesh
+
+    def _link(self, a: int, b: int, linked: set, require_contact: bool):
+        key = (a, b) if a < b else (b, a)
+        if key in linked:
+            return
+        edge = self._shared_edge(a, b)
+        if edge is None:
+            if require_contact:
+                return
+            edge = self._bridge(a, b)
+        linked.add(key)
+        edge_a, edge_b = edge
+        midpoint = ((edge_a[0] + edge_b[0]) * 0.5, (edge_a[1] + edge_b[1]) * 0.5)
+        self.links[a].append((b, edge_a, edge_b, midpoint))
+        self.links[b].append((a, edge_a, edge_b, midpoint))
+
+    def _x_range(self, index: int, y: float) -> Tuple[float, float]:
+        yt, yb = self.yt[index], self.yb[index]
+        t = 0.0 if yt == yb else (y - yb) / (yt - yb)
+        return (self.xbl[index] + (self.xtl[index] - self.xbl[index]) * t,
+                self.xbr[index] + (self.xtr[index] - self.xbr[index]) * t)
+
+    def _shared_edge(self, a: int, b: int, eps: float = NAVMESH_EDGE_EPSILON):
+        """Segment shared by two trapezoids, None when they do not touch."""
+        if abs(self.yb[a] - self.yt[b]) <= eps:      # b sits below a
+            y = self.yb[a]
+            low, high = max(self.xbl[a], self.xtl[b]), min(self.xbr[a], self.xtr[b])
+            return ((low, y), (high, y)) if low <= high + eps else None
+        if abs(self.yt[a] - self.yb[b]) <= eps:      # b sits above a
+            y = self.yt[a]
+            low, high = max(self.xtl[a], self.xbl[b]), min(self.xtr[a], self.xbr[b])
+            return ((low, y), (high, y)) if low <= high + eps else None
+
+        # side by side: the part of the slanted sides that touch
+        y0, y1 = max(self.yb[a], self.yb[b]), min(self.yt[a], self.yt[b])
+        if y0 > y1 + eps:
+            return None
+        a_low, a_high = self._x_range(a, (y0 + y1) * 0.5)
+        b_low, b_high = self._x_range(b, (y0 + y1) * 0.5)
+        if abs(a_high - b_low) <= eps * 4:
+            return (self._x_range(a, y0)[1], y0), (self._x_range(a, y1)[1], y1)
+        if abs(b_high - a_low) <= eps * 4:
+            return (self._x_range(a, y0)[0], y0), (self._x_range(a, y1)[0], y1)
+        return None
+
+    def _bridge(self, a: int, b: int):
+        """Listed neighbors that do not share an edge: cross at the point of a closest to b."""
+        point = self.ClosestPointInTrapezoid(a, self.center[b])
+        return point, point
+
+    def _build_grid(self):
+        if not self.layer:
+            return
+        size = self.cell_size
+        min_x = min(min(self.xtl), min(self.xbl))
+        max_x = max(max(self.xtr), max(self.xbr))
+        self.bounds = (min_x, min(self.yb), max_x, max(self.yt))
+        cells = self.cells
+        for index in range(len(self.layer)):
+            x0 = min(self.xtl[index], self.xbl[index])
+            x1 = max(self.xtr[index], self.xbr[index])
+            for cx in range(math.floor(x0 / size), math.floor(x1 / size) + 1):
+                for cy in range(math.floor(self.yb[index] / size), math.floor(self.yt[index] / size) + 1):
+                    cells.setdefault((cx, cy), []).append(index)
+
+    # === Point location ===
+    def Contains(self, index: int, x: float, y: float, eps: float = NAVMESH_EDGE_EPSILON) -> bool:
+        if y < self.yb[index] - eps or y > self.yt[index] + eps:
+            return False
+        low, high = self._x_range(index, y)
+        return low - eps <= x <= high + eps
+
+    def FindTrapezoid(self, x: float, y: float, layer: Optional[int] = None) -> int:
+        """Index of the trapezoid containing (x, y), -1 if the point is off the mesh."""
+        candidates = self.cells.get((math.floor(x / self.cell_size), math.floor(y / self.cell_size)), ())
+        found = -1
+        for index in candidates:
+            if self.Contains(index, x, y):
+                if layer is None or self.layer[index] == layer:
+                    return index
+                if found < 0:
+                    found = index
+        return found
+
+    def IsWalkable(self, x: float, y: float) -> bool:
+        return self.FindTrapezoid(x, y) >= 0
+
+    def ClosestPointInTrapezoid(self, index: int, point: NavPoint) -> NavPoint:
+        if self.Contains(index, point[0], point[1], 0.0):
+            return point
+        corners = ((self.xtl[index], self.yt[index]), (self.xtr[index], self.yt[index]),
+                   (self.xbr[index], self.yb[index]), (self.xbl[index], self.yb[index]))
+        best, best_distance = corners[0], math.inf
+        for i in range(4):
+            candidate = _closest_on_segment(point, corners[i], corners[(i + 1) % 4])
+            distance = (candidate[0] - point[0]) ** 2 + (candidate[1] - point[1]) ** 2
+            if distance < best_distance:
+                best, best_distance = candidate, distance
+        return best
+
+    def NearestPoint(self, x: float, y: float, max_distance: float = 2000.0) -> Tuple[int, NavPoint]:
+        """
+        Purpose: Snap a point onto the mesh.
+        Returns: (trapezoid index, point), (-1, (x, y)) if nothing walkable is within max_distance.
+        """
+        index = self.FindTrapezoid(x, y)
+        if index >= 0:
+            return index, (x, y)
+        size = self.cell_size
+        cx, cy = math.floor(x / size), math.floor(y / size)
+        best, best_point, best_distance = -1, (x, y), max_distance * max_distance
+        seen = set()
+        for ring in range(int(max_distance // size) + 2):
+            if best >= 0 and (ring - 1) * size > math.sqrt(best_distance):
+                break
+            for gx in range(cx - ring, cx + ring + 1):
+                for gy in range(cy - ring, cy + ring + 1):
+                    if max(abs(gx - cx), abs(gy - cy)) != ring:
+                        continue
+                    for candidate in self.cells.get((gx, gy), ()):
+                        if candidate in seen:
+                            continue
+                        seen.add(candidate)
+                        point = self.ClosestPointInTrapezoid(candidate, (x, y))
+                        distance = (point[0] - x) ** 2 + (point[1] - y) ** 2
+                        if distance < best_distance:
+                            best, best_point, best_distance = candidate, point, distance
+        return best, best_point
+
+    # === Routing ===
+    def FindCorridor(self, start: int, goal: int, start_point: NavPoint, goal_point: NavPoint) -> List[int]:
+        """A* over trapezoids; g is the travelled distance between crossed edge midpoints."""
+        if start == goal:
+            return [start]
+        links = self.links
+        gx, gy = goal_point
+        entry = {start: start_point}
+        cost = {start: 0.0}
+        parent = {start: -1}
+        counter = 0
+        open_heap = [(0.0, counter, start)]
+        closed = set()
+        while open_heap:
+            _, _, current = heapq.heappop(open_heap)
+            if current == goal:
+                corridor = []
+                while current != -1:
+                    corridor.append(current)
+                    current = parent[current]
+                corridor.reverse()
+                return corridor
+            if current in closed:
+                continue
+            closed.add(current)
+            ex, ey = entry[current]
+            current_cost = cost[current]
+            for neighbor, _, _, midpoint in links[current]:
+                if neighbor in closed:
+                    continue
+                mx, my = midpoint
+                new_cost = current_cost + math.hypot(mx - ex, my - ey)
+                if neighbor == goal:
+                    new_cost += math.hypot(gx - mx, gy - my)
+                if new_cost < cost.get(neighbor, math.inf):
+                    cost[neighbor] = new_cost
+                    parent[neighbor] = current
+                    entry[neighbor] = midpoint
+                    counter += 1
+                    heuristic = 0.0 if neighbor == goal else math.hypot(gx - mx, gy - my)
+                    heapq.heappush(open_heap, (new_cost + heuristic, counter, neighbor))
+        return []
+
+    def _portals(self, corridor: List[int], start_point: NavPoint, goal_point: NavPoint, margin: float):
+        """(left, right) edges crossed along the corridor, left meaning counter-clockwise of travel."""
+        portals = [(start_point, start_point)]
+        for current, following in zip(corridor, corridor[1:]):
+            for neighbor, edge_a, edge_b, _ in self.links[current]:
+                if neighbor == following:
+                    break
+            else:
+                continue
+            if margin > 0.0:
+                dx, dy = edge_b[0] - edge_a[0], edge_b[1] - edge_a[1]
+                length = math.hypot(dx, dy)
+                if length > margin * 2:
+                    ux, uy = dx / length * margin, dy / length * margin
+                    edge_a, edge_b = (edge_a[0] + ux, edge_a[1] + uy), (edge_b[0] - ux, edge_b[1] - uy)
+                else:
+                    middle = ((edge_a[0] + edge_b[0]) * 0.5, (edge_a[1] + edge_b[1]) * 0.5)
+                    edge_a = edge_b = middle
+            origin, target = self.center[current], self.center[following]
+            if _cross(origin, target, edge_a) >= _cross(origin, target, edge_b):
+                portals.append((edge_a, edge_b))
+            else:
+                portals.append((edge_b, edge_a))
+        portals.append((goal_point, goal_point))
+        return portals
+
+    @staticmethod
+    def StringPull(portals) -> List[NavPoint]:
+        """Funnel algorithm over (left, right) portals, the first and last being the start and goal points."""
+        apex = portals[0][0]
+        left, right = portals[0]
+        apex_index = left_index = right_index = 0
+        path = [apex]
+        i = 1
+        while i < len(portals):
+            new_left, new_right = portals[i]
+
+            # tighten the right side
+            if _cross(apex, right, new_right) >= 0.0:
+                if apex == right or _cross(apex, left, new_right) < 0.0:
+                    right, right_index = new_right, i
+                else:
+                    # right crossed over left: left corner becomes the new apex
+                    if path[-1] != left:
+                        path.append(left)
+                    apex, apex_index = left, left_index
+                    left = right = apex
+                    left_index = right_index = apex_index
+                    i = apex_index + 1
+                    continue
+
+            # tighten the left side
+            if _cross(apex, left, new_left) <= 0.0:
+                if apex == left or _cross(apex, right, new_left) > 0.0:
+                    left, left_index = new_left, i
+                else:
+                    if path[-1] != right:
+                        path.append(right)
+                    apex, apex_index = right, right_index
+                    left = right = apex
+                    left_index = right_index = apex_index
+                    i = apex_index + 1
+                    continue
+            i += 1
+
+        goal = portals[-1][0]
+        if path[-1] != goal:
+            path.append(goal)
+        return path
+
+    def FindPath(self, start: NavPoint, goal: NavPoint, smooth: bool = True, margin: float = 0.0,
+                 snap_distance: float = 2000.0) -> List[NavPoint]:
+        """
+        Purpose: Route between two points over the mesh.
+        Args:
+            start (tuple): (x, y) start, snapped onto the mesh if it lies outside.
+            goal (tuple): (x, y) goal, snapped onto the mesh if it lies outside.
+            smooth (bool): Pull the corridor tight; otherwise return the crossed edge midpoints.
+            margin (float): Keep waypoints this far from the end of each crossed edge.
+            snap_distance (float): Maximum distance to snap start and goal onto the mesh.
+        Returns: list of (x, y) waypoints ending at the goal, empty if no route exists.
+        """
+        start_index, start_point = self.NearestPoint(start[0], start[1], snap_distance)
+        goal_index, goal_point = self.NearestPoint(goal[0], goal[1], snap_distance)
+        if start_index < 0 or goal_index < 0:
+            return []
+        corridor = self.FindCorridor(start_index, goal_index, start_point, goal_point)
+        if not corridor:
+            return []
+        portals = self._portals(corridor, start_point, goal_point, margin)
+        if smooth:
+            return NavMesh.StringPull(portals)
+        path = [start_point]
+        for edge_left, edge_right in portals[1:-1]:
+            path.append(((edge_left[0] + edge_right[0]) * 0.5, (edge_left[1] + edge_right[1]) * 0.5))
+        path.append(goal_point)
+        return path
+
+
+class Pathfinder:
+    """
+    NavMesh cache keyed by map id. Building a mesh walks every trapezoid once; afterwards
+    each FindPath only runs point location, A* and the funnel, so it is cheap enough to
+    replan every few hundred milliseconds.
+    """
+    def __init__(self, cache_size: int = NAVMESH_CACHE_SIZE):
+        self.cache_size = cache_size
+        self.meshes: dict[int, NavMesh] = {}     # insertion order doubles as LRU order
+
+    def GetNavMesh(self, map_id: int, loader) -> Optional[NavMesh]:
+        """
+        Purpose: Return the NavMesh of map_id, building it from loader() on a cache miss.
+        Args:
+            map_id (int): Map id used as cache key.
+            loader (callable): Returns PyPathing maps or serialized pathing data (dict).
+        Returns: NavMesh or None if the map has no pathing data (yet).
+        """
+        mesh = self.meshes.pop(map_id, None)
+        if mesh is None:
+            pathing = loader()
+            if not pathing:
+                return None
+            mesh = NavMesh.FromData(pathing) if isinstance(pathing, dict) else NavMesh.FromPathingMaps(pathing)
+            if len(mesh) == 0:
+                return None
+            while len(self.meshes) >= self.cache_size:
+                self.meshes.pop(next(iter(self.meshes)))
+        self.meshes[map_id] = mesh
+        return mesh
+
+    def Invalidate(self, map_id: Optional[int] = None):
+        if map_id is None:
+            self.meshes.clear()
+        else:
+            self.meshes.pop(map_id, None)
@@ -0,0 +1,296 @@
+import Py4GW
+import PyOverlay
+import os
+import math
+import mmap
+import struct
+import zlib
+from array import array
+from typing import List, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+PATHING_GEOMETRY_MODULE_NAME = "Pathing Geometry"
+PATHING_GEOMETRY_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pathing_geometry")
+PATHING_GEOMETRY_MAGIC = b"P4GWPTH\0"
+PATHING_GEOMETRY_VERSION = 1  # bump whenever the layout or its meaning changes
+# magic, version, map id, fingerprint, trapezoid count, cell item count, grid columns, grid rows, grid min x, grid min y, cell size
+PATHING_GEOMETRY_HEADER = struct.Struct("<8sIIIIIIIfff")
+PATHING_GEOMETRY_CELL_SIZE = 512.0
+PATHING_GEOMETRY_FINGERPRINT_SAMPLES = 64
+PATHING_GEOMETRY_CACHE_SIZE = 4
+
+# Vertex order per trapezoid, same as Map.Pathing.Quad.GetPoints(): TL, TR, BL, BR as x, y pairs
+VERTICES_PER_TRAPEZOID = 4
+
+
+def _aligned(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def PathingFingerprint(pathing_maps) -> int:
+    """
+    Cheap identity of a map's pathing data: layer and trapezoid counts plus an evenly spaced sample
+    of trapezoid coordinates, so a persisted geometry left behind by a game update is rebuilt.
+    """
+    crc = 0
+    for layer in pathing_maps:
+        trapezoids = layer.trapezoids
+        count = len(trapezoids)
+        crc = zlib.crc32(struct.pack("<I", count), crc)
+        step = max(count // PATHING_GEOMETRY_FINGERPRINT_SAMPLES, 1)
+        for index in range(0, count, step):
+            t = trapezoids[index]
+            crc = zlib.crc32(struct.pack("<6f", t.XTL, t.XTR, t.YT, t.XBL, t.XBR, t.YB), crc)
+    return crc
+
+
+class PathingGeometry:
+    """
+    Flattened pathing trapezoids of one map.
+
+    vertices holds 8 floats per trapezoid (TL, TR, BL, BR), layer the layer of each trapezoid.
+    A uniform grid over the trapezoid bounds, stored as cell_offsets/cell_items, answers
+    point-in-trapezoid queries. Everything lives in one versioned binary file per map id that is
+    memory-mapped read-only on later visits; Project turns all vertices into screen space with a
+    single affine transform.
+    """
+    def __init__(self, map_id: int, directory: str = PATHING_GEOMETRY_DIRECTORY):
+        self.map_id = map_id
+        self.file_name = os.path.join(directory, f"map_{map_id}.bin")
+        self.fingerprint = 0
+        self.count = 0
+        self.vertices = array("f")
+        self.layer = array("I")
+        self.cell_offsets = array("I")
+        self.cell_items = array("I")
+        self.columns = 0
+        self.rows = 0
+        self.min_x = 0.0
+        self.min_y = 0.0
+        self.cell_size = PATHING_GEOMETRY_CELL_SIZE
+        self.loaded = False
+        self.from_file = False
+        self._quads: Optional[List[List[PyOverlay.Point2D]]] = None
+        self._mmap: mmap.mmap | None = None
+
+    def Load(self, pathing_maps, rebuild: bool = False) -> bool:
+        """
+        Map the geometry file of this map id, building and persisting it first if it is missing,
+        does not match the fingerprint of pathing_maps, or rebuild is set.
+        Returns True if the geometry is usable.
+        """
+        fingerprint = PathingFingerprint(pathing_maps)
+        if self.loaded and not rebuild and fingerprint == self.fingerprint:
+            return True
+        self.Close()
+        try:
+            if not rebuild and self._map_file(fingerprint):
+                return True
+            self._build(pathing_maps, fingerprint)
+        except Exception as e:
+            Py4GW.Console.Log(PATHING_GEOMETRY_MODULE_NAME, f"Failed to build pathing geometry for map {self.map_id}: {e}", Py4GW.Console.MessageType.Error)
+            return False
+
+        try:
+            self._write_file()
+            self._map_file(fingerprint)
+            self.from_file = False
+        except Exception as e:
+            Py4GW.Console.Log(PATHING_GEOMETRY_MODULE_NAME, f"Pathing geometry not persisted: {e}", Py4GW.Console.MessageType.Warning)
+        return True
+
+    def Close(self):
+        self.vertices, self.layer = array("f"), array("I")  # drop the views before the mapping
+        self.cell_offsets, self.cell_items = array("I"), array("I")
+        self._quads = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self.loaded = self.from_file = False
+
+    # === Queries ===
+    def GetQuads(self) -> List[List[PyOverlay.Point2D]]:
+        """Trapezoids as [TL, TR, BL, BR] Point2D lists, the format of Map.Pathing.GetComputedGeometry()."""
+        if self._quads is None:
+            v = self.vertices
+            Point2D = PyOverlay.Point2D
+            self._quads = [[Point2D(int(v[i]), int(v[i + 1])), Point2D(int(v[i + 2]), int(v[i + 3])),
+                            Point2D(int(v[i + 4]), int(v[i + 5])), Point2D(int(v[i + 6]), int(v[i + 7]))]
+                           for i in range(0, len(v), 2 * VERTICES_PER_TRAPEZOID)]
+        return self._quads
+
+    def Project(self, scale_x: float, offset_x: float, scale_y: float, offset_y: float):
+        """
+        Apply x' = x * scale_x + offset_x, y' = y * scale_y + offset_y to every vertex.
+        Returns the projected vertices in the layout of vertices (numpy float32 array when numpy is available).
+        """
+        if np is not None:
+            projected = np.frombuffer(self.vertices, dtype=np.float32).reshape(-1, 2) * (scale_x, scale_y)
+            projected += (offset_x, offset_y)
+            return projected.astype(np.float32).ravel()
+        v = self.vertices
+        projected = array("f", bytes(4 * len(v)))
+        projected[0::2] = array("f", [x * scale_x + offset_x for x in v[0::2]])
+        projected[1::2] = array("f", [y * scale_y + offset_y for y in v[1::2]])
+        return projected
+
+    def ProjectQuads(self, scale_x: float, offset_x: float, scale_y: float, offset_y: float) -> List[List[PyOverlay.Point2D]]:
+        """Project and regroup into [TL, TR, BL, BR] Point2D lists."""
+        p = [int(value) for value in self.Project(scale_x, offset_x, scale_y, offset_y)]
+        Point2D = PyOverlay.Point2D
+        return [[Point2D(p[i], p[i + 1]), Point2D(p[i + 2], p[i + 3]), Point2D(p[i + 4], p[i + 5]), Point2D(p[i + 6], p[i + 7])]
+                for i in range(0, len(p), 2 * VERTICES_PER_TRAPEZOID)]
+
+    def Contains(self, index: int, x: float, y: float) -> bool:
+        v = self.vertices
+        base = index * 2 * VERTICES_PER_TRAPEZOID
+        xtl, yt, xtr = v[base], v[base + 1], v[base + 2]
+        xbl, yb, xbr = v[base + 4], v[base + 5], v[base + 6]
+        if yt < yb:
+            xtl, xtr, yt, xbl, xbr, yb = xbl, xbr, yb, xtl, xtr, yt
+        if y < yb or y > yt:
+            return False
+        t = 0.0 if yt == yb else (y - yb) / (yt - yb)
+        return xbl + (xtl - xbl) * t <= x <= xbr + (xtr - xbr) * t
+
+    def FindTrapezoid(self, x: float, y: float) -> int:
+        """Index of the trapezoid containing (x, y), -1 if none does."""
+        column = math.floor((x - self.min_x) / self.cell_size)
+        row = math.floor((y - self.min_y) / self.cell_size)
+        if not (0 <= column < self.columns and 0 <= row < self.rows):
+            return -1
+        cell = row * self.columns + column
+        for position in range(self.cell_offsets[cell], self.cell_offsets[cell + 1]):
+            index = self.cell_items[position]
+            if self.Contains(index, x, y):
+                return index
+        return -1
+
+    # === Build ===
+    def _build(self, pathing_maps, fingerprint: int):
+        vertices, layers = array("f"), array("I")
+        for layer_index, layer in enumerate(pathing_maps):
+            for t in layer.trapezoids:
+                vertices.extend((t.XTL, t.YT, t.XTR, t.YT, t.XBL, t.YB, t.XBR, t.YB))
+                layers.append(layer_index)
+        count = len(layers)
+
+        size = self.cell_size
+        columns = rows = 0
+        min_x = min_y = 0.0
+        buckets: list[list[int]] = []
+        if count:
+            xs, ys = vertices[0::2], vertices[1::2]
+            min_x, min_y = min(xs), min(ys)
+            columns = int((max(xs) - min_x) // size) + 1
+            rows = int((max(ys) - min_y) // size) + 1
+            buckets = [[] for _ in range(columns * rows)]
+            for index in range(count):
+                start = index * VERTICES_PER_TRAPEZOID
+                quad_xs = xs[start:start + VERTICES_PER_TRAPEZOID]
+                quad_ys = ys[start:start + VERTICES_PER_TRAPEZOID]
+                for row in range(int((min(quad_ys) - min_y) // size), int((max(quad_ys) - min_y) // size) + 1):
+                    for column in range(int((min(quad_xs) - min_x) // size), int((max(quad_xs) - min_x) // size) + 1):
+                        buckets[row * columns + column].append(index)
+
+        cell_offsets, cell_items = array("I", [0]), array("I")
+        for bucket in buckets:
+            cell_items.extend(bucket)
+            cell_offsets.append(len(cell_items))
+
+        self.fingerprint, self.count = fingerprint, count
+        self.vertices, self.layer = vertices, layers
+        self.cell_offsets, self.cell_items = cell_offsets, cell_items
+        self.columns, self.rows, self.min_x, self.min_y = columns, rows, min_x, min_y
+        self.loaded = True
+
+    # === Persistence ===
+    def _sections(self):
+        return (self.vertices, self.layer, self.cell_offsets, self.cell_items)
+
+    def _write_file(self):
+        os.makedirs(os.path.dirname(self.file_name), exist_ok=True)
+        temp_name = f"{self.file_name}.{os.getpid()}.tmp"
+        with open(temp_name, "wb") as f:
+            f.write(PATHING_GEOMETRY_HEADER.pack(PATHING_GEOMETRY_MAGIC, PATHING_GEOMETRY_VERSION, self.map_id,
+                                                 self.fingerprint, self.count, len(self.cell_items),
+                                                 self.columns, self.rows, self.min_x, self.min_y, self.cell_size))
+            for section in self._sections():
+                f.write(bytes(_aligned(f.tell()) - f.tell()))
+                f.write(section.tobytes())
+        os.replace(temp_name, self.file_name)  # other clients only ever see a complete file
+
+    def _map_file(self, fingerprint: int) -> bool:
+        if not os.path.exists(self.file_name) or os.path.getsize(self.file_name) < PATHING_GEOMETRY_HEADER.size:
+            return False
+        with open(self.file_name, "rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, map_id, file_fingerprint, count, item_count,
+         columns, rows, min_x, min_y, cell_size) = PATHING_GEOMETRY_HEADER.unpack_from(mapping, 0)
+        if (magic != PATHING_GEOMETRY_MAGIC or version != PATHING_GEOMETRY_VERSION or
+                map_id != self.map_id or file_fingerprint != fingerprint):
+            mapping.close()
+            return False
+
+        view = memoryview(mapping)
+        offset = PATHING_GEOMETRY_HEADER.size
+        sections = []
+        for typecode, length in (("f", count * 2 * VERTICES_PER_TRAPEZOID), ("I", count),
+                                 ("I", columns * rows + 1 if count else 1), ("I", item_count)):
+            offset = _aligned(offset)
+            size = 4 * length
+            if offset + size > len(mapping):
+                view.release()
+                mapping.close()
+                return False
+            sections.append(view[offset:offset + size].cast(typecode))  # zero-copy, read-only
+            offset += size
+
+        self.vertices, self.layer, self.cell_offsets, self.cell_items = sections
+        self.fingerprint, self.count = fingerprint, count
+        self.columns, self.rows, self.min_x, self.min_y, self.cell_size = columns, rows, min_x, min_y, cell_size
+        self._quads = None
+        self._mmap = mapping
+        self.loaded = self.from_file = True
+        return True
+
+
+class PathingGeometryStore:
+    """PathingGeometry per map id, the most recently used few kept in memory."""
+    def __init__(self, directory: str = PATHING_GEOMETRY_DIRECTORY, cache_size: int = PATHING_GEOMETRY_CACHE_SIZE):
+        self.directory = directory
+        self.cache_size = cache_size
+        self.geometries: dict[int, PathingGeometry] = {}  # insertion order doubles as LRU order
+
+    def Get(self, map_id: int, loader) -> Optional[PathingGeometry]:
+        """
+        Purpose: Return the geometry of map_id, loading or building it from loader() on a cache miss.
+        Args:
+            map_id (int): Map id used as cache and file key.
+            loader (callable): Returns the PyPathing maps of map_id.
+        Returns: PathingGeometry or None if the map has no pathing data (yet).
+        """
+        geometry = self.geometries.pop(map_id, None)
+        if geometry is None:
+            pathing_maps = loader()
+            if not pathing_maps:
+                return None
+            geometry = PathingGeometry(map_id, self.directory)
+            if not geometry.Load(pathing_maps) or geometry.count == 0:
+                geometry.Close()
+                return None
+            while len(self.geometries) >= self.cache_size:
+                self.geometries.pop(next(iter(self.geometries))).Close()
+        self.geometries[map_id] = geometry
+        return geometry
+
+    def Invalidate(self, map_id: Optional[int] = None):
+        for key in list(self.geometries) if map_id is None else [map_id]:
+            geometry = self.geometries.pop(key, None)
+            if geometry is not None:
+                geometry.Close()
@@ -20,48 +20,314 @@ from .enums import *
 import threading
 import socket
 import configparser
+import atexit
 import os
 from datetime import datetime
 
+#region IniStore
+class _IniFile:
+    """One INI file held by IniStore: its parsed content and the writes not flushed yet."""
+    __slots__ = ("filename", "parser", "mtime", "last_check", "pending", "owns_file", "flush_due")
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.parser = configparser.ConfigParser()
+        self.mtime = None             # mtime of the content in parser, None if the file did not exist
+        self.last_check = 0.0         # perf_counter of the last mtime check
+        self.pending = []             # operations replayed on top of an external change
+        self.owns_file = False        # a whole-parser save is pending, our content wins
+        self.flush_due = 0.0          # perf_counter at which pending writes are flushed, 0 if clean
+
+
+class IniStore:
+    """
+    Process-wide INI configuration store.
+
+    Every file is parsed once and reads are served from memory. The file mtime is only checked
+    every check_interval_ms; an external change is re-parsed and writes not flushed yet are replayed
+    on top of it. Writes are batched: a file is flushed flush_delay_ms after its first unflushed write,
+    atomically through a temp file and os.replace. Due flushes run on update(), opportunistically on
+    any access, and at interpreter exit.
+    """
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self, check_interval_ms: float = 1000, flush_delay_ms: float = 500):
+        if self._initialized:
+            return
+        self.check_interval = check_interval_ms / 1000
+        self.flush_delay = flush_delay_ms / 1000
+        self.files: dict[str, _IniFile] = {}
+        self.lock = threading.RLock()
+        self.next_flush = 0.0
+
+        # === Stats ===
+        self.hits = 0                 # accesses served from memory
+        self.misses = 0               # reads that had to parse the file
+        self.reloads = 0              # external changes picked up
+        self.writes = 0               # write calls
+        self.flushes = 0              # files written to disk
+        self.flush_errors = 0
+
+        atexit.register(self.flush)
+        self._initialized = True
+
+    # ----------------------------
+    # Internals
+    # ----------------------------
+
+    @staticmethod
+    def _mtime(filename: str):
+        try:
+            return os.path.getmtime(filename)
+        except OSError:
+            return None
+
+    def _parse(self, entry: _IniFile):
+        parser = configparser.ConfigParser()
+        mtime = self._mtime(entry.filename)
+        if mtime is not None:
+            try:
+                parser.read(entry.filename)
+            except configparser.Error as e:
+                ConsoleLog("IniStore", f"[Warning] Corrupt INI file: {entry.filename} ({e})", Py4GW.Console.MessageType.Warning)
+                parser = configparser.ConfigParser()
+        if not entry.owns_file:
+            for operation in entry.pending:
+                IniStore._apply(parser, operation)
+            entry.parser = parser
+        entry.mtime = mtime
+
+    @staticmethod
+    def _apply(parser: configparser.ConfigParser, operation: tuple):
+        kind = operation[0]
+        if kind == "set":
+            _, section, key, value = operation
+            if not parser.has_section(section):
+                parser.add_section(section)
+            parser.set(section, key, value)
+        elif kind == "remove_option":
+            _, section, key = operation
+            if parser.has_section(section):
+                parser.remove_option(section, key)
+        elif kind == "remove_section":
+            parser.remove_section(operation[1])
+
+    def _entry(self, filename: str) -> _IniFile:
+        """Return the up to date entry of filename, parsing it on first use or after an external change."""
+        now = time.perf_counter()
+        if self.next_flush and now >= self.next_flush:
+            self._flush_due(now)
+
+        key = os.path.abspath(filename)
+        entry = self.files.get(key)
+        if entry is None:
+            entry = self.files[key] = _IniFile(filename)
+            self._parse(entry)
+            entry.last_check = now
+            self.misses += 1
+            return entry
+
+        if now - entry.last_check >= self.check_interval:
+            entry.last_check = now
+            if self._mtime(filename) != entry.mtime:
+                self._parse(entry)
+                self.reloads += 1
+                self.misses += 1
+                return entry
+        self.hits += 1
+        return entry
+
+    def _mark_dirty(self, entry: _IniFile, operation: tuple | None):
+        self.writes += 1
+        if operation is None:
+            entry.owns_file = True
+            entry.pending.clear()
+        elif not entry.owns_file:
+            entry.pending.append(operation)
+        if not entry.flush_due:
+            entry.flush_due = time.perf_counter() + self.flush_delay
+            if not self.next_flush or entry.flush_due < self.next_flush:
+                self.next_flush = entry.flush_due
+
+    def _write(self, entry: _IniFile) -> bool:
+        # pick up a change made by another process since our last parse, our pending writes go on top
+        if not entry.owns_file and self._mtime(entry.filename) != entry.mtime:
+            self._parse(entry)
+            self.reloads += 1
+        directory = os.path.dirname(os.path.abspath(entry.filename))
+        temp_name = f"{entry.filename}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(temp_name, "w") as f:
+                entry.parser.write(f)
+            os.replace(temp_name, entry.filename)
+        except OSError as e:
+            self.flush_errors += 1
+            ConsoleLog("IniStore", f"Failed to write {entry.filename}: {e}", Py4GW.Console.MessageType.Warning)
+            return False
+        entry.mtime = self._mtime(entry.filename)
+        entry.last_check = time.perf_counter()
+        entry.pending.clear()
+        entry.owns_file = False
+        entry.flush_due = 0.0
+        self.flushes += 1
+        return True
+
+    def _flush_due(self, now: float):
+        self.next_flush = 0.0
+        for entry in self.files.values():
+            if not entry.flush_due:
+                continue
+            if entry.flush_due <= now:
+                if not self._write(entry):
+                    entry.flush_due = now + self.flush_delay  # retry later
+            if entry.flush_due and (not self.next_flush or entry.flush_due < self.next_flush):
+                self.next_flush = entry.flush_due
+
+    # ----------------------------
+    # Public Methods
+    # ----------------------------
+
+    def get_parser(self, filename: str) -> configparser.ConfigParser:
+        """In-memory parser of filename. Call mark_dirty after modifying it directly."""
+        with self.lock:
+            return self._entry(filename).parser
+
+    def exists(self, filename: str) -> bool:
+        """True if filename exists on disk or has unflushed writes."""
+        with self.lock:
+            entry = self._entry(filename)
+            return entry.mtime is not None or bool(entry.flush_due)
+
+    def get(self, filename: str, section: str, key: str, default=None):
+        with self.lock:
+            parser = self._entry(filename).parser
+            try:
+                return parser.get(section, key)
+            except (configparser.NoOptionError, configparser.NoSectionError):
+                return default
+
+    def set(self, filename: str, section: str, key: str, value) -> None:
+        with self.lock:
+            entry = self._entry(filename)
+            value = str(value)
+            if entry.parser.has_section(section) and entry.parser.get(section, key, fallback=None) == value:
+                return
+            operation = ("set", section, key, value)
+            IniStore._apply(entry.parser, operation)
+            self._mark_dirty(entry, operation)
+
+    def remove_option(self, filename: str, section: str, key: str) -> None:
+        with self.lock:
+            entry = self._entry(filename)
+            if entry.parser.has_option(section, key):
+                operation = ("remove_option", section, key)
+                IniStore._apply(entry.parser, operation)
+                self._mark_dirty(entry, operation)
+
+    def remove_section(self, filename: str, section: str) -> None:
+        with self.lock:
+            entry = self._entry(filename)
+            if entry.parser.has_section(section):
+                operation = ("remove_section", section)
+                IniStore._apply(entry.parser, operation)
+                self._mark_dirty(entry, operation)
+
+    def mark_dirty(self, filename: str, parser: configparser.ConfigParser | None = None) -> None:
+        """Schedule a flush of the whole parser of filename (optionally replacing it with parser)."""
+        with self.lock:
+            entry = self._entry(filename)
+            if parser is not None:
+                entry.parser = parser
+            self._mark_dirty(entry, None)
+
+    def update(self) -> None:
+        """Flush the files whose debounce delay elapsed. Cheap when nothing is due."""
+        if self.next_flush and time.perf_counter() >= self.next_flush:
+            with self.lock:
+                self._flush_due(time.perf_counter())
+
+    def flush(self, filename: str | None = None) -> None:
+        """Write pending changes now, of filename or of every file."""
+        with self.lock:
+            entries = self.files.values() if filename is None else [self.files.get(os.path.abspath(filename))]
+            for entry in entries:
+                if entry is not None and entry.flush_due:
+                    self._write(entry)
+            self._flush_due(time.perf_counter())
+
+    def invalidate(self, filename: str | None = None) -> None:
+        """Flush and forget cached content so the next read parses from disk."""
+        with self.lock:
+            self.flush(filename)
+            if filename is None:
+                self.files.clear()
+            else:
+                self.files.pop(os.path.abspath(filename), None)
+
+    def get_stats(self) -> dict:
+        with self.lock:
+            return {
+                "files": len(self.files),
+                "dirty": sum(1 for entry in self.files.values() if entry.flush_due),
+                "hits": self.hits,
+                "misses": self.misses,
+                "reloads": self.reloads,
+                "writes": self.writes,
+                "flushes": self.flushes,
+                "flush_errors": self.flush_errors,
+            }
+
+    def reset_stats(self) -> None:
+        self.hits = self.misses = self.reloads = self.writes = self.flushes = self.flush_errors = 0
+
+#endregion
+
 #region IniHandler
 class IniHandler:
     def __init__(self, filename: str):
         """
         Initialize the handler with the given INI file.
+        Content is shared through IniStore: reads come from memory and writes are flushed in batches.
         """
         self.filename = filename
-        self.last_modified = 0
-        self.config = configparser.ConfigParser()
+        self.store = IniStore()
+        self.config = self.store.get_parser(filename)
 
     # ----------------------------
     # Core Methods
     # ----------------------------
     
     def reload(self) -> configparser.ConfigParser:
-        """Reload the INI file only if it has changed.
+        """Return the current content of the INI file, re-parsed by IniStore if it changed on disk.
         
         If the file doesn't exist, create an empty file.
         """
-        if not os.path.exists(self.filename):
+        if not self.store.exists(self.filename):
             # Create an empty file if it doesn't exist.
             with open(self.filename, 'w') as f:
                 f.write("")
-            # Update last_modified since a new file was created.
-            self.last_modified = os.path.getmtime(self.filename)
-            return self.config
-
-        current_mtime = os.path.getmtime(self.filename)
-        if current_mtime != self.last_modified:
-            self.last_modified = current_mtime
-            self.config.read(self.filename)
+            self.store.invalidate(self.filename)
+        self.config = self.store.get_parser(self.filename)
         return self.config
 
     def save(self, config: configparser.ConfigParser) -> None:
         """
-        Save changes to the INI file.
+        Save changes to the INI file (debounced, see IniStore).
         """
-        with open(self.filename, 'w') as configfile:
-            config.write(configfile)
+        self.store.mark_dirty(self.filename, config)
+
+    def flush(self) -> None:
+        """
+        Write pending changes to disk now.
+        """
+        self.store.flush(self.filename)
 
     # ----------------------------
     # Read Methods
@@ -115,11 +381,8 @@ class IniHandler:
         """
         Write or update a key-value pair.
         """
-        config = self.reload()
-        if not config.has_section(section):
-            config.add_section(section)
-        config.set(section, key, str(value))
-        self.save(config)
+        self.reload()
+        self.store.set(self.filename, section, key, value)
 
     # ----------------------------
     # Delete Methods
@@ -129,19 +392,15 @@ class IniHandler:
         """
         Delete a specific key.
         """
-        config = self.reload()
-        if config.has_section(section) and config.has_option(section, key):
-            config.remove_option(section, key)
-            self.save(config)
+        self.reload()
+        self.store.remove_option(self.filename, section, key)
 
     def delete_section(self, section: str) -> None:
         """
         Delete an entire section.
         """
-        config = self.reload()
-        if config.has_section(section):
-            config.remove_section(section)
-            self.save(config)
+        self.reload()
+        self.store.remove_section(self.filename, section)
 
     # ----------------------------
     # Utility Methods
@@ -17,6 +17,7 @@ from .Player import Player
 from .Agent import Agent
 """
 from .GlobalCache import GLOBAL_CACHE
+from .GlobalCache.CoroutineScheduler import Sleep, WaitUntil
 
 arrived_timer = Timer()
 
@@ -62,16 +63,9 @@ class Routines:
         class Agents:
             @staticmethod
             def InDanger(aggro_area=Range.Earshot, aggressive_only = False):
-                from .AgentArray import AgentArray
-                enemy_array = GLOBAL_CACHE.AgentArray.GetEnemyArray()
-                enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: Utils.Distance(GLOBAL_CACHE.Player.GetXY(), GLOBAL_CACHE.Agent.GetXY(agent_id)) <= aggro_area.value)
-                enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsAlive(agent_id))
-                enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Player.GetAgentID() != agent_id)
-                if aggressive_only:
-                    enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsAggressive(agent_id))
-                if len(enemy_array) > 0:
-                    return True
-                return False
+                # early-exit check on the per-tick aggro bands instead of filtering the enemy array
+                aggro = GLOBAL_CACHE.AgentArray.Aggro(GLOBAL_CACHE.Player.GetAgentID())
+                return aggro.Any(aggro_area.value, aggressive_only)
             
     
             @staticmethod
@@ -673,7 +667,7 @@ class Routines:
             Returns: List of enemy agent IDs
             """
             enemy_array = AgentArray.GetEnemyArray()
-            enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: Utils.Distance((x,y), GLOBAL_CACHE.Agent.GetXY(agent_id)) <= max_distance)
+            enemy_array = AgentArray.Filter.ByDistance(enemy_array, (x,y), max_distance)
             enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsAlive(agent_id))
             enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Player.GetAgentID() != agent_id)
             if aggressive_only:
@@ -866,69 +860,52 @@ class Routines:
             return 0
 
         @staticmethod
-        def GetBestTarget(a_range=1320, casting_only=False, no_hex_only=False, enchanted_only=False):
+        def GetRankedTargets(a_range=1320, casting_only=False, no_hex_only=False, enchanted_only=False, melee_only=False, scoring=None):
             """
-            Purpose: Returns the best target within the specified range based on criteria like whether the agent is casting, enchanted, or hexed.
+            Purpose: Returns the living enemies within range, ranked by a pluggable scorer.
             Args:
                 a_range (int): The maximum distance for selecting targets.
                 casting_only (bool): If True, only select agents that are casting.
                 no_hex_only (bool): If True, only select agents that are not hexed.
                 enchanted_only (bool): If True, only select agents that are enchanted.
-            Returns: PyAgent.PyAgent: The best target agent object, or None if no target matches.
+                melee_only (bool): If True, only select agents wielding melee weapons.
+                scoring (callable): One of AgentArray.Scoring, defaults to ClusterDensity.
+            Returns: list[int]: Agent IDs ordered from best to worst.
             """
             from .AgentArray import AgentArray
 
-            best_target = None
-            lowest_sum = float('inf')
-            nearest_enemy = None
-            nearest_distance = float('inf')
-            lowest_hp_target = None
-            lowest_hp = float('inf')
-
             player_pos = GLOBAL_CACHE.Player.GetXY()
             agents = GLOBAL_CACHE.AgentArray.GetEnemyArray()
-            agents = AgentArray.Filter.ByCondition(agents, lambda agent_id: GLOBAL_CACHE.Agent.IsAlive(agent_id))
             agents = AgentArray.Filter.ByDistance(agents, player_pos, a_range)
+            agents = AgentArray.Filter.ByCondition(agents, lambda agent_id: GLOBAL_CACHE.Agent.IsAlive(agent_id))
+
+            if melee_only:
+                agents = AgentArray.Filter.ByCondition(agents, lambda agent_id: GLOBAL_CACHE.Agent.IsMelee(agent_id))
 
             if enchanted_only:
                 agents = AgentArray.Filter.ByCondition(agents, lambda agent_id: GLOBAL_CACHE.Agent.IsEnchanted(agent_id))
 
             if no_hex_only:
-                agents = AgentArray.Filter.ByCondition(agents, lambda agent_id: GLOBAL_CACHE.Agent.IsHexed(agent_id))
+                agents = AgentArray.Filter.ByCondition(agents, lambda agent_id: not GLOBAL_CACHE.Agent.IsHexed(agent_id))
 
             if casting_only:
                 agents = AgentArray.Filter.ByCondition(agents, lambda agent_id: GLOBAL_CACHE.Agent.IsCasting(agent_id))
 
-            for agent_id in agents:
-                agent = GLOBAL_CACHE.Player.GetAgentID()
-                x,y = GLOBAL_CACHE.Agent.GetXY(agent)
+            return AgentArray.Routines.RankTargets(agents, scoring, player_pos)
 
-                distance_to_self = Utils.Distance(GLOBAL_CACHE.Player.GetXY(), (x, y))
-
-                # Track the nearest enemy
-                if distance_to_self < nearest_distance:
-                    nearest_enemy = agent
-                    nearest_distance = distance_to_self
-
-                # Track the agent with the lowest HP
-                agent_hp = GLOBAL_CACHE.Agent.GetHealth(agent)
-                if agent_hp < lowest_hp:
-                    lowest_hp = agent_hp
-                    lowest_hp_target = agent
-
-                # Calculate the sum of distances between this agent and other agents within range
-                sum_distances = 0
-                for other_agent_id in agents:
-                    other_x, other_y = GLOBAL_CACHE.Agent.GetXY(other_agent_id)
-                    #no need to filter any agent since the array is filtered already
-                    sum_distances += Utils.Distance((x, y), (other_x, other_y))
-
-                # Track the best target based on the sum of distances
-                if sum_distances < lowest_sum:
-                    lowest_sum = sum_distances
-                    best_target = agent
-
-            return best_target
+        @staticmethod
+        def GetBestTarget(a_range=1320, casting_only=False, no_hex_only=False, enchanted_only=False):
+            """
+            Purpose: Returns the best target within the specified range based on criteria like whether the agent is casting, enchanted, or hexed.
+            Args:
+                a_range (int): The maximum distance for selecting targets.
+                casting_only (bool): If True, only select agents that are casting.
+                no_hex_only (bool): If True, only select agents that are not hexed.
+                enchanted_only (bool): If True, only select agents that are enchanted.
+            Returns: int: The agent ID of the most balled up target, or None if no target matches.
+            """
+            ranked = Routines.Agents.GetRankedTargets(a_range, casting_only, no_hex_only, enchanted_only)
+            return ranked[0] if ranked else None
 
         @staticmethod
         def GetBestMeleeTarget(a_range=1320, casting_only=False, no_hex_only=False, enchanted_only=False):
@@ -939,64 +916,10 @@ class Routines:
                 casting_only (bool): If True, only select agents that are casting.
                 no_hex_only (bool): If True, only select agents that are not hexed.
                 enchanted_only (bool): If True, only select agents that are enchanted.
-            Returns: PyAgent.PyAgent: The best melee target agent object, or None if no target matches.
+            Returns: int: The agent ID of the most balled up melee target, or None if no target matches.
             """
-            from .AgentArray import AgentArray
-
-            best_target = None
-            lowest_sum = float('inf')
-            nearest_enemy = None
-            nearest_distance = float('inf')
-            lowest_hp_target = None
-            lowest_hp = float('inf')
-
-            player_pos = GLOBAL_CACHE.Player.GetXY()
-            agents = AgentArray.GetEnemyArray()
-
-            # Filter out dead, distant, and non-melee agents
-            agents = AgentArray.Filter.ByCondition(agents, lambda agent_id: GLOBAL_CACHE.Agent.IsAlive(agent_id))
-            agents = AgentArray.Filter.ByCondition(agents, lambda agent_id: GLOBAL_CACHE.Agent.IsMelee(agent_id))
-            agents = AgentArray.Filter.ByDistance(agents, player_pos, a_range)
-
-
-            if enchanted_only:
-                agents = AgentArray.Filter.ByCondition(agents, lambda agent_id: GLOBAL_CACHE.Agent.IsEnchanted(agent_id))
-
-            if no_hex_only:
-                agents = AgentArray.Filter.ByCondition(agents, lambda agent_id: GLOBAL_CACHE.Agent.IsHexed(agent_id))
-
-            if casting_only:
-                agents = AgentArray.Filter.ByCondition(agents, lambda agent_id: GLOBAL_CACHE.Agent.IsCasting(agent_id))
-
-
-            for agent_id in agents:
-                
-                x, y = GLOBAL_CACHE.Agent.GetXY(agent_id)
-
-                distance_to_self = Utils.Distance(GLOBAL_CACHE.Player.GetXY(), (x, y))
-
-                # Track the nearest melee enemy
-                if distance_to_self < nearest_distance:
-                    nearest_distance = distance_to_self
-
-                # Track the agent with the lowest HP
-                agent_hp = GLOBAL_CACHE.Agent.GetHealth(agent_id) 
-                if agent_hp < lowest_hp:
-                    lowest_hp = agent_hp
-
-
-                # Calculate the sum of distances between this agent and other agents within range
-                sum_distances = 0
-                for other_agent_id in agents:
-                    other_agent_x, other_agent_y = GLOBAL_CACHE.Agent.GetXY(other_agent_id)
-                    sum_distances += Utils.Distance((x, y), (other_agent_x, other_agent_y))
-
-                # Track the best melee target based on the sum of distances
-                if sum_distances < lowest_sum:
-                    lowest_sum = sum_distances
-                    best_target = agent_id
-
-            return best_target
+            ranked = Routines.Agents.GetRankedTargets(a_range, casting_only, no_hex_only, enchanted_only, melee_only=True)
+            return ranked[0] if ranked else None
         
         @staticmethod
         def GetPartyTargetID():
@@ -1809,10 +1732,51 @@ class Routines:
     class Yield:
         @staticmethod
         def wait(ms: int):
-            import time
-            start = time.time()
-            while (time.time() - start) * 1000 < ms:
-                yield
+            # The Sleep request lets GLOBAL_CACHE.CoroutineScheduler park the coroutine until it is due;
+            # loops that resume the generator every frame just keep polling the deadline.
+            request = Sleep(ms)
+            while not request.is_due():
+                yield request
+
+        @staticmethod
+        def wait_until(condition: Callable[[], bool], timeout_ms: int | None = None, poll_ms: int = 0):
+            """
+            Purpose: Wait until condition() is true, checking it without resuming the coroutine when it runs on the scheduler.
+            Args:
+                condition (Callable[[], bool]): The condition to wait for.
+                timeout_ms (int | None): Give up after this long, None waits forever.
+                poll_ms (int): Interval between checks, 0 checks every frame.
+            Returns: bool: True if the condition was met, False on timeout.
+            """
+            request = WaitUntil(condition, timeout_ms, poll_ms)
+            while True:
+                result = yield request
+                if result is not None:
+                    return result
+                if condition():
+                    return True
+                if request.expired():
+                    return False
+
+        @staticmethod
+        def wait_for_event(event: str, timeout_ms: int | None = None):
+            """
+            Purpose: Wait until GLOBAL_CACHE.CoroutineScheduler.signal(event) is called.
+            Args:
+                event (str): The event name.
+                timeout_ms (int | None): Give up after this long, None waits forever.
+            Returns: The signalled value, or None on timeout.
+            """
+            scheduler = GLOBAL_CACHE.CoroutineScheduler
+            request = scheduler.wait_for_event(event, timeout_ms)
+            while True:
+                result = yield request
+                if result is not None:
+                    return result
+                if scheduler.event_count(event) > request.sequence:
+                    return scheduler.event_value(event)
+                if request.expired():
+                    return None
                 
         class Player:
             @staticmethod
@@ -1,4 +1,5 @@
 from HeroAI.custom_skill import CustomSkillClass
+from HeroAI.skill_priority import SkillPriorityCache
 from HeroAI.types import SkillType,SkillNature, Skilltarget
 from .Agent import Agent
 from.AgentArray import AgentArray
@@ -176,6 +177,7 @@ class SkillManager:
             self.skill_id = SkillIDS()
             self.skills: list[SkillManager.Autocombat._SkillData] = []
             self.skill_order = [0] * MAX_SKILLS
+            self.prioritized_order = None  # SkillPriorityCache order the skills were built from
             self.skill_pointer = 0
             self.aftercast_timer = ThrottledTimer()
             self.stay_alert_timer = ThrottledTimer(2500)
@@ -196,16 +198,31 @@ class SkillManager:
         def PrioritizeSkills(self):
             """
             Create a priority-based skill execution order.
+            The order is memoized on the equipped skill ids (SkillPriorityCache); while the bar is unchanged
+            only the skillbar data of the slots is read again.
             """
-            #initialize skillbar
-            original_skills = []
-            for i in range(MAX_SKILLS):
-                original_skills.append(self._SkillData(i+1))
+            skill_ids = tuple(SkillBar.GetSkillIDBySlot(i+1) for i in range(MAX_SKILLS))
+            order = SkillPriorityCache().GetOrder("Autocombat", skill_ids, self._OrderSkills)
+            if order is self.prioritized_order:
+                for skill, i in zip(self.skills, order):
+                    skill.skillbar_data = SkillBar.GetSkillData(i+1)
+                return
+
+            self.skill_order[:] = order
+            self.prioritized_order = order
+            self.skills = [self._SkillData(i+1) for i in order]
+
+        def _OrderSkills(self, skill_ids):
+            """
+            Order the slots of a skillbar by skill nature, skill type and combo.
+            Returns the 0 based slot indices in execution order.
+            """
+            custom_skills = [SkillManager.Autocombat.custom_skill_data_handler.get_skill(skill_id) for skill_id in skill_ids]
 
             # Initialize the pointer and tracking list
             ptr = 0
             ptr_chk = [False] * MAX_SKILLS
-            ordered_skills = []
+            order = []
             
             priorities = [
                 SkillNature.Interrupt,
@@ -220,12 +237,10 @@ class SkillManager:
 
             for priority in priorities:
                 for i in range(ptr,MAX_SKILLS):
-                    skill = original_skills[i]
-                    if not ptr_chk[i] and skill.custom_skill_data.Nature == priority.value:
-                        self.skill_order[ptr] = i
+                    if not ptr_chk[i] and custom_skills[i].Nature == priority.value:
                         ptr_chk[i] = True
                         ptr += 1
-                        ordered_skills.append(skill)
+                        order.append(i)
             
             skill_types = [
                 SkillType.Form,
@@ -252,32 +267,27 @@ class SkillManager:
             
             for skill_type in skill_types:
                 for i in range(ptr,MAX_SKILLS):
-                    skill = original_skills[i]
-                    if not ptr_chk[i] and skill.custom_skill_data.SkillType == skill_type.value:
-                        self.skill_order[ptr] = i
+                    if not ptr_chk[i] and custom_skills[i].SkillType == skill_type.value:
                         ptr_chk[i] = True
                         ptr += 1
-                        ordered_skills.append(skill)
+                        order.append(i)
 
             combos = [3, 2, 1]  # Dual attack, off-hand attack, lead attack
             for combo in combos:
                 for i in range(ptr,MAX_SKILLS):
-                    skill = original_skills[i]
-                    if not ptr_chk[i] and Skill.Data.GetCombo(skill.skill_id) == combo:
-                        self.skill_order[ptr] = i
+                    if not ptr_chk[i] and Skill.Data.GetCombo(skill_ids[i]) == combo:
                         ptr_chk[i] = True
                         ptr += 1
-                        ordered_skills.append(skill)
+                        order.append(i)
             
             # Fill in remaining unprioritized skills
             for i in range(MAX_SKILLS):
                 if not ptr_chk[i]:
-                    self.skill_order[ptr] = i
                     ptr_chk[i] = True
                     ptr += 1
-                    ordered_skills.append(original_skills[i])
+                    order.append(i)
             
-            self.skills = ordered_skills
+            return order
         
         def GetSkills(self):
             """
@@ -344,10 +354,8 @@ class SkillManager:
             return 0
         
         def InAggro(self):
-            if self.stay_alert_timer.IsExpired():
-                in_danger = Routines.Checks.Agents.InDanger(Range.Earshot, self.aggressive_enemies_only)
-            else:
-                in_danger = Routines.Checks.Agents.InDanger(Range.Spellcast, self.aggressive_enemies_only)
+            aggro_range = Range.Earshot if self.stay_alert_timer.IsExpired() else Range.Spellcast
+            in_danger = Routines.Checks.Agents.InDanger(aggro_range, self.aggressive_enemies_only)
                 
             if in_danger:
                 self.stay_alert_timer.Reset()
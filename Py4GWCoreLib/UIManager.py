@@ -2,6 +2,7 @@
 import PyUIManager
 from typing import Dict, List, Tuple, Optional
 import json
+import os
 import PyOverlay
 from collections import deque, defaultdict
 from .Py4GWcorelib import ConsoleLog, Console
@@ -14,6 +15,182 @@ DIALOG_CHILD_OFFSET = list(DEFAULT_OFFSET)
 # —— Globals —————————————————
 _overlay = PyOverlay.Overlay()
 
+
+class UIFrameIndex:
+    """
+    Snapshot of the frame tree, rebuilt only when the frame array changes.
+
+    Reading the tree costs one PyUIManager.UIFrame per frame; afterwards parent/child/offset queries,
+    frame paths and path -> frame lookups are dictionary hits instead of a native call per hop.
+    """
+    def __init__(self):
+        self.frame_array: List[int] = []
+        self.parent: Dict[int, int] = {}
+        self.child_offset: Dict[int, int] = {}
+        self.frame_hash: Dict[int, int] = {}
+        self.order: Dict[int, int] = {}
+        self.children: Dict[int, List[int]] = defaultdict(list)
+        self.generation = 0
+        self._valid = False
+        self._paths: Dict[int, str] = {}
+        self._path_to_frame: Optional[Dict[str, int]] = None
+
+    def Refresh(self, frame_array: Optional[List[int]] = None) -> bool:
+        """
+        Rebuilds the index if the frame array differs from the indexed one.
+
+        :param frame_array: The current frame array, fetched if not given.
+        :return: True if the index was rebuilt.
+        """
+        if frame_array is None:
+            frame_array = PyUIManager.UIManager.get_frame_array()
+        if self._valid and frame_array == self.frame_array:
+            return False
+
+        parent, child_offset, frame_hash, order = {}, {}, {}, {}
+        children = defaultdict(list)
+        for position, fid in enumerate(frame_array):
+            try:
+                frame = PyUIManager.UIFrame(fid)
+                pid = frame.parent_id
+                parent[fid] = pid
+                child_offset[fid] = frame.child_offset_id
+                frame_hash[fid] = frame.frame_hash
+            except Exception:
+                continue
+            order[fid] = position
+            children[pid].append(fid)
+
+        self.frame_array = list(frame_array)
+        self.parent, self.child_offset, self.frame_hash, self.order = parent, child_offset, frame_hash, order
+        self.children = children
+        self._paths = {}
+        self._path_to_frame = None
+        self.generation += 1
+        self._valid = True
+        return True
+
+    def Invalidate(self):
+        """Forces a rebuild on the next Refresh."""
+        self._valid = False
+
+    def IsCurrent(self, frame_id: int) -> bool:
+        """Checks one indexed frame against the game, catching frame ids reused within an unchanged frame array."""
+        if frame_id not in self.parent:
+            return False
+        try:
+            frame = PyUIManager.UIFrame(frame_id)
+        except Exception:
+            return False
+        return (frame.parent_id == self.parent[frame_id]
+                and frame.child_offset_id == self.child_offset[frame_id]
+                and frame.frame_hash == self.frame_hash[frame_id])
+
+    def GetPath(self, frame_id: int) -> str:
+        """Same format as UIManager.ConstructFramePath, from the indexed tree."""
+        path = self._paths.get(frame_id)
+        if path is not None:
+            return path
+        if frame_id == 0 or frame_id not in self.parent:
+            return ""
+
+        frame_hash = self.frame_hash[frame_id]
+        if frame_hash != 0:
+            path = str(frame_hash)
+        else:
+            offsets = []
+            parent_hash = 0
+            current = frame_id
+            while current != 0:
+                offsets.append(str(self.child_offset.get(current, 0)))
+                parent_id = self.parent.get(current, 0)
+                parent_hash = self.frame_hash.get(parent_id, 0)
+                if parent_hash:
+                    break
+                current = parent_id
+            path = str(parent_hash) + "," + ",".join(reversed(offsets)) if parent_hash else ""
+
+        self._paths[frame_id] = path
+        return path
+
+    def FindFrameByPath(self, frame_path: str) -> int:
+        """
+        :param frame_path: A path as produced by GetPath.
+        :return: The first frame in frame array order with that path, otherwise 0.
+        """
+        if self._path_to_frame is None:
+            path_to_frame = {}
+            for fid in self.frame_array:
+                path = self.GetPath(fid)
+                if path:
+                    path_to_frame.setdefault(path, fid)
+            self._path_to_frame = path_to_frame
+        return self._path_to_frame.get(frame_path, 0)
+
+    def GetDescendants(self, root: int) -> List[int]:
+        """All frames below root in breadth-first order."""
+        descendants = []
+        queue = deque([root])
+        while queue:
+            for child in self.children.get(queue.popleft(), ()):
+                descendants.append(child)
+                queue.append(child)
+        return descendants
+
+    def GetChildrenByOffsets(self, root: int, child_offsets: List[int]) -> List[int]:
+        """All frames reached from root by following child_offsets, in frame array order."""
+        level = [root]
+        for offset in child_offsets:
+            level = [child for fid in level for child in self.children.get(fid, ()) if self.child_offset[child] == offset]
+            if not level:
+                return []
+        return sorted(level, key=lambda fid: self.order.get(fid, -1))
+
+
+class FrameAliasFile:
+    """Label -> frame path mapping of an alias JSON file, reloaded only when the file changes."""
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.mtime_ns = -1
+        self.aliases: Dict[str, str] = {}
+        self.label_to_path: Dict[str, str] = {}
+
+    def Update(self) -> bool:
+        try:
+            mtime_ns = os.stat(self.filename).st_mtime_ns
+        except OSError:
+            self.mtime_ns, self.aliases, self.label_to_path = -1, {}, {}
+            return False
+        if mtime_ns == self.mtime_ns:
+            return True
+        try:
+            with open(self.filename, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, json.JSONDecodeError):
+            self.mtime_ns, self.aliases, self.label_to_path = -1, {}, {}
+            return False
+
+        label_to_path: Dict[str, str] = {}
+        for path, alias in data.items():
+            label_to_path.setdefault(alias, path)   # first path of a label wins, as in a linear search
+        self.mtime_ns = mtime_ns
+        self.aliases = data
+        self.label_to_path = label_to_path
+        return True
+
+
+_frame_index = UIFrameIndex()
+_alias_files: Dict[str, FrameAliasFile] = {}
+
+
+def _get_alias_file(filename: str) -> FrameAliasFile:
+    alias_file = _alias_files.get(filename)
+    if alias_file is None:
+        alias_file = _alias_files[filename] = FrameAliasFile(filename)
+    alias_file.Update()
+    return alias_file
+
+
 class UIManager:  
     global overlay
     @staticmethod
@@ -76,6 +253,7 @@ class UIManager:
 
         with open(filename, "w", encoding="utf-8") as file:
             json.dump(data, file, indent=4)  # Save back to file
+        _alias_files.pop(filename, None)
 
     @staticmethod
     def GetEntryFromJSON(filename: str, frame_id: int) -> str:
@@ -86,15 +264,13 @@ class UIManager:
         :param frame_id: The frame ID to locate.
         :return: The alias if found, otherwise None.
         """
-        try:
-            with open(filename, "r", encoding="utf-8") as file:
-                data = json.load(file)  # Load JSON data
-        except (FileNotFoundError, json.JSONDecodeError):
+        alias_file = _get_alias_file(filename)
+        if not alias_file.aliases:
             return "" # Return empty string if file doesn't exist or is invalid
 
         frame_path = UIManager.ConstructFramePath(frame_id)
         
-        return data.get(frame_path) or ""  # Return the alias if found, otherwise an empty string
+        return alias_file.aliases.get(frame_path) or ""  # Return the alias if found, otherwise an empty string
 
     @staticmethod
     def GetFrameIDByCustomLabel(filename: str = ".\\Py4GWCoreLib\\frame_aliases.json", frame_label: str = "Game") -> int:
@@ -105,29 +281,30 @@ class UIManager:
         :param frame_label: The label corresponding to a hashed frame path.
         :return: The frame_id if found, otherwise 0.
         """
-        try:
-            with open(filename, "r", encoding="utf-8") as file:
-                data = json.load(file)  # Load JSON data
-        except (FileNotFoundError, json.JSONDecodeError):
-            return 0  # Return 0 if the file is missing or invalid
-
-        # Find the frame path corresponding to the given label
-        target_path = next((path for path, alias in data.items() if alias == frame_label), None)
+        # The alias file is parsed once and re-read only when it changes on disk
+        target_path = _get_alias_file(filename).label_to_path.get(frame_label)
         if not target_path:
-            return 0  # Label not found in JSON
+            return 0  # Label not found in JSON (or the file is missing or invalid)
 
-        # Get all frame IDs
-        frame_array = UIManager.GetFrameArray()
+        # Path -> frame lookups come from the frame index, rebuilt only when the frame array changes
+        _frame_index.Refresh()
+        frame_id = _frame_index.FindFrameByPath(target_path)
+        if frame_id and not _frame_index.IsCurrent(frame_id):
+            _frame_index.Invalidate()
+            _frame_index.Refresh()
+            frame_id = _frame_index.FindFrameByPath(target_path)
 
-        # Search through frames
-        for frame_id in frame_array:
-            frame = PyUIManager.UIFrame(frame_id)  # Create UIFrame object
-            frame_path = UIManager.ConstructFramePath(frame.frame_id)  # Get full path
+        return frame_id  # 0 if no matching frame found
 
-            if frame_path == target_path:
-                return frame.frame_id  # Found the correct frame_id
+    @staticmethod
+    def GetFrameIndex() -> UIFrameIndex:
+        """
+        Get the frame tree index, refreshed against the current frame array.
 
-        return 0  # No matching frame found
+        :return: UIFrameIndex: The shared frame index.
+        """
+        _frame_index.Refresh()
+        return _frame_index
 
 
     
@@ -243,26 +420,10 @@ class UIManager:
         :param child_offsets: List of offsets to follow
         :return: List of matching frame IDs
         """
-        frame_array = UIManager.GetFrameArray()
         root_frame_id = UIManager.GetFrameIDByHash(parent_hash)
-
-        matching_ids = []
-
-        for fid in frame_array:
-            current = PyUIManager.UIFrame(fid)
-            offsets = []
-            trace = current
-
-            for _ in range(len(child_offsets)):
-                offsets.insert(0, trace.child_offset_id)
-                if trace.parent_id == 0:
-                    break
-                trace = PyUIManager.UIFrame(trace.parent_id)
-
-            if trace.frame_id == root_frame_id and offsets == child_offsets:
-                matching_ids.append(current.frame_id)
-
-        return matching_ids
+        if not root_frame_id:
+            return []
+        return UIManager.GetFrameIndex().GetChildrenByOffsets(root_frame_id, list(child_offsets))
     
     @staticmethod
     def SortFramesByVerticalPosition(frame_ids: List[int]):
@@ -534,15 +695,9 @@ class UIManager:
         if root == 0 or not UIManager.IsVisible(root):
             return
 
-        # build parent->children map
-        frame_array = UIManager.GetFrameArray()
-        children_map = defaultdict(list)
-        for fid in frame_array:
-            try:
-                pid = PyUIManager.UIFrame(fid).parent_id
-                children_map[pid].append(fid)
-            except:
-                pass
+        # parent->children map from the frame index
+        index = UIManager.GetFrameIndex()
+        children_map = index.children
 
         # BFS: pick the container with the most template_type==1 children
         queue = deque([root])
@@ -551,11 +706,7 @@ class UIManager:
         while queue:
             cur = queue.popleft()
             kids = children_map.get(cur, [])
-            count = sum(
-                1 for c in kids
-                if UIManager.IsVisible(c)
-                and getattr(PyUIManager.UIFrame(c), "template_type", None) == 1
-            )
+            count = sum(1 for c in kids if UIManager._IsVisibleButton(c))
             if count > best_count and count >= 2:
                 best_count, best = count, cur
             for c in kids:
@@ -568,12 +719,20 @@ class UIManager:
         path = []
         cur = best
         while cur != root:
-            parent = PyUIManager.UIFrame(cur).parent_id
+            parent = index.parent[cur]
             siblings = children_map[parent]
             path.insert(0, siblings.index(cur))
             cur = parent
 
         DIALOG_CHILD_OFFSET = path
+
+    @staticmethod
+    def _IsVisibleButton(frame_id: int) -> bool:
+        try:
+            frame = PyUIManager.UIFrame(frame_id)
+        except Exception:
+            return False
+        return frame.is_visible and getattr(frame, "template_type", None) == 1
     
     @staticmethod
     def GetDialogButtonIDs(debug: bool = False) -> list[int]:
@@ -587,11 +746,7 @@ class UIManager:
 
         # try the offset first
         ids = UIManager.GetAllChildFrameIDs(NPC_DIALOG_HASH, DIALOG_CHILD_OFFSET)
-        valid = [
-            fid for fid in ids
-            if UIManager.IsVisible(fid)
-            and getattr(PyUIManager.UIFrame(fid), "template_type", None) == 1
-        ]
+        valid = [fid for fid in ids if UIManager._IsVisibleButton(fid)]
         if valid:
             sorted_ids = [fid for fid, _ in UIManager.SortFramesByVerticalPosition(valid)]
             if debug:
@@ -603,28 +758,8 @@ class UIManager:
             ConsoleLog("DialogHelper", "Falling back to BFS for dialog buttons", Console.MessageType.Info)
 
         root = UIManager.GetFrameIDByHash(NPC_DIALOG_HASH)
-        frame_array = UIManager.GetFrameArray()
-        children_map = defaultdict(list)
-        for fid in frame_array:
-            try:
-                pid = PyUIManager.UIFrame(fid).parent_id
-                children_map[pid].append(fid)
-            except:
-                pass
-
-        descendants = []
-        queue = deque([root])
-        while queue:
-            cur = queue.popleft()
-            for c in children_map.get(cur, []):
-                descendants.append(c)
-                queue.append(c)
-
-        valid = [
-            fid for fid in descendants
-            if UIManager.IsVisible(fid)
-            and getattr(PyUIManager.UIFrame(fid), "template_type", None) == 1
-        ]
+        descendants = UIManager.GetFrameIndex().GetDescendants(root)
+        valid = [fid for fid in descendants if UIManager._IsVisibleButton(fid)]
         sorted_ids = [fid for fid, _ in UIManager.SortFramesByVerticalPosition(valid)]
         if debug:
             ConsoleLog("DialogHelper", f"BFS IDs → {sorted_ids}", Console.MessageType.Info)
@@ -31,6 +31,7 @@ import Py2DRenderer
 from .enums import *
 from .IconsFontAwesome5 import *
 from .Map import *
+from .Pathfinding import *
 from .ImGui import *
 from .model_data import *
 from .Agent import *
@@ -364,14 +364,20 @@ class Compass():
     def DrawAgent(self, visible, size, shape, color, fill_range, fill_color, x, y, rotation, is_alive, is_target):
         if not Map.IsMapReady() or not visible: return
 
-        if not is_alive:
-            col = Utils.ColorToTuple(color)
-            color = Color(int(col[0]*255), int(col[1]*255), int(col[2]*255), int(col[3]*255)).shift(Color(0,0,0,255), .4).to_color()
-
         x, y = Map.MiniMap.MapProjection.GamePosToScreen(x, y, *self.position.player_pos,
                                                                 self.position.current_pos.x, self.position.current_pos.y,
                                                                 self.position.current_size, self.position.rotation)
 
+        self.DrawMarker(visible, size, shape, color, fill_range, fill_color, x, y, rotation, is_alive, is_target)
+
+    def DrawMarker(self, visible, size, shape, color, fill_range, fill_color, x, y, rotation, is_alive, is_target):
+        """Draw a marker at screen position x, y."""
+        if not visible: return
+
+        if not is_alive:
+            col = Utils.ColorToTuple(color)
+            color = Color(int(col[0]*255), int(col[1]*255), int(col[2]*255), int(col[3]*255)).shift(Color(0,0,0,255), .4).to_color()
+
         line_col = Utils.RGBToColor(255,255,0,255) if is_target else Utils.RGBToColor(0,0,0,255)
         line_thickness = 3 if is_target else 1.5
 
@@ -427,10 +433,21 @@ class Compass():
             self.imgui.draw_list_add_quad(x1, y1, x2, y2, x3, y3, x4, y4, line_col, line_thickness)
 
     def DrawAgents(self):
+        if not Map.IsMapReady():
+            return
+
+        player_x, player_y = self.position.player_pos
+        culling_sq = self.position.culling**2
+
+        # markers are queued in draw order and projected to the compass in one batch
+        markers = []
+
+        def QueueAgent(*marker):
+            if marker[0]:
+                markers.append(marker)
+
         def GetAgentValid(agent):
-            if agent.id and Utils.Distance((agent.x, agent.y), self.position.player_pos) <= self.position.culling:
-                return True
-            return False
+            return bool(agent.id) and (agent.x - player_x)**2 + (agent.y - player_y)**2 <= culling_sq
         
         def GetAgentParams(agent):
             return self.position.rotation - agent.rotation_angle, agent.id == self.target_id, agent.living_agent.is_alive
@@ -498,7 +515,7 @@ class Compass():
                         fill_color = Utils.TupleToColor((color[0],color[1],color[2],self.config.spirit_alpha/255))
                     else:
                         fill_color = None
-                    self.DrawAgent(marker.visible, marker.size, marker.shape, marker.color, marker.fill_range, fill_color, agent.x, agent.y, rot, is_alive, is_target)
+                    QueueAgent(marker.visible, marker.size, marker.shape, marker.color, marker.fill_range, fill_color, agent.x, agent.y, rot, is_alive, is_target)
                     return True
             return False
 
@@ -511,7 +528,7 @@ class Compass():
             if not GetAgentValid(agent): continue
             rot, is_target, _ = GetAgentParams(agent)
 
-            self.DrawAgent(*self.config.markers['Signpost'].values(), agent.x, agent.y, rot, True, is_target) # type: ignore
+            QueueAgent(*self.config.markers['Signpost'].values(), agent.x, agent.y, rot, True, is_target) # type: ignore
 
         for agent in agent_array.GetRawSpiritPetArray():
             if not GetAgentValid(agent): continue
@@ -525,23 +542,23 @@ class Compass():
                 model_id = agent.living_agent.player_number
                 spirit_params = GetSpiritParams(model_id)
 
-                self.DrawAgent(*spirit_params, agent.x, agent.y, rot, is_alive, is_target) # type: ignore
+                QueueAgent(*spirit_params, agent.x, agent.y, rot, is_alive, is_target) # type: ignore
             else:
-                self.DrawAgent(*self.config.markers['Ally (Pet)'].values(), agent.x, agent.y, rot, is_alive, is_target) # type: ignore
+                QueueAgent(*self.config.markers['Ally (Pet)'].values(), agent.x, agent.y, rot, is_alive, is_target) # type: ignore
 
         for agent in agent_array.GetRawNeutralArray():
             if not GetAgentValid(agent): continue
             if CheckCustomMarkers(agent): continue
             rot, is_target, is_alive = GetAgentParams(agent)
 
-            self.DrawAgent(*self.config.markers['Neutral'].values(), agent.x, agent.y, rot, is_alive, is_target) # type: ignore
+            QueueAgent(*self.config.markers['Neutral'].values(), agent.x, agent.y, rot, is_alive, is_target) # type: ignore
 
         for agent in agent_array.GetRawMinionArray():
             if not GetAgentValid(agent): continue
             if CheckCustomMarkers(agent): continue
             rot, is_target, is_alive = GetAgentParams(agent)
 
-            self.DrawAgent(*self.config.markers['Ally (Minion)'].values(), agent.x, agent.y, rot, is_alive, is_target) # type: ignore
+            QueueAgent(*self.config.markers['Ally (Minion)'].values(), agent.x, agent.y, rot, is_alive, is_target) # type: ignore
 
         for agent in agent_array.GetRawEnemyArray():
             if not GetAgentValid(agent): continue
@@ -549,7 +566,7 @@ class Compass():
             rot, is_target, is_alive = GetAgentParams(agent)
 
             if agent.living_agent.has_boss_glow:
-                self.DrawAgent(self.config.markers['Enemy'].visible, self.config.markers['Enemy'].size*1.2, self.config.markers['Enemy'].shape, self.config.profession[agent.living_agent.profession.ToInt()],
+                QueueAgent(self.config.markers['Enemy'].visible, self.config.markers['Enemy'].size*1.2, self.config.markers['Enemy'].shape, self.config.profession[agent.living_agent.profession.ToInt()],
                                             self.config.markers['Enemy'].fill_range, self.config.markers['Enemy'].fill_color, agent.x, agent.y, rot, is_alive, is_target)
             elif agent.living_agent.is_spawned:
                 if not is_alive:
@@ -558,9 +575,9 @@ class Compass():
                 model_id = agent.living_agent.player_number
                 visible, size, shape, _, range, fill_color = GetSpiritParams(model_id)
 
-                self.DrawAgent(visible, size, shape, self.config.markers['Enemy'].color, range, fill_color, agent.x, agent.y, rot, is_alive, is_target)
+                QueueAgent(visible, size, shape, self.config.markers['Enemy'].color, range, fill_color, agent.x, agent.y, rot, is_alive, is_target)
             else:
-                self.DrawAgent(*self.config.markers['Enemy'].values(), agent.x, agent.y, rot, is_alive, is_target) # type: ignore
+                QueueAgent(*self.config.markers['Enemy'].values(), agent.x, agent.y, rot, is_alive, is_target) # type: ignore
 
         for agent in agent_array.GetRawAllyArray():
             if not GetAgentValid(agent): continue
@@ -568,11 +585,11 @@ class Compass():
             rot, is_target, is_alive = GetAgentParams(agent)
 
             if agent.living_agent.is_npc:
-                self.DrawAgent(*self.config.markers['Ally'].values(), agent.x, agent.y, rot, is_alive, is_target) # type: ignore
+                QueueAgent(*self.config.markers['Ally'].values(), agent.x, agent.y, rot, is_alive, is_target) # type: ignore
             elif agent.id == self.player_id:
                 player_agent = agent
             else:
-                self.DrawAgent(*self.config.markers['Players'].values(), agent.x, agent.y, rot, is_alive, is_target) # type: ignore
+                QueueAgent(*self.config.markers['Players'].values(), agent.x, agent.y, rot, is_alive, is_target) # type: ignore
 
         for agent in agent_array.GetRawNPCMinipetArray():
             if not GetAgentValid(agent): continue
@@ -580,17 +597,17 @@ class Compass():
             rot, is_target, is_alive = GetAgentParams(agent)
 
             if agent.living_agent.has_quest:
-                self.DrawAgent(self.config.markers['Ally (NPC)'].visible, self.config.markers['Ally (NPC)'].size, 'Star', self.config.markers['Ally (NPC)'].color,
+                QueueAgent(self.config.markers['Ally (NPC)'].visible, self.config.markers['Ally (NPC)'].size, 'Star', self.config.markers['Ally (NPC)'].color,
                                             self.config.markers['Ally (NPC)'].fill_range, self.config.markers['Ally (NPC)'].fill_color, agent.x, agent.y, rot, is_alive, is_target)
             elif agent.living_agent.level > 1:
-                self.DrawAgent(*self.config.markers['Ally (NPC)'].values(), agent.x, agent.y, rot, is_alive, is_target) # type: ignore
+                QueueAgent(*self.config.markers['Ally (NPC)'].values(), agent.x, agent.y, rot, is_alive, is_target) # type: ignore
             else:
-                self.DrawAgent(*self.config.markers['Minipet'].values(), agent.x, agent.y, rot, is_alive, is_target) # type: ignore
+                QueueAgent(*self.config.markers['Minipet'].values(), agent.x, agent.y, rot, is_alive, is_target) # type: ignore
 
         if player_agent and GetAgentValid(player_agent):
             rot, is_target, is_alive = GetAgentParams(player_agent)
 
-            self.DrawAgent(*self.config.markers['Player'].values(), player_agent.x, player_agent.y, rot, is_alive, is_target) # type: ignore
+            QueueAgent(*self.config.markers['Player'].values(), player_agent.x, player_agent.y, rot, is_alive, is_target) # type: ignore
 
         for agent in agent_array.GetRawItemArray():
             if not GetAgentValid(agent): continue
@@ -598,15 +615,22 @@ class Compass():
 
             match Item.item_instance(agent.item_agent.item_id).rarity.value:
                 case 1:
-                    self.DrawAgent(*self.config.markers['Item (Blue)'].values(), agent.x, agent.y, rot, True, is_target) # type: ignore
+                    QueueAgent(*self.config.markers['Item (Blue)'].values(), agent.x, agent.y, rot, True, is_target) # type: ignore
                 case 2:
-                    self.DrawAgent(*self.config.markers['Item (Purple)'].values(), agent.x, agent.y, rot, True, is_target) # type: ignore
+                    QueueAgent(*self.config.markers['Item (Purple)'].values(), agent.x, agent.y, rot, True, is_target) # type: ignore
                 case 3:
-                    self.DrawAgent(*self.config.markers['Item (Gold)'].values(), agent.x, agent.y, rot, True, is_target) # type: ignore
+                    QueueAgent(*self.config.markers['Item (Gold)'].values(), agent.x, agent.y, rot, True, is_target) # type: ignore
                 case 4:
-                    self.DrawAgent(*self.config.markers['Item (Green)'].values(), agent.x, agent.y, rot, True, is_target) # type: ignore
+                    QueueAgent(*self.config.markers['Item (Green)'].values(), agent.x, agent.y, rot, True, is_target) # type: ignore
                 case _:
-                    self.DrawAgent(*self.config.markers['Item (White)'].values(), agent.x, agent.y, rot, True, is_target) # type: ignore
+                    QueueAgent(*self.config.markers['Item (White)'].values(), agent.x, agent.y, rot, True, is_target) # type: ignore
+
+        projection = Map.MiniMap.Projection(player_x, player_y,
+                                            self.position.current_pos.x, self.position.current_pos.y,
+                                            self.position.current_size, self.position.rotation)
+        screen_xs, screen_ys = projection.GamePosArrayToScreen([marker[6] for marker in markers], [marker[7] for marker in markers])
+        for marker, x, y in zip(markers, screen_xs, screen_ys):
+            self.DrawMarker(*marker[:6], x, y, *marker[8:])
 
     def Draw(self):
         self.UpdateOrientation()
@@ -1,6 +1,7 @@
 from Py4GWCoreLib import GLOBAL_CACHE
 from Py4GWCoreLib import Timer
 module_name = "Drop Unyielding Aura"
+__widget__ = {"skippable": True}  # main() draws nothing, the widget scheduler may skip it on a frame
 
 class config:
     def __init__(self):
@@ -79,11 +79,7 @@ def main():
         
     GLOBAL_CACHE.ShMem.UpdateTimeouts()
     
-    for routine in GLOBAL_CACHE.Coroutines[:]:
-        try:
-            next(routine)
-        except StopIteration:
-            GLOBAL_CACHE.Coroutines.remove(routine)
+    GLOBAL_CACHE.CoroutineScheduler.tick()
     
     
 if __name__ == "__main__":
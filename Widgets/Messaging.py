@@ -26,6 +26,8 @@ def DrawWindow():
     if PyImGui.begin(MODULE_NAME):
         account_email = GLOBAL_CACHE.Player.GetAccountEmail()
         PyImGui.text(f"Account Email: {account_email}")
+        pending, capacity, dropped, high_water = GLOBAL_CACHE.ShMem.GetMailboxStats(account_email)
+        PyImGui.text(f"Inbox: {pending} pending | Outbox: {capacity} slots, peak {high_water}, dropped {dropped}")
         PyImGui.separator()
         PyImGui.text("Messages for you:")
         index, message = GLOBAL_CACHE.ShMem.PreviewNextMessage(account_email)
@@ -404,27 +406,27 @@ def ProcessMessages():
     
     match message.Command:
         case SharedCommandType.TravelToMap:
-            GLOBAL_CACHE.Coroutines.append(TravelToMap(index, message))
+            GLOBAL_CACHE.CoroutineScheduler.spawn(TravelToMap(index, message), f"TravelToMap:{index}")
         case SharedCommandType.InviteToParty:
-            GLOBAL_CACHE.Coroutines.append(InviteToParty(index, message))
+            GLOBAL_CACHE.CoroutineScheduler.spawn(InviteToParty(index, message), f"InviteToParty:{index}")
         case SharedCommandType.InteractWithTarget:
-            GLOBAL_CACHE.Coroutines.append(InteractWithTarget(index, message))
+            GLOBAL_CACHE.CoroutineScheduler.spawn(InteractWithTarget(index, message), f"InteractWithTarget:{index}")
         case SharedCommandType.TakeDialogWithTarget:
-            GLOBAL_CACHE.Coroutines.append(TakeDialogWithTarget(index, message))
+            GLOBAL_CACHE.CoroutineScheduler.spawn(TakeDialogWithTarget(index, message), f"TakeDialogWithTarget:{index}")
         case SharedCommandType.GetBlessing:
             pass
         case SharedCommandType.OpenChest:
             pass
         case SharedCommandType.PickUpLoot:
-            GLOBAL_CACHE.Coroutines.append(PickUpLoot(index, message))
+            GLOBAL_CACHE.CoroutineScheduler.spawn(PickUpLoot(index, message), f"PickUpLoot:{index}")
         case SharedCommandType.UseSkill:
             pass
         case SharedCommandType.Resign:
-            GLOBAL_CACHE.Coroutines.append(Resign(index, message))
+            GLOBAL_CACHE.CoroutineScheduler.spawn(Resign(index, message), f"Resign:{index}")
         case SharedCommandType.PixelStack:
-            GLOBAL_CACHE.Coroutines.append(PixelStack(index, message))
+            GLOBAL_CACHE.CoroutineScheduler.spawn(PixelStack(index, message), f"PixelStack:{index}")
         case SharedCommandType.PCon:
-            GLOBAL_CACHE.Coroutines.append(UsePcon(index, message))
+            GLOBAL_CACHE.CoroutineScheduler.spawn(UsePcon(index, message), f"UsePcon:{index}")
         case SharedCommandType.IdentifyItems:
             pass
         case SharedCommandType.SalvageItems:
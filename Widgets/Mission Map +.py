@@ -767,15 +767,13 @@ mission_map = MissionMap()
 #region DRAWING
 def DrawFrame():
     global mission_map
+    projection = Map.MissionMap.Projection.FromValues(mission_map.zoom + mission_map.mega_zoom,
+                                                      mission_map.left_bound, mission_map.top_bound, mission_map.boundaries,
+                                                      mission_map.pan_offset_x, mission_map.pan_offset_y,
+                                                      mission_map.scale_x, mission_map.scale_y,
+                                                      mission_map.mission_map_screen_center_x, mission_map.mission_map_screen_center_y)
     def _get_agent_xy(agent):
-        x,y = RawGamePosToScreen(agent.x, agent.y, 
-                                 mission_map.zoom, mission_map.mega_zoom,
-                                 mission_map.left_bound, mission_map.top_bound,
-                                 mission_map.boundaries, 
-                                 mission_map.pan_offset_x, mission_map.pan_offset_y,
-                                 mission_map.scale_x, mission_map.scale_y,
-                                 mission_map.mission_map_screen_center_x, mission_map.mission_map_screen_center_y)
-        return x,y
+        return projection.GamePosToScreen(agent.x, agent.y)
     
     def _get_alternate_color(agent_id):
         if mission_map.player_target_id == agent_id:
@@ -2,6 +2,7 @@ from Py4GWCoreLib import Timer
 from Py4GWCoreLib import GLOBAL_CACHE
 
 module_name = "Return to Outpost"
+__widget__ = {"skippable": True}  # main() draws nothing, the widget scheduler may skip it on a frame
 
 class config:
     def __init__(self):
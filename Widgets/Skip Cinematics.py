@@ -2,6 +2,7 @@ from Py4GWCoreLib import GLOBAL_CACHE
 from Py4GWCoreLib import ThrottledTimer
 
 module_name = "Skip Cinematic"
+__widget__ = {"skippable": True}  # main() draws nothing, the widget scheduler may skip it on a frame
 
 class config:
     def __init__(self):
@@ -5,6 +5,7 @@ from Py4GWCoreLib import TitleID
 
 
 module_name = "Set title on map load"
+__widget__ = {"skippable": True}  # main() draws nothing, the widget scheduler may skip it on a frame
 
 class config:
     def __init__(self):
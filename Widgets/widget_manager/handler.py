@@ -1,10 +1,11 @@
-from Py4GWCoreLib import Timer, Player, ConsoleLog, Py4GW, traceback
+from Py4GWCoreLib import Timer, Player, ConsoleLog, Py4GW, traceback, IniStore
 from .default_settings import global_widget_defaults, account_widget_defaults, default_schema_version
-import importlib.util
+from .profiler import WidgetProfiler
+from .loader import WidgetLoader
 import os
+import time
 import types
 import sys
-import configparser
 
 class WidgetHandler:
     _instance = None
@@ -25,6 +26,7 @@ class WidgetHandler:
         
         self.widgets = {}
         self.widget_data_cache = {}
+        self.ini_store = IniStore()
         self.last_write_time = Timer()
         self.last_write_time.Start()
         self.base_path = os.path.join(os.getcwd(), "widgets", "config", "account_config")
@@ -41,6 +43,13 @@ class WidgetHandler:
         self._initialize_global_config()
         self._last_global_values = {}
         self._last_account_values = {}
+        self.profiler = WidgetProfiler()
+        self.loader = WidgetLoader(os.path.join(os.getcwd(), "widgets", "config", "widget_cache"))
+        self.hot_reload = self._read_setting_bool("WidgetManager", "hot_reload", False)
+        self.hot_reload_timer = Timer()
+        self.hot_reload_timer.Start()
+        self.profiler.scheduler_enabled = self._read_setting_bool("WidgetManager", "scheduler_enabled", False)
+        self.profiler.frame_budget_ms = self._read_setting_float("WidgetManager", "frame_budget_ms", 0.0)
         self._initialized = True
         
     def _initialize_account_settings(self):
@@ -62,9 +71,7 @@ class WidgetHandler:
         self.account_initialized = True
 
     def _initialize_global_config(self):
-        config = configparser.ConfigParser()
-        if os.path.exists(self.global_ini_path):
-            config.read(self.global_ini_path)
+        config = self.ini_store.get_parser(self.global_ini_path)
 
         updated = False
         for section, kv in global_widget_defaults.items():
@@ -84,15 +91,12 @@ class WidgetHandler:
             updated = True
 
         if updated:
-            os.makedirs(self.base_path, exist_ok=True)
-            with open(self.global_ini_path, "w") as f:
-                config.write(f)
+            self.ini_store.mark_dirty(self.global_ini_path)
+            self.ini_store.flush(self.global_ini_path)
             ConsoleLog("WidgetHandler", "Updated global config with missing defaults", Py4GW.Console.MessageType.Info)
 
     def _initialize_account_config(self):
-        config = configparser.ConfigParser()
-        if os.path.exists(self.account_ini_path):
-            config.read(self.account_ini_path)
+        config = self.ini_store.get_parser(self.account_ini_path)
 
         updated = False
         for section, kv in account_widget_defaults.items():
@@ -112,14 +116,11 @@ class WidgetHandler:
             updated = True
 
         if updated:
-            os.makedirs(self.account_path, exist_ok=True)
-            with open(self.account_ini_path, "w") as f:
-                config.write(f)
+            self.ini_store.mark_dirty(self.account_ini_path)
+            self.ini_store.flush(self.account_ini_path)
             ConsoleLog("WidgetHandler", "Updated account config with missing defaults", Py4GW.Console.MessageType.Info)
     
     def _read_setting(self, section, key, default=None, *, force_account=False, force_global=False):
-        parser = configparser.ConfigParser()
-
         paths = []
         if force_account:
             paths = [self.account_ini_path]
@@ -129,16 +130,11 @@ class WidgetHandler:
             paths = [self.global_ini_path, self.account_ini_path]
 
         for path in paths:
-            if not path or not os.path.exists(path):
+            if not path:
                 continue
-            try:
-                parser.read(path)
-            except configparser.Error as e:
-                ConsoleLog("WidgetHandler", f"[Warning] Corrupt INI file: {path} ({e})", Py4GW.Console.MessageType.Warning)
-                continue  # Try next file
-
-            if parser.has_section(section) and parser.has_option(section, key):
-                return parser.get(section, key)
+            value = self.ini_store.get(path, section, key)
+            if value is not None:
+                return value
             
         return default
 
@@ -181,24 +177,11 @@ class WidgetHandler:
         if not force and cache.get((section, key)) == value:
             return
 
-        parser = configparser.ConfigParser()
-        
         if to_account and not os.path.exists(self.account_path):
             os.makedirs(self.account_path, exist_ok=True)
             self._initialize_account_config()
 
-        if not os.path.exists(path):
-            open(path, "a").close()
-            
-        parser.read(path)
-
-        if not parser.has_section(section):
-            parser.add_section(section)
-
-        parser.set(section, key, str(value))
-
-        with open(path, "w") as f:
-            parser.write(f)
+        self.ini_store.set(path, section, key, value)
 
         cache[(section, key)] = value
 
@@ -219,8 +202,7 @@ class WidgetHandler:
         if not os.path.exists(path):
             return
 
-        parser = configparser.ConfigParser()
-        parser.read(path)
+        parser = self.ini_store.get_parser(path)
 
         for section in parser.sections():
             if section in self.widget_data_cache:
@@ -261,22 +243,27 @@ class WidgetHandler:
         if not os.path.isdir(self.widgets_path):
             raise FileNotFoundError(f"Missing widget directory: {self.widgets_path}")
 
-        py_files = [f for f in os.listdir(self.widgets_path) if f.endswith(".py")]
-
-        for file in py_files:
-            name = os.path.splitext(file)[0]
-            path = os.path.join(self.widgets_path, file)
-            try:
-                module = self.load_widget(path)
-                if not module:
-                    ConsoleLog("WidgetHandler", f"Skipped widget: {name} (module load failed)", Py4GW.Console.MessageType.Warning)
-                    continue
-                enabled = self.widget_data_cache.get(name, {}).get("enabled", True)
-                self.widgets[name] = {"module": module, "enabled": enabled, "configuring": False}
-                ConsoleLog("WidgetHandler", f"Loaded widget: {name}", Py4GW.Console.MessageType.Info)
-            except Exception as e:
-                ConsoleLog("WidgetHandler", f"Failed to load widget {name}: {e}", Py4GW.Console.MessageType.Error)
-                ConsoleLog("WidgetHandler", f"Stack trace: {traceback.format_exc()}", Py4GW.Console.MessageType.Error)
+        added, changed, removed = self.loader.scan(self.widgets_path)
+        for name in removed:
+            self.widgets.pop(name, None)
+            self.profiler.forget(name)
+            ConsoleLog("WidgetHandler", f"Removed widget: {name}", Py4GW.Console.MessageType.Info)
+
+        for name, source in self.loader.sources.items():
+            info = self.widgets.get(name)
+            if info is not None and info["module"] is not None and name in changed:
+                info["module"] = None
+            if source.meta is not None:
+                self._apply_widget_meta(name, source.meta)
+            enabled = self.widget_data_cache.get(name, {}).get("enabled", True)
+            if info is None:
+                info = self.widgets[name] = {"module": None, "enabled": enabled, "configuring": False}
+            info["enabled"] = enabled
+
+            # Widgets are imported when they first run; a meta that can only be read by importing forces it now.
+            if info["module"] is None and (enabled or source.meta is None):
+                self._import_widget(name, info)
+            self._load_widget_schedule(name, source.meta or getattr(info["module"], "__widget__", None))
 
     def discover_widgets(self):
         try:
@@ -287,16 +274,85 @@ class WidgetHandler:
             ConsoleLog("WidgetHandler", f"Widget discovery failed: {e}", Py4GW.Console.MessageType.Error)
             ConsoleLog("WidgetHandler", traceback.format_exc(), Py4GW.Console.MessageType.Error)
 
+    def _import_widget(self, name: str, info: dict) -> bool:
+        try:
+            module = self.load_widget(self.loader.sources[name].path)
+            if not module:
+                ConsoleLog("WidgetHandler", f"Skipped widget: {name} (module load failed)", Py4GW.Console.MessageType.Warning)
+                info["enabled"] = False
+                return False
+            info["module"] = module
+            ConsoleLog("WidgetHandler", f"Loaded widget: {name}", Py4GW.Console.MessageType.Info)
+            return True
+        except Exception as e:
+            ConsoleLog("WidgetHandler", f"Failed to load widget {name}: {e}", Py4GW.Console.MessageType.Error)
+            ConsoleLog("WidgetHandler", f"Stack trace: {traceback.format_exc()}", Py4GW.Console.MessageType.Error)
+            info["enabled"] = False
+            return False
+
+    def _get_module(self, name: str, info: dict):
+        if info["module"] is None and name in self.loader.sources:
+            self._import_widget(name, info)
+        return info["module"]
+
+    def reload_widget(self, name: str) -> bool:
+        """
+        Re-execute one widget from its current file.
+        The new code is compiled first, a file that does not compile leaves the old module running. Otherwise the
+        optional on_unload() of the old module is called so it can close its windows and stop its timers and coroutines.
+        """
+        info = self.widgets.get(name)
+        if info is None or name not in self.loader.sources:
+            return False
+        self.loader.refresh(name)
+        try:
+            self.loader.get_code(name)
+        except Exception as e:
+            ConsoleLog("WidgetHandler", f"Failed to reload widget {name}: {e}", Py4GW.Console.MessageType.Error)
+            return False
+
+        self._unload_widget(name, info)
+        try:
+            module = self.load_widget(self.loader.sources[name].path)
+        except Exception as e:
+            ConsoleLog("WidgetHandler", f"Failed to reload widget {name}: {e}", Py4GW.Console.MessageType.Error)
+            ConsoleLog("WidgetHandler", f"Stack trace: {traceback.format_exc()}", Py4GW.Console.MessageType.Error)
+            module = None
+        info["module"] = module
+        if not module:
+            return False
+        self.profiler.get(name).reset()
+        ConsoleLog("WidgetHandler", f"Reloaded widget: {name}", Py4GW.Console.MessageType.Info)
+        return True
+
+    def _unload_widget(self, name: str, info: dict):
+        module = info["module"]
+        info["module"] = None
+        on_unload = getattr(module, "on_unload", None)
+        if not callable(on_unload):
+            return
+        try:
+            on_unload()
+        except Exception as e:
+            ConsoleLog("WidgetHandler", f"on_unload failed: {name} - {e}", Py4GW.Console.MessageType.Error)
+            ConsoleLog("WidgetHandler", traceback.format_exc(), Py4GW.Console.MessageType.Error)
+
+    def check_for_changes(self):
+        """Hot-reload the imported widgets whose file changed on disk."""
+        for name, info in self.widgets.items():
+            if info["module"] is None:
+                continue
+            source = self.loader.sources.get(name)
+            if source is not None and source.is_stale():
+                self.reload_widget(name)
+
     def load_widget(self, path):
         name = os.path.splitext(os.path.basename(path))[0]
-        
-        spec = importlib.util.spec_from_file_location("widget", path)
-        if not spec or not spec.loader:
-            raise ValueError(f"Invalid spec from {path}")
+        if name not in self.loader.sources:
+            self.loader.scan(os.path.dirname(path))
 
-        module = importlib.util.module_from_spec(spec)
         try:
-            spec.loader.exec_module(module)
+            module = self.loader.load(name)
         except Exception as e:
             ConsoleLog("WidgetHandler", f"Failed to load widget '{name}': {e}", Py4GW.Console.MessageType.Error)
             traceback.print_exc()
@@ -304,10 +360,13 @@ class WidgetHandler:
 
         if not all(hasattr(module, attr) for attr in ("main", "configure")):
             raise ValueError("Widget missing required functions: main() and configure()")
-        
+
         meta = getattr(module, "__widget__", None)
-        if not isinstance(meta, dict):
-            meta = {}
+        if isinstance(meta, dict):
+            self._apply_widget_meta(name, meta)
+        return module
+
+    def _apply_widget_meta(self, name: str, meta: dict):
         cache = self.widget_data_cache.setdefault(name, {})
 
         defaults = (
@@ -327,29 +386,66 @@ class WidgetHandler:
         if "quickdock" not in cache or "quickdock" in meta:
             cache["quickdock"] = meta["quickdock"] if "quickdock" in meta else defaults.get("quickdock", False)
 
-        if isinstance(meta, dict) and "hidden" in meta:
+        if "hidden" in meta:
             cache["hidden"] = meta["hidden"]
-
-        return module
         
     def execute_enabled_widgets(self):
-        for name, info in self.widgets.items():
+        self.ini_store.update()
+        if self.hot_reload and self.hot_reload_timer.HasElapsed(1000):
+            self.hot_reload_timer.Reset()
+            self.check_for_changes()
+        profiler = self.profiler
+        profiler.begin_frame()
+        for name, info in list(self.widgets.items()):
             if not info["enabled"]:
                 continue
+            module = self._get_module(name, info)
+            if module is None:
+                continue
+            if not profiler.should_run(name):
+                continue
+            start = time.perf_counter()
             try:
-                info["module"].main()
+                module.main()
             except Exception as e:
                 ConsoleLog("WidgetHandler", f"Execution failed: {name} - {e}", Py4GW.Console.MessageType.Error)
                 ConsoleLog("WidgetHandler", traceback.format_exc(), Py4GW.Console.MessageType.Error)
+            profiler.record(name, (time.perf_counter() - start) * 1000)
+
+    def _load_widget_schedule(self, name: str, meta):
+        """
+        Run interval and budget of a widget: its __widget__ meta ("run_interval", "budget_ms"), overridden by saved settings.
+        Only widgets whose meta declares "skippable": True (main() does no drawing that must happen every frame) are scheduled.
+        """
+        if not isinstance(meta, dict):
+            meta = {}
+        interval = self._read_setting_int(name, "run_interval", int(meta.get("run_interval", 1)))
+        budget_ms = self._read_setting_float(name, "budget_ms", float(meta.get("budget_ms", 0.0)))
+        self.profiler.set_schedule(name, interval, budget_ms, bool(meta.get("skippable", False)))
+
+    def set_widget_schedule(self, name: str, interval: int, budget_ms: float):
+        self.profiler.set_schedule(name, interval, budget_ms)
+        timing = self.profiler.get(name)
+        self._write_setting(name, "run_interval", str(timing.interval))
+        self._write_setting(name, "budget_ms", str(timing.budget_ms))
+
+    def set_scheduler(self, enabled: bool, frame_budget_ms: float):
+        self.profiler.scheduler_enabled = enabled
+        self.profiler.frame_budget_ms = max(0.0, frame_budget_ms)
+        self._write_setting("WidgetManager", "scheduler_enabled", str(enabled))
+        self._write_setting("WidgetManager", "frame_budget_ms", str(self.profiler.frame_budget_ms))
 
     def execute_configuring_widgets(self):
-        for name, info in self.widgets.items():
+        for name, info in list(self.widgets.items()):
             if not info["configuring"]:
                 continue
+            module = self._get_module(name, info)
+            if module is None:
+                continue
             try:
-                info["module"].configure()
-                if hasattr(info["module"], "render_ui"):
-                    info["module"].render_ui()
+                module.configure()
+                if hasattr(module, "render_ui"):
+                    module.render_ui()
             except Exception as e:
                 ConsoleLog("WidgetHandler", f"Configure failed: {name} - {e}", Py4GW.Console.MessageType.Error)
                 ConsoleLog("WidgetHandler", traceback.format_exc(), Py4GW.Console.MessageType.Error)
@@ -0,0 +1,230 @@
+import ast
+import importlib.util
+import json
+import marshal
+import os
+import struct
+
+from Py4GWCoreLib import ConsoleLog, Py4GW
+
+MODULE_NAME = "WidgetLoader"
+
+# importlib magic (bytecode format of this interpreter), source mtime_ns, source size
+_CODE_HEADER = struct.Struct("<4sqQ")
+_INDEX_VERSION = 1
+
+
+class WidgetSource:
+    """One widget file as last seen on disk."""
+    __slots__ = ("name", "path", "mtime_ns", "size", "meta")
+
+    def __init__(self, name: str, path: str, mtime_ns: int, size: int, meta):
+        self.name = name
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.meta = meta           # literal __widget__ dict, None when it can only be known by importing
+
+    def is_stale(self) -> bool:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return True
+        return st.st_mtime_ns != self.mtime_ns or st.st_size != self.size
+
+
+class WidgetLoader:
+    """
+    Discovers widget files and executes them from cached bytecode.
+
+    - scan() only stats the widget directory; the __widget__ meta of a new or changed file is read
+      from its syntax tree, so menus can list a widget without importing it.
+    - Compiled code is kept in memory and in cache_dir, keyed by the source mtime/size and the
+      interpreter's bytecode magic, independent of sys.dont_write_bytecode and __pycache__.
+    - The meta of unchanged files is kept in cache_dir/index.json so a restart does not re-parse them.
+    """
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self.sources: dict[str, WidgetSource] = {}
+        self._code: dict[str, tuple] = {}
+        self._index = self._read_index()
+        self._index_dirty = False
+        self.stats = {"scanned": 0, "parsed": 0, "compiled": 0, "code_hits": 0, "loads": 0}
+        os.makedirs(cache_dir, exist_ok=True)
+
+    # === Discovery ===
+    def scan(self, directory: str):
+        """
+        Purpose: Refresh the known widget files of a directory.
+        Returns: (added, changed, removed) widget names.
+        """
+        seen = {}
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".py") or not entry.is_file():
+                    continue
+                st = entry.stat()
+                seen[os.path.splitext(entry.name)[0]] = (entry.path, st.st_mtime_ns, st.st_size)
+        self.stats["scanned"] += len(seen)
+
+        added, changed = [], []
+        for name, (path, mtime_ns, size) in list(seen.items()):
+            source = self.sources.get(name)
+            if source and source.path == path and source.mtime_ns == mtime_ns and source.size == size:
+                continue
+            try:
+                meta = self._describe(path, mtime_ns, size)
+            except Exception as e:
+                ConsoleLog(MODULE_NAME, f"Skipped widget {name}: could not read its __widget__ meta: {e}", Py4GW.Console.MessageType.Warning)
+                seen.pop(name)
+                continue
+            self.sources[name] = WidgetSource(name, path, mtime_ns, size, meta)
+            (changed if source else added).append(name)
+
+        removed = [name for name in self.sources if name not in seen]
+        for name in removed:
+            del self.sources[name]
+            self._code.pop(name, None)
+            try:
+                os.remove(os.path.join(self.cache_dir, f"{name}.bin"))
+            except OSError:
+                pass
+
+        if self._index_dirty:
+            self._write_index()
+        return added, changed, removed
+
+    def refresh(self, name: str) -> bool:
+        """Re-stat one widget file, returns True when it changed since it was last seen."""
+        source = self.sources.get(name)
+        if source is None or not source.is_stale():
+            return False
+        try:
+            st = os.stat(source.path)
+        except OSError:
+            return False
+        source.mtime_ns, source.size = st.st_mtime_ns, st.st_size
+        try:
+            source.meta = self._describe(source.path, st.st_mtime_ns, st.st_size)
+        except Exception as e:
+            ConsoleLog(MODULE_NAME, f"Could not read the __widget__ meta of {name}: {e}", Py4GW.Console.MessageType.Warning)
+            source.meta = None
+        if self._index_dirty:
+            self._write_index()
+        return True
+
+    def _describe(self, path: str, mtime_ns: int, size: int):
+        entry = self._index.get(path)
+        if entry and entry.get("mtime_ns") == mtime_ns and entry.get("size") == size:
+            return entry.get("meta")
+
+        self.stats["parsed"] += 1
+        meta = None
+        try:
+            with open(path, "rb") as f:
+                tree = ast.parse(f.read(), path)
+            for node in tree.body:
+                if isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == "__widget__" for t in node.targets):
+                    value = ast.literal_eval(node.value)
+                    meta = value if isinstance(value, dict) else {}
+                elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name) and node.target.id == "__widget__" and node.value:
+                    value = ast.literal_eval(node.value)
+                    meta = value if isinstance(value, dict) else {}
+            if meta is None:
+                meta = {}
+        except (SyntaxError, ValueError, OSError):
+            # Syntax errors or a computed __widget__: the meta is only known after importing.
+            meta = None
+        # anything else (TypeError, MemoryError, RecursionError from a malformed header) propagates to scan(), which skips the widget
+
+        try:
+            json.dumps(meta)
+        except (TypeError, ValueError):
+            return meta
+        self._index[path] = {"mtime_ns": mtime_ns, "size": size, "meta": meta}
+        self._index_dirty = True
+        return meta
+
+    # === Loading ===
+    def get_code(self, name: str):
+        source = self.sources[name]
+        cached = self._code.get(name)
+        if cached and cached[0] == source.mtime_ns and cached[1] == source.size:
+            self.stats["code_hits"] += 1
+            return cached[2]
+
+        code_path = os.path.join(self.cache_dir, f"{name}.bin")
+        code = None
+        try:
+            with open(code_path, "rb") as f:
+                data = f.read()
+            magic, mtime_ns, size = _CODE_HEADER.unpack_from(data)
+            if magic == importlib.util.MAGIC_NUMBER and mtime_ns == source.mtime_ns and size == source.size:
+                code = marshal.loads(data[_CODE_HEADER.size:])
+                self.stats["code_hits"] += 1
+        except (OSError, struct.error, ValueError, EOFError, TypeError):
+            code = None
+
+        if code is None:
+            with open(source.path, "rb") as f:
+                code = compile(f.read(), source.path, "exec", dont_inherit=True)
+            self.stats["compiled"] += 1
+            self._write_code(code_path, code, source)
+
+        self._code[name] = (source.mtime_ns, source.size, code)
+        return code
+
+    def load(self, name: str):
+        """
+        Purpose: Execute a widget file into a fresh module object.
+        Returns: The module. Exceptions raised by the widget propagate to the caller.
+        """
+        source = self.sources[name]
+        code = self.get_code(name)
+        spec = importlib.util.spec_from_file_location("widget", source.path)
+        if not spec or not spec.loader:
+            raise ValueError(f"Invalid spec from {source.path}")
+        module = importlib.util.module_from_spec(spec)
+        exec(code, module.__dict__)
+        self.stats["loads"] += 1
+        return module
+
+    # === Persistence ===
+    def _write_code(self, code_path: str, code, source: WidgetSource):
+        tmp = f"{code_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(_CODE_HEADER.pack(importlib.util.MAGIC_NUMBER, source.mtime_ns, source.size))
+                f.write(marshal.dumps(code))
+            os.replace(tmp, code_path)
+        except OSError as e:
+            ConsoleLog(MODULE_NAME, f"Could not cache bytecode of {source.name}: {e}", Py4GW.Console.MessageType.Warning)
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+    def _read_index(self) -> dict:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != _INDEX_VERSION:
+            return {}
+        files = data.get("files")
+        return files if isinstance(files, dict) else {}
+
+    def _write_index(self):
+        self._index_dirty = False
+        # Entries of files that no longer exist are dropped on write.
+        files = {path: entry for path, entry in self._index.items() if os.path.exists(path)}
+        self._index = files
+        tmp = f"{self.index_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": _INDEX_VERSION, "files": files}, f)
+            os.replace(tmp, self.index_path)
+        except OSError as e:
+            ConsoleLog(MODULE_NAME, f"Could not write widget index: {e}", Py4GW.Console.MessageType.Warning)
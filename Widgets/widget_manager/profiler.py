@@ -0,0 +1,149 @@
+import math
+from collections import deque
+
+SAMPLE_WINDOW = 120              # frames kept for the rolling statistics
+MAX_DEFERRED_FRAMES = 10         # a due widget always runs after this many frame budget deferrals
+
+
+class WidgetTiming:
+    """Rolling wall-time statistics of one widget's main()."""
+    __slots__ = ("samples", "runs", "skipped", "deferred", "last_ms", "max_ms", "total_ms",
+                 "last_frame", "waiting", "interval", "budget_ms", "skippable")
+
+    def __init__(self):
+        self.samples = deque(maxlen=SAMPLE_WINDOW)
+        self.runs = 0
+        self.skipped = 0           # frames skipped because of the run interval or the widget budget
+        self.deferred = 0          # frames deferred because the frame budget was used up
+        self.last_ms = 0.0
+        self.max_ms = 0.0
+        self.total_ms = 0.0
+        self.last_frame = -1       # frame of the last run
+        self.waiting = 0           # consecutive frames deferred by the frame budget
+        # === Schedule ===
+        self.interval = 1          # run every n frames
+        self.budget_ms = 0.0       # average cost per frame allowed, 0 = unlimited
+        self.skippable = False     # main() may be skipped on a frame, set by the widget ("skippable" in __widget__)
+
+    def record(self, elapsed_ms: float, frame: int):
+        self.samples.append(elapsed_ms)
+        self.runs += 1
+        self.last_ms = elapsed_ms
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.last_frame = frame
+        self.waiting = 0
+
+    def mean(self) -> float:
+        return sum(self.samples) / len(self.samples) if self.samples else 0.0
+
+    def p95(self) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, math.ceil(len(ordered) * 0.95) - 1)]
+
+    def window_max(self) -> float:
+        return max(self.samples) if self.samples else 0.0
+
+    def reset(self):
+        self.samples.clear()
+        self.runs = self.skipped = self.deferred = 0
+        self.last_ms = self.max_ms = self.total_ms = 0.0
+
+
+class WidgetProfiler:
+    """
+    Per-widget timing and optional scheduling for WidgetHandler.
+
+    Timing is always collected. Most widgets draw their windows inside main(), so skipping it would
+    make them vanish for that frame; only widgets that declare "skippable": True in their __widget__
+    meta are ever scheduled. For those, when the scheduler is enabled a widget runs only every `interval`
+    frames, widgets whose rolling mean exceeds their own `budget_ms` are spread over as many frames
+    as needed to average out at the budget, and once `frame_budget_ms` is used up in a frame the
+    remaining widgets with a known cost are deferred to a later frame. A widget that is due is never
+    deferred by the frame budget for more than MAX_DEFERRED_FRAMES frames in a row; its own interval
+    and budget are not capped.
+    """
+    def __init__(self):
+        self.timings: dict[str, WidgetTiming] = {}
+        self.scheduler_enabled = False
+        self.frame_budget_ms = 0.0
+        self.frame = 0
+        self.frame_used_ms = 0.0
+        self.last_frame_ms = 0.0
+        self.frame_samples = deque(maxlen=SAMPLE_WINDOW)
+
+    def get(self, name: str) -> WidgetTiming:
+        timing = self.timings.get(name)
+        if timing is None:
+            timing = self.timings[name] = WidgetTiming()
+        return timing
+
+    def set_schedule(self, name: str, interval: int = 1, budget_ms: float = 0.0, skippable: bool | None = None):
+        timing = self.get(name)
+        timing.interval = max(1, int(interval))
+        timing.budget_ms = max(0.0, float(budget_ms))
+        if skippable is not None:
+            timing.skippable = bool(skippable)
+
+    def begin_frame(self):
+        if self.frame:
+            self.last_frame_ms = self.frame_used_ms
+            self.frame_samples.append(self.frame_used_ms)
+        self.frame += 1
+        self.frame_used_ms = 0.0
+
+    def should_run(self, name: str) -> bool:
+        timing = self.get(name)
+        if not self.scheduler_enabled or not timing.skippable or timing.runs == 0 or timing.waiting >= MAX_DEFERRED_FRAMES:
+            return True
+
+        interval = timing.interval
+        if timing.budget_ms > 0.0:
+            interval = max(interval, math.ceil(timing.mean() / timing.budget_ms))
+        if self.frame - timing.last_frame < interval:
+            timing.skipped += 1
+            return False
+
+        if self.frame_budget_ms > 0.0 and self.frame_used_ms + timing.mean() > self.frame_budget_ms and self.frame_used_ms > 0.0:
+            timing.deferred += 1
+            timing.waiting += 1
+            return False
+        return True
+
+    def record(self, name: str, elapsed_ms: float):
+        self.get(name).record(elapsed_ms, self.frame)
+        self.frame_used_ms += elapsed_ms
+
+    def forget(self, name: str):
+        self.timings.pop(name, None)
+
+    def reset_stats(self):
+        for timing in self.timings.values():
+            timing.reset()
+        self.frame_samples.clear()
+
+    def get_stats(self) -> list[dict]:
+        """Per-widget statistics, most expensive (rolling mean) first."""
+        stats = [
+            {
+                "name": name,
+                "mean_ms": timing.mean(),
+                "p95_ms": timing.p95(),
+                "max_ms": timing.window_max(),
+                "last_ms": timing.last_ms,
+                "runs": timing.runs,
+                "skipped": timing.skipped,
+                "deferred": timing.deferred,
+                "interval": timing.interval,
+                "budget_ms": timing.budget_ms,
+                "skippable": timing.skippable,
+            }
+            for name, timing in self.timings.items()
+        ]
+        stats.sort(key=lambda entry: entry["mean_ms"], reverse=True)
+        return stats
+
+    def frame_mean_ms(self) -> float:
+        return sum(self.frame_samples) / len(self.frame_samples) if self.frame_samples else 0.0
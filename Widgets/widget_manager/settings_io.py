@@ -13,8 +13,8 @@ def restore_global_defaults():
         for key, value in settings.items():
             parser.set(section, key, str(value))
 
-    with open(handler.global_ini_path, "w") as f:
-        parser.write(f)
+    handler.ini_store.mark_dirty(handler.global_ini_path, parser)
+    handler.ini_store.flush(handler.global_ini_path)
 
     handler._last_global_values.clear()
 
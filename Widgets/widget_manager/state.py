@@ -36,6 +36,7 @@ last_written_offset_y = None
 selected_widget = ""
 show_hidden_widgets = False
 scroll_pos = 0.0
+perf_table_rows = 15
 
 # Floating menu popup state
 popup_open = False
@@ -267,6 +267,12 @@ def draw_debug_config():
     PyImGui.spacing()  
     state.show_hidden_widgets = PyImGui.checkbox("Show Hidden Widgets", state.show_hidden_widgets)
     PyImGui.show_tooltip("Toggle visibility of hidden/internal widgets in menus")
+    hot_reload = PyImGui.checkbox("Hot-Reload Widgets", handler.hot_reload)
+    PyImGui.show_tooltip("Reload loaded widgets when their file changes on disk (checked every second).\n"
+                         "A reloaded widget's on_unload() is called first, widgets without one leave their old windows and timers running.")
+    if hot_reload != handler.hot_reload:
+        handler.hot_reload = hot_reload
+        handler._write_setting("WidgetManager", "hot_reload", str(hot_reload), to_account=use_account_settings())
     PyImGui.spacing()
     if PyImGui.collapsing_header("Edit Specific Widget Data"):
         widget_names = list(handler.widgets.keys())
@@ -290,6 +296,9 @@ def draw_debug_config():
 
         PyImGui.spacing()
         updated_enabled = PyImGui.checkbox("Enabled", enabled)
+        PyImGui.same_line(0, -1)
+        if PyImGui.button("Reload##selwidg"):
+            handler.reload_widget(state.selected_widget)
         if updated_enabled != enabled:
             info["enabled"] = updated_enabled
             handler._write_setting(state.selected_widget, "enabled", str(updated_enabled), to_account=use_account_settings())
@@ -343,4 +352,71 @@ def draw_debug_config():
 
         if new_sub != subcategory:
             data["subcategory"] = new_sub
-            handler._write_setting(state.selected_widget, "subcategory", new_sub, to_account=use_account_settings())
\ No newline at end of file
+            handler._write_setting(state.selected_widget, "subcategory", new_sub, to_account=use_account_settings())
+
+    if PyImGui.collapsing_header("Widget Performance"):
+        draw_widget_performance()
+
+def draw_widget_performance():
+    profiler = handler.profiler
+    PyImGui.text(f"Frame: {profiler.last_frame_ms:.2f} ms (avg {profiler.frame_mean_ms():.2f} ms)")
+    PyImGui.same_line(0, -1)
+    if PyImGui.button("Reset Stats"):
+        profiler.reset_stats()
+
+    state.perf_table_rows = draw_labeled_slider("Rows:", "##perf_rows", state.perf_table_rows, 5, 50)
+    flags = PyImGui.TableFlags.Borders | PyImGui.TableFlags.RowBg
+    if PyImGui.begin_table("WidgetPerfTable", 8, flags):
+        for column in ("Widget", "Mean", "P95", "Max", "Runs", "Skipped", "Deferred", "Schedule"):
+            PyImGui.table_setup_column(column)
+        PyImGui.table_headers_row()
+        for entry in profiler.get_stats()[:state.perf_table_rows]:
+            PyImGui.table_next_row()
+            PyImGui.table_next_column()
+            PyImGui.text(entry["name"])
+            PyImGui.table_next_column()
+            PyImGui.text(f"{entry['mean_ms']:.2f}")
+            PyImGui.table_next_column()
+            PyImGui.text(f"{entry['p95_ms']:.2f}")
+            PyImGui.table_next_column()
+            PyImGui.text(f"{entry['max_ms']:.2f}")
+            PyImGui.table_next_column()
+            PyImGui.text(str(entry["runs"]))
+            PyImGui.table_next_column()
+            PyImGui.text(str(entry["skipped"]))
+            PyImGui.table_next_column()
+            PyImGui.text(str(entry["deferred"]))
+            PyImGui.table_next_column()
+            if entry["skippable"]:
+                schedule = f"1/{entry['interval']}"
+                if entry["budget_ms"] > 0.0:
+                    schedule += f", {entry['budget_ms']:.1f} ms"
+            else:
+                schedule = "every frame"
+            PyImGui.text(schedule)
+        PyImGui.end_table()
+
+    PyImGui.separator()
+    scheduler_enabled = PyImGui.checkbox("Enable Scheduler", profiler.scheduler_enabled)
+    PyImGui.show_tooltip("Run skippable widgets at their configured interval and defer them once the frame budget is used up.\n"
+                         "Widgets draw their windows in main(), so only widgets declaring \"skippable\": True in their __widget__ meta are ever skipped.")
+    PyImGui.set_next_item_width(200)
+    frame_budget_ms = PyImGui.slider_float("Frame Budget (ms, 0 = off)", profiler.frame_budget_ms, 0.0, 20.0)
+    if scheduler_enabled != profiler.scheduler_enabled or frame_budget_ms != profiler.frame_budget_ms:
+        handler.set_scheduler(scheduler_enabled, frame_budget_ms)
+
+    if state.selected_widget not in handler.widgets:
+        PyImGui.text("Select a widget under 'Edit Specific Widget Data' to schedule it.")
+        return
+    timing = profiler.get(state.selected_widget)
+    PyImGui.text(f"Schedule for {state.selected_widget}:")
+    if not timing.skippable:
+        PyImGui.text_wrapped("This widget runs every frame: it does not declare \"skippable\": True in its __widget__ meta, "
+                             "and skipping its main() would hide its windows on skipped frames.")
+        return
+    PyImGui.set_next_item_width(200)
+    interval = PyImGui.input_int("Run Every N Frames", timing.interval)
+    PyImGui.set_next_item_width(200)
+    budget_ms = PyImGui.input_float("Widget Budget (ms, 0 = off)", timing.budget_ms)
+    if interval != timing.interval or budget_ms != timing.budget_ms:
+        handler.set_widget_schedule(state.selected_widget, interval, budget_ms)
@@ -0,0 +1,158 @@
+import time
+import random
+import Py4GW
+from Py4GWCoreLib import ThrottledTimer, Attribute
+from Py4GWCoreLib.GlobalCache.AgentCache import AgentCache
+from HeroAI.cache_data import AgentState, IsLivingAgentAlive
+
+MODULE_NAME = "GameData Benchmark"
+TICKS = 20000
+benchmark_done = False
+
+# Compares the per-tick agent reads of HeroAI GameData.update(): the previous implementation (one
+# GLOBAL_CACHE.Agent call per field, attributes found by name) against one agent fetch per agent copied
+# into AgentState. Both run against stub PyAgent objects held by a stub raw agent array whose
+# get_agent() only does the throttle check, so the native map checks are not part of either timing.
+
+
+class _StubWeaponType:
+    def __init__(self, value, name):
+        self.value = value
+        self.name = name
+
+    def ToInt(self):
+        return self.value
+
+    def GetName(self):
+        return self.name
+
+
+class _StubAttribute:
+    def __init__(self, attribute: Attribute, level):
+        self.attribute_id = attribute.value
+        self.level = level
+        self.name = " ".join(_split_words(attribute.name))
+
+    def GetName(self):
+        return self.name
+
+
+def _split_words(name):
+    word = ""
+    for char in name:
+        if char.isupper() and word:
+            yield word
+            word = ""
+        word += char
+    if word:
+        yield word
+
+
+class _StubLivingAgent:
+    def __init__(self, rng):
+        self.login_number = rng.randrange(1, 1000)
+        self.energy = rng.random()
+        self.max_energy = rng.randrange(20, 80)
+        self.energy_regen = rng.random() * 0.1
+        self.hp = rng.random()
+        self.overcast = 0.0
+        self.effects = rng.choice((0, 0x0010))
+        self.type_map = 0
+        self.model_state = rng.choice((64, 65, 96, 12, 1104))
+        self.casting_skill_id = rng.randrange(0, 3000)
+        self.weapon_type = rng.choice((_StubWeaponType(2, "Axe"), _StubWeaponType(10, "Wand")))
+
+
+class _StubAgent:
+    def __init__(self, agent_id, rng):
+        self.id = agent_id
+        self.x = rng.uniform(-5000, 5000)
+        self.y = rng.uniform(-5000, 5000)
+        self.z = 0.0
+        self.rotation_angle = rng.uniform(-3.14, 3.14)
+        self.living_agent = _StubLivingAgent(rng)
+        self.attributes = [_StubAttribute(attribute, rng.randrange(0, 16))
+                           for attribute in rng.sample([Attribute.FastCasting, Attribute.Expertise, Attribute.IllusionMagic,
+                                                        Attribute.DominationMagic, Attribute.InspirationMagic, Attribute.Strength], 4)]
+
+
+class _StubRawAgentArray:
+    """Stands in for RawAgentArray: get_agent() pays the update throttle check, then a dict lookup."""
+    def __init__(self, agents):
+        self.agents = agents
+        self.update_throttle = ThrottledTimer(35)
+        self.fetches = 0
+
+    def get_agent(self, agent_id):
+        self.fetches += 1
+        self.update_throttle.IsExpired()
+        return self.agents[agent_id]
+
+
+def _previous_reads(agent_cache, player_id, leader_id, target_id):
+    attributes = agent_cache.GetAttributes(player_id)
+    fast_casting_exists, fast_casting_level, expertise_exists, expertise_level = False, 0, False, 0
+    for attribute in attributes:
+        if attribute.GetName() == "Fast Casting":
+            fast_casting_exists, fast_casting_level = True, attribute.level
+        if attribute.GetName() == "Expertise":
+            expertise_exists, expertise_level = True, attribute.level
+    return (agent_cache.GetRotationAngle(leader_id), agent_cache.GetXY(leader_id), agent_cache.GetXYZ(leader_id),
+            agent_cache.GetLoginNumber(player_id), agent_cache.GetEnergyRegen(player_id), agent_cache.GetMaxEnergy(player_id),
+            agent_cache.GetEnergy(player_id), agent_cache.GetXY(player_id), agent_cache.GetXYZ(player_id),
+            agent_cache.IsCasting(player_id), agent_cache.GetCastingSkill(player_id), agent_cache.GetHealth(player_id),
+            agent_cache.IsAlive(player_id), agent_cache.GetOvercast(player_id), agent_cache.IsKnockedDown(player_id),
+            agent_cache.IsAttacking(player_id), agent_cache.IsMoving(player_id), agent_cache.IsMelee(player_id),
+            agent_cache.GetWeaponType(player_id)[0],
+            fast_casting_exists, fast_casting_level, expertise_exists, expertise_level,
+            agent_cache.IsAlive(target_id))
+
+
+def _snapshot_reads(raw_array, player, leader, player_id, leader_id, target_id):
+    leader.CapturePosition(raw_array.get_agent(leader_id))
+    player.Capture(raw_array.get_agent(player_id))
+    return (leader.rotation_angle, leader.xy, leader.xyz,
+            player.login_number, player.energy_regen, player.max_energy,
+            player.energy, player.xy, player.xyz,
+            player.is_casting, player.casting_skill, player.hp,
+            player.is_alive, player.overcast, player.is_knocked_down,
+            player.is_attacking, player.is_moving, player.is_melee,
+            player.weapon_type,
+            player.HasAttribute(Attribute.FastCasting), player.GetAttributeLevel(Attribute.FastCasting),
+            player.HasAttribute(Attribute.Expertise), player.GetAttributeLevel(Attribute.Expertise),
+            IsLivingAgentAlive(raw_array.get_agent(target_id).living_agent))
+
+
+def main():
+    global benchmark_done
+    if benchmark_done:
+        return
+    benchmark_done = True
+
+    rng = random.Random(1)
+    agents = {agent_id: _StubAgent(agent_id, rng) for agent_id in range(1, 65)}
+    raw_array = _StubRawAgentArray(agents)
+    agent_cache = AgentCache(raw_array)
+    player, leader = AgentState(), AgentState()
+    ticks = [tuple(rng.sample(range(1, 65), 3)) for _ in range(TICKS)]
+
+    raw_array.fetches = 0
+    start = time.perf_counter()
+    previous = [_previous_reads(agent_cache, player_id, leader_id, target_id) for player_id, leader_id, target_id in ticks]
+    previous_ms = (time.perf_counter() - start) * 1000
+    previous_fetches = raw_array.fetches
+
+    raw_array.fetches = 0
+    start = time.perf_counter()
+    snapshot = [_snapshot_reads(raw_array, player, leader, player_id, leader_id, target_id) for player_id, leader_id, target_id in ticks]
+    snapshot_ms = (time.perf_counter() - start) * 1000
+    snapshot_fetches = raw_array.fetches
+
+    mismatches = sum(1 for a, b in zip(previous, snapshot) if a != b)
+    Py4GW.Console.Log(MODULE_NAME, f"{TICKS} ticks, {mismatches} mismatches", Py4GW.Console.MessageType.Info)
+    Py4GW.Console.Log(MODULE_NAME, f"Per-field calls: {previous_ms:.1f} ms, {previous_fetches / TICKS:.0f} agent fetches per tick", Py4GW.Console.MessageType.Info)
+    Py4GW.Console.Log(MODULE_NAME, f"AgentState:      {snapshot_ms:.1f} ms, {snapshot_fetches / TICKS:.0f} agent fetches per tick", Py4GW.Console.MessageType.Info)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import sys
+import time
+import importlib
+import tracemalloc
+import Py4GW
+
+MODULE_NAME = "Custom Skill Benchmark"
+RUNS = 5
+benchmark_done = False
+
+# Measures the cold import + construction cost of HeroAI.custom_skill.
+# Run it once on the current tree and once on a checkout from before the data-driven loader
+# to compare; only CustomSkillClass() and get_skill() are used so both implementations work.
+
+def _cold_load():
+    sys.modules.pop("HeroAI.custom_skill", None)
+    start = time.perf_counter()
+    module = importlib.import_module("HeroAI.custom_skill")
+    handler = module.CustomSkillClass()
+    return handler, (time.perf_counter() - start) * 1000
+
+
+def _reset_shared_definitions():
+    module = sys.modules.get("HeroAI.custom_skill")
+    if module is not None and hasattr(module.CustomSkillClass, "_records"):
+        module.CustomSkillClass._records = None
+
+
+def main():
+    global benchmark_done
+    if benchmark_done:
+        return
+    benchmark_done = True
+    
+    timings = []
+    for _ in range(RUNS):
+        _reset_shared_definitions()
+        _, elapsed = _cold_load()
+        timings.append(elapsed)
+
+    _reset_shared_definitions()
+    tracemalloc.start()
+    handler, _ = _cold_load()
+    construct_memory = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    for skill_id in range(handler.MaxSkillData):
+        handler.get_skill(skill_id)
+    touch_all = (time.perf_counter() - start) * 1000
+    full_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    Py4GW.Console.Log(MODULE_NAME, f"Cold import + construct: first {timings[0]:.1f} ms, best {min(timings):.1f} ms over {RUNS} runs", Py4GW.Console.MessageType.Info)
+    Py4GW.Console.Log(MODULE_NAME, f"Memory after construct: {construct_memory / 1024:.0f} KiB", Py4GW.Console.MessageType.Info)
+    Py4GW.Console.Log(MODULE_NAME, f"get_skill for every id: {touch_all:.1f} ms, memory {full_memory / 1024:.0f} KiB", Py4GW.Console.MessageType.Info)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+import os
+import json
+import time
+import random
+import tempfile
+import Py4GW
+import Py4GWCoreLib.UIManager as ui_module
+from Py4GWCoreLib.UIManager import UIManager
+
+MODULE_NAME = "Frame Index Benchmark"
+FRAME_COUNT = 4000
+ALIAS_COUNT = 1500
+LOOKUPS = 200
+benchmark_done = False
+
+# Compares label -> frame lookups of the previous implementation (parse the alias file, construct
+# the path of every frame through native UIFrame hops) with the frame index, on a synthetic frame
+# tree swapped in for PyUIManager while the benchmark runs.
+
+
+class _SyntheticFrame:
+    def __init__(self, frame_id, parent_id, child_offset_id, frame_hash):
+        self.frame_id = frame_id
+        self.parent_id = parent_id
+        self.child_offset_id = child_offset_id
+        self.frame_hash = frame_hash
+        self.is_visible = True
+        self.template_type = 0
+
+
+class _SyntheticUI:
+    """Stands in for the PyUIManager module: UIFrame(frame_id) and UIManager.get_frame_array()."""
+    def __init__(self, frame_count, seed=1):
+        rng = random.Random(seed)
+        self.frames = {0: _SyntheticFrame(0, 0, 0, 0)}
+        next_offset = {}
+        for fid in range(1, frame_count + 1):
+            parent = rng.randrange(max(1, fid - 50), fid) if fid > 1 else 0
+            offset = next_offset.get(parent, 0)
+            next_offset[parent] = offset + 1
+            frame_hash = rng.getrandbits(31) if fid == 1 or rng.random() < 0.02 else 0
+            self.frames[fid] = _SyntheticFrame(fid, parent, offset, frame_hash)
+        self.native_calls = 0
+        synthetic = self
+
+        class UIManagerNamespace:
+            @staticmethod
+            def get_frame_array():
+                synthetic.native_calls += 1
+                return list(range(1, frame_count + 1))
+
+        self.UIManager = UIManagerNamespace
+
+    def UIFrame(self, frame_id):
+        self.native_calls += 1
+        return self.frames[frame_id]
+
+
+def _previous_lookup(filename, frame_label):
+    with open(filename, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    target_path = next((path for path, alias in data.items() if alias == frame_label), None)
+    if not target_path:
+        return 0
+    for frame_id in UIManager.GetFrameArray():
+        if UIManager.ConstructFramePath(frame_id) == target_path:
+            return frame_id
+    return 0
+
+
+def main():
+    global benchmark_done
+    if benchmark_done:
+        return
+    benchmark_done = True
+
+    synthetic = _SyntheticUI(FRAME_COUNT)
+    original_module = ui_module.PyUIManager
+    ui_module.PyUIManager = synthetic
+    ui_module._frame_index.Invalidate()
+    filename = os.path.join(tempfile.gettempdir(), "frame_index_benchmark_aliases.json")
+    try:
+        rng = random.Random(2)
+        aliases = {}
+        for fid in rng.sample(range(1, FRAME_COUNT + 1), ALIAS_COUNT):
+            path = UIManager.ConstructFramePath(fid)
+            if path:
+                aliases.setdefault(path, f"Label{fid}")
+        with open(filename, "w", encoding="utf-8") as file:
+            json.dump(aliases, file, indent=4)
+        labels = rng.choices(list(aliases.values()), k=LOOKUPS)
+
+        synthetic.native_calls = 0
+        start = time.perf_counter()
+        previous = [_previous_lookup(filename, label) for label in labels]
+        previous_ms = (time.perf_counter() - start) * 1000
+        previous_calls = synthetic.native_calls
+
+        synthetic.native_calls = 0
+        start = time.perf_counter()
+        indexed = [UIManager.GetFrameIDByCustomLabel(filename, label) for label in labels]
+        indexed_ms = (time.perf_counter() - start) * 1000
+        indexed_calls = synthetic.native_calls
+    finally:
+        ui_module.PyUIManager = original_module
+        ui_module._frame_index.Invalidate()
+        ui_module._alias_files.pop(filename, None)
+        try:
+            os.remove(filename)
+        except OSError:
+            pass
+
+    mismatches = sum(1 for a, b in zip(previous, indexed) if a != b)
+    Py4GW.Console.Log(MODULE_NAME, f"{FRAME_COUNT} frames, {len(aliases)} aliases, {LOOKUPS} lookups, {mismatches} mismatches", Py4GW.Console.MessageType.Info)
+    Py4GW.Console.Log(MODULE_NAME, f"Previous: {previous_ms:.1f} ms, {previous_calls} native calls", Py4GW.Console.MessageType.Info)
+    Py4GW.Console.Log(MODULE_NAME, f"Indexed:  {indexed_ms:.1f} ms, {indexed_calls} native calls (includes the index build)", Py4GW.Console.MessageType.Info)
+
+
+if __name__ == "__main__":
+    main()
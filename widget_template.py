@@ -2,6 +2,11 @@ from Py4GWCoreLib import *
 
 MODULE_NAME = "tester for everything"
 
+# Optional widget meta. "skippable": True lets the widget manager's scheduler skip main() on some
+# frames (run interval, budget, frame budget). Leave it out when main() draws windows or overlays,
+# they would disappear on every skipped frame.
+# __widget__ = {"skippable": True}
+
 this_is_a_global_variable = False
 
 